@@ -11,15 +11,20 @@ const LotteryAnalysis = (() => {
    */
   function frequencyAnalysis(data, digitType) {
     const freq = {};
-
-    data.forEach(draw => {
-      draw.numbers.forEach(num => {
-        const digits = extractDigits(num, digitType);
-        digits.forEach(d => {
-          freq[d] = (freq[d] || 0) + 1;
+    const snap = digitType === 'pairs' || digitType === 'whole' ? null : snapshotState(data);
+
+    if (snap) {
+      snap.digits.forEach((count, d) => { if (count) freq[d] = count; });
+    } else {
+      data.forEach(draw => {
+        draw.numbers.forEach(num => {
+          const digits = extractDigits(num, digitType);
+          digits.forEach(d => {
+            freq[d] = (freq[d] || 0) + 1;
+          });
         });
       });
-    });
+    }
 
     // Sort by frequency
     const sorted = Object.entries(freq).sort((a, b) => b[1] - a[1]);
@@ -107,33 +112,49 @@ const LotteryAnalysis = (() => {
     const gaps = {};
     const currentGap = {};
     const avgGaps = {};
+    const snap = snapshotState(data);
+
+    if (snap && snap.full) {
+      snap.gapOrder.forEach(code => {
+        if (!snap.gapCount[code]) return;
+        const seen = snap.lastSeen[code];
+        avgGaps[pad2(code)] = {
+          avg: snap.gapSum[code] / snap.gapCount[code],
+          min: snap.gapMin[code],
+          max: snap.gapMax[code],
+          lastSeen: seen,
+          drawsSinceLastSeen: data.length - 1 - seen,
+          count: snap.gapCount[code]
+        };
+      });
+    } else {
+      // For each number, track when it appeared
+      data.forEach((draw, idx) => {
+        draw.numbers.forEach(num => {
+          const last2 = num.slice(-2);
+          if (!gaps[last2]) gaps[last2] = [];
+
+          if (currentGap[last2] !== undefined) {
+            gaps[last2].push(idx - currentGap[last2]);
+          }
+          currentGap[last2] = idx;
+        });
+      });
 
-    // For each number, track when it appeared
-    data.forEach((draw, idx) => {
-      draw.numbers.forEach(num => {
-        const last2 = num.slice(-2);
-        if (!gaps[last2]) gaps[last2] = [];
-        
-        if (currentGap[last2] !== undefined) {
-          gaps[last2].push(idx - currentGap[last2]);
+      // Calculate average gaps
+      Object.keys(gaps).forEach(num => {
+        if (gaps[num].length > 0) {
+          avgGaps[num] = {
+            avg: gaps[num].reduce((a, b) => a + b, 0) / gaps[num].length,
+            min: Math.min(...gaps[num]),
+            max: Math.max(...gaps[num]),
+            lastSeen: currentGap[num] || 0,
+            drawsSinceLastSeen: data.length - 1 - (currentGap[num] || 0),
+            count: gaps[num].length
+          };
         }
-        currentGap[last2] = idx;
       });
-    });
-
-    // Calculate average gaps
-    Object.keys(gaps).forEach(num => {
-      if (gaps[num].length > 0) {
-        avgGaps[num] = {
-          avg: gaps[num].reduce((a, b) => a + b, 0) / gaps[num].length,
-          min: Math.min(...gaps[num]),
-          max: Math.max(...gaps[num]),
-          lastSeen: currentGap[num] || 0,
-          drawsSinceLastSeen: data.length - 1 - (currentGap[num] || 0),
-          count: gaps[num].length
-        };
-      }
-    });
+    }
 
     // Find numbers that are "overdue" (gap > average)
     const overdue = Object.entries(avgGaps)
@@ -154,24 +175,30 @@ const LotteryAnalysis = (() => {
   function pairAnalysis(data) {
     const pairs = {};
     const digitPairs = {};
-
-    data.forEach(draw => {
-      draw.numbers.forEach(num => {
-        const digits = num.split('');
-        // consecutive digit pairs
-        for (let i = 0; i < digits.length - 1; i++) {
-          const pair = digits[i] + digits[i + 1];
-          digitPairs[pair] = (digitPairs[pair] || 0) + 1;
-        }
-        // all 2-digit combinations
-        for (let i = 0; i < digits.length; i++) {
-          for (let j = i + 1; j < digits.length; j++) {
-            const p = [digits[i], digits[j]].sort().join('');
-            pairs[p] = (pairs[p] || 0) + 1;
+    const snap = snapshotState(data);
+
+    if (snap && snap.full) {
+      snap.pairOrder.forEach(code => { digitPairs[pad2(code)] = snap.pairs[code]; });
+      snap.comboOrder.forEach(code => { pairs[pad2(code)] = snap.combos[code]; });
+    } else {
+      data.forEach(draw => {
+        draw.numbers.forEach(num => {
+          const digits = num.split('');
+          // consecutive digit pairs
+          for (let i = 0; i < digits.length - 1; i++) {
+            const pair = digits[i] + digits[i + 1];
+            digitPairs[pair] = (digitPairs[pair] || 0) + 1;
           }
-        }
+          // all 2-digit combinations
+          for (let i = 0; i < digits.length; i++) {
+            for (let j = i + 1; j < digits.length; j++) {
+              const p = [digits[i], digits[j]].sort().join('');
+              pairs[p] = (pairs[p] || 0) + 1;
+            }
+          }
+        });
       });
-    });
+    }
 
     const topPairs = Object.entries(digitPairs)
       .sort((a, b) => b[1] - a[1])
@@ -241,10 +268,14 @@ const LotteryAnalysis = (() => {
   function movingAverageAnalysis(data, window = 5) {
     const values = data.map(d => parseInt(d.numbers[0]));
     const ma = [];
+    // rolling sum จาก prefix sum ของ snapshot (ถ้ามี) แทนการรวม window ใหม่ทุกจุด
+    const snap = snapshotState(data);
+    const windowSum = snap
+      ? i => snap.valueCum[i + 1] - snap.valueCum[i + 1 - window]
+      : i => values.slice(i - window + 1, i + 1).reduce((a, b) => a + b, 0);
 
     for (let i = window - 1; i < values.length; i++) {
-      const slice = values.slice(i - window + 1, i + 1);
-      const avg = slice.reduce((a, b) => a + b, 0) / window;
+      const avg = windowSum(i) / window;
       ma.push({
         date: data[i].date,
         value: values[i],
@@ -390,6 +421,97 @@ const LotteryAnalysis = (() => {
     }
   }
 
+  // ========== Precomputed Snapshot (lotteryAnalysisSnapshot.js) ==========
+
+  const snapshotCache = new WeakMap();
+  const SNAPSHOT_VERSION = 2;  // ต้องตรงกับ SNAPSHOT_VERSION ใน scripts/analysis_snapshot.py
+  const pad2 = code => String(code).padStart(2, '0');
+
+  /**
+   * ถ้า data (เรียงเก่า → ใหม่) คือช่วงต่อเนื่องของ static data ตามด้วยงวด live ที่ใหม่กว่า
+   * คืนผลรวมจาก snapshot + งวด live (fold ทีละงวด) แทนการวนทุกเลขของทุกงวด — ไม่ตรงก็คืน null
+   * full = data เริ่มที่งวดแรกของ snapshot และครอบคลุมทั้ง static (ใช้ผลรวม pairs/gaps ได้)
+   */
+  function snapshotState(data) {
+    if (typeof LOTTERY_ANALYSIS_SNAPSHOT === 'undefined' || !data.length ||
+        LOTTERY_ANALYSIS_SNAPSHOT.version !== SNAPSHOT_VERSION) return null;
+    if (!snapshotCache.has(data)) {
+      const snapshot = LOTTERY_ANALYSIS_SNAPSHOT;
+      const start = snapshot.dates.indexOf(data[0].date);
+      let state = null;
+      if (start >= 0) {
+        for (const snap of Object.values(snapshot.kinds)) {
+          state = matchSnapshot(snapshot, snap, data, start);
+          if (state) break;
+        }
+      }
+      snapshotCache.set(data, state);
+    }
+    return snapshotCache.get(data);
+  }
+
+  function matchSnapshot(snapshot, snap, data, start) {
+    const end = Math.min(snapshot.n, start + data.length);
+    const valueCum = [0];
+    for (let i = start; i < end; i++) {
+      const draw = data[i - start];
+      if (draw.date !== snapshot.dates[i] || draw.numbers.length !== snap.k) return null;
+      // ทุกเลขของงวดต้องตรง — ผลที่ถูกแก้ภายหลัง (เช่น front3/back3 ตัวที่ 2) ทำให้ snapshot ใช้ไม่ได้
+      for (let j = 0; j < snap.k; j++) {
+        const num = draw.numbers[j];
+        if (num.length !== snap.width || parseInt(num, 10) !== snap.numbers[i * snap.k + j]) return null;
+      }
+      valueCum.push(valueCum[valueCum.length - 1] + snap.numbers[i * snap.k]);
+    }
+
+    const live = data.slice(end - start);
+    const clean = new RegExp(`^\\d{${snap.width}}$`);
+    const lastDate = snapshot.dates[snapshot.n - 1];
+    if (!live.every(d => d.date > lastDate && d.numbers.every(num => clean.test(num)))) return null;
+
+    const digits = [];
+    for (let d = 0; d < 10; d++) digits.push(snap.digitCum[end * 10 + d] - snap.digitCum[start * 10 + d]);
+    const full = start === 0 && end === snapshot.n;
+    const state = { full, digits, valueCum };
+    if (full) {
+      ['pairs', 'pairOrder', 'combos', 'comboOrder', 'lastSeen',
+       'gapSum', 'gapCount', 'gapMin', 'gapMax', 'gapOrder'].forEach(key => { state[key] = snap[key].slice(); });
+    }
+
+    const addCode = (counts, order, code) => {
+      if (state[counts][code] === 0) state[order].push(code);
+      state[counts][code]++;
+    };
+    live.forEach((draw, j) => {
+      const idx = end - start + j;
+      draw.numbers.forEach(num => {
+        const ds = num.split('').map(Number);
+        ds.forEach(x => { digits[x]++; });
+        if (!full) return;
+        for (let i = 0; i < ds.length - 1; i++) addCode('pairs', 'pairOrder', ds[i] * 10 + ds[i + 1]);
+        for (let i = 0; i < ds.length; i++) {
+          for (let k = i + 1; k < ds.length; k++) {
+            addCode('combos', 'comboOrder', Math.min(ds[i], ds[k]) * 10 + Math.max(ds[i], ds[k]));
+          }
+        }
+        const key = parseInt(num) % 100;
+        const seen = state.lastSeen[key];
+        if (seen < 0) {
+          state.gapOrder.push(key);
+        } else {
+          const gap = idx - seen;
+          state.gapMin[key] = state.gapCount[key] ? Math.min(state.gapMin[key], gap) : gap;
+          state.gapMax[key] = Math.max(state.gapMax[key], gap);
+          state.gapSum[key] += gap;
+          state.gapCount[key]++;
+        }
+        state.lastSeen[key] = idx;
+      });
+      valueCum.push(valueCum[valueCum.length - 1] + parseInt(draw.numbers[0]));
+    });
+    return state;
+  }
+
   // ========== Chart Data Generators ==========
 
   /**
@@ -397,15 +519,20 @@ const LotteryAnalysis = (() => {
    */
   function getFrequencyChartData(data, type) {
     const freq = {};
-    
-    data.forEach(draw => {
-      draw.numbers.forEach(num => {
-        const digits = num.split('');
-        digits.forEach(d => {
-          freq[d] = (freq[d] || 0) + 1;
+    const snap = snapshotState(data);
+
+    if (snap) {
+      snap.digits.forEach((count, d) => { if (count) freq[d] = count; });
+    } else {
+      data.forEach(draw => {
+        draw.numbers.forEach(num => {
+          const digits = num.split('');
+          digits.forEach(d => {
+            freq[d] = (freq[d] || 0) + 1;
+          });
         });
       });
-    });
+    }
 
     const labels = Object.keys(freq).sort();
     const values = labels.map(l => freq[l]);
@@ -0,0 +1,6 @@
+/** Precomputed analysis snapshot — 121 draws (2021-02-16 to 2026-02-16)
+ * สร้างจาก lotteryStaticData.js ชุดเดียวกัน — generate ใหม่ทุกครั้งที่ static data เปลี่ยน
+ * Script: scripts/analysis_snapshot.py
+ */
+
+const LOTTERY_ANALYSIS_SNAPSHOT = {"version":2,"n":121,"dates":["2021-02-16","2021-03-01","2021-03-16","2021-04-01","2021-04-16","2021-05-02","2021-05-16","2021-06-01","2021-06-16","2021-07-01","2021-07-16","2021-08-01","2021-08-16","2021-09-01","2021-09-16","2021-10-01","2021-10-16","2021-11-01","2021-11-16","2021-12-01","2021-12-16","2021-12-30","2022-01-17","2022-02-01","2022-02-17","2022-03-01","2022-03-16","2022-04-01","2022-04-16","2022-05-02","2022-05-16","2022-06-01","2022-06-16","2022-07-01","2022-07-16","2022-08-01","2022-08-16","2022-09-01","2022-09-16","2022-10-01","2022-10-16","2022-11-01","2022-11-16","2022-12-01","2022-12-16","2022-12-30","2023-01-17","2023-02-01","2023-02-16","2023-03-01","2023-03-16","2023-04-01","2023-04-16","2023-05-02","2023-05-16","2023-06-01","2023-06-16","2023-07-01","2023-07-16","2023-07-31","2023-08-16","2023-09-01","2023-09-16","2023-10-01","2023-10-16","2023-11-01","2023-11-16","2023-12-01","2023-12-16","2023-12-30","2024-01-17","2024-02-01","2024-02-16","2024-03-01","2024-03-16","2024-04-01","2024-04-16","2024-05-02","2024-05-16","2024-06-01","2024-06-16","2024-07-01","2024-07-16","2024-08-01","2024-08-16","2024-09-01","2024-09-16","2024-10-01","2024-10-16","2024-11-01","2024-11-16","2024-12-01","2024-12-16","2025-01-02","2025-01-17","2025-02-01","2025-02-16","2025-03-01","2025-03-16","2025-04-01","2025-04-16","2025-05-02","2025-05-16","2025-06-01","2025-06-16","2025-07-01","2025-07-16","2025-08-01","2025-08-16","2025-09-01","2025-09-16","2025-10-01","2025-10-16","2025-11-01","2025-11-16","2025-12-01","2025-12-16","2026-01-02","2026-01-17","2026-02-01","2026-02-16"],"kinds":{"first":{"width":6,"k":1,"digitCum":[0,0,0,0,0,0,0,0,0,0,1,0,1,1,2,0,1,0,0,0,1,0,1,3,2,2,1,0,2,0,2,0,3,3,3,2,1,0,3,1,3,0,5,3,4,2,1,2,3,1,5,1,5,3,4,2,1,4,4,1,6,2,7,3,4,3,1,5,4,1,6,2,7,3,5,4,2,6,5,2,6,2,10,3,5,4,2,7,5,4,6,4,10,3,5,4,4,7,6,5,6,6,10,4,5,5,4,9,6,5,6,6,11,4,5,8,5,10,6,5,7,8,12,4,5,8,6,10,6,6,9,8,12,4,6,9,7,11,6,6,9,10,12,4,8,10,7,12,6,6,11,10,12,5,8,11,7,13,6,7,11,12,12,5,8,12,7,15,7,7,11,12,13,7,8,12,8,16,8,7,13,12,13,8,9,13,8,17,8,7,14,13,14,9,9,13,9,18,8,7,15,13,15,9,9,14,9,20,9,7,15,13,16,11,9,15,10,20,9,8,16,14,16,11,9,15,11,20,11,9,17,15,16,11,9,16,11,20,13,10,18,15,16,12,11,16,11,20,14,11,19,15,16,12,11,17,11,21,15,13,21,16,16,12,11,18,12,21,15,14,21,16,16,13,11,18,13,24,16,14,22,17,16,13,11,18,14,25,17,15,22,18,16,14,11,19,14,25,17,18,22,18,17,14,12,20,16,25,18,18,23,20,18,14,12,22,16,25,18,18,23,22,18,15,12,22,17,25,18,20,24,23,18,16,12,22,18,26,19,20,24,25,18,16,13,22,18,27,20,21,26,25,19,16,14,23,19,27,20,21,26,25,19,17,16,24,20,27,20,22,26,26,19,20,16,25,20,27,21,22,26,26,21,22,16,25,20,27,21,24,27,26,21,24,17,25,20,28,21,25,27,26,21,24,19,25,22,28,22,26,28,28,21,25,19,25,24,28,22,26,29,30,21,26,19,25,25,28,22,27,29,32,22,26,19,25,25,29,23,28,30,32,22,27,19,27,25,30,24,28,31,32,22,28,20,28,25,30,25,29,31,34,22,28,20,29,26,31,25,30,31,36,23,28,20,30,26,31,26,31,31,38,24,28,21,30,26,32,26,32,32,39,24,28,22,31,26,33,26,33,32,40,25,28,23,32,27,34,26,33,33,40,26,29,23,33,27,35,27,33,35,40,26,29,23,33,27,37,28,34,36,40,26,29,24,33,28,37,29,36,37,41,26,30,25,33,28,37,30,37,38,42,27,32,25,33,28,37,30,38,38,43,30,32,25,34,28,38,30,38,38,43,32,32,26,34,29,39,31,38,39,43,34,32,26,35,30,39,31,39,40,44,34,33,26,36,31,39,31,40,41,44,35,34,27,37,32,39,31,40,41,45,36,34,28,37,32,41,32,40,41,46,36,34,29,38,32,42,33,41,42,47,38,35,29,38,32,42,34,41,43,47,41,35,29,38,32,44,34,41,43,48,41,36,31,38,33,44,34,42,43,49,41,37,32,39,33,45,34,43,44,49,41,37,32,41,33,46,34,45,45,50,42,37,32,42,33,47,34,46,45,50,42,38,32,44,34,49,34,46,45,50,43,38,34,46,35,49,34,46,46,51,43,38,34,47,35,50,34,48,48,51,43,39,34,47,37,51,34,48,48,52,43,40,35,48,37,51,34,50,49,52,44,42,35,49,38,51,34,50,49,52,45,42,35,49,40,52,34,52,50,53,45,43,36,49,40,52,36,52,50,53,45,44,37,50,40,52,37,54,51,55,45,44,37,50,41,52,38,55,53,55,46,44,37,51,42,52,38,56,54,55,46,46,37,53,42,52,38,57,55,56,46,46,38,55,42,52,39,57,56,56,46,48,40,56,42,52,39,57,56,56,46,51,40,56,44,53,39,57,58,57,46,51,42,56,44,54,39,57,59,57,46,51,42,57,45,55,40,58,60,58,46,51,42,57,47,55,40,60,61,58,47,51,42,57,50,55,41,60,61,59,47,51,42,58,52,56,42,60,61,59,49,51,43,58,53,56,43,61,62,59,49,52,45,59,54,56,43,61,62,61,51,52,45,59,54,57,44,61,62,61,51,53,46,59,56,57,45,62,63,61,51,54,46,59,57,58,46,63,65,61,52,55,46,59,57,59,46,64,66,61,52,55,46,59,57,62,47,65,68,61,52,55,46,61,57,63,48,65,68,61,52,56,47,61,57,66,49,65,68,62,52,56,48,61,57,66,52,66,68,62,52,57,48,63,58,68,52,66,68,62,52,57,48,63,61,69,53,67,68,62,55,57,48,63,63,70,53,67,68,63,56,59,48,63,63,70,55,67,69,64,57,60,48,64,63,70,55,68,69,64,58,61,48,67,63,70,55,69,70,64,59,62,48,68,63,71,55,70,70,64,60,62,50,68,64,71,55,72,70,64,62,63,52,69,64,71,55,72,70,66,63,63,52,70,64,71,57,72,70,66,63,63,53,71,65,71,58,74,71,66,63,64,53,73,67,71,58,74,72,66,63,64,55,73,69,72,58,74,72,66,63,64,55,73,70,74,60,75,73,66,63,64,55,74,72,74,60,77,73,66,63,65,56,75,72,74,62,78,73,67,63,65,58,77,72,74,63,78,73,68,65,65,59,78,73,74,63,78,73,68,65,66,59,79,74,75,64,79,74,68,65,67,59,79,75,77,65,79,74,68,66,67,59,79,75,79,67,80,74,69,67,67,60,79,76,80,67,81,75,69,67,69,61,80,77,80,67,81],"numbers":[424603,835538,890422,472270,100787,501272,684579,292972,691861,713517,556725,910261,46750,114475,70935,578171,386372,45037,32761,77258,639235,819068,880159,944308,98597,61905,737867,970618,395919,658642,155012,319196,361807,981417,620405,436594,331583,929332,943703,484669,613106,913106,121789,375805,845093,157196,812519,297411,590417,417652,25873,87907,984906,843019,132903,125272,264872,922605,169530,260453,471782,915478,320812,727202,931446,743951,557990,251097,356757,625544,105979,607063,941395,253603,997626,803481,943598,980116,205690,530593,518504,434503,367336,407041,95867,199606,608662,718665,482962,536044,187221,669843,97863,730209,807779,558700,847377,818894,757563,669687,266227,213388,251309,559352,507392,949246,245324,811852,994865,506356,74646,876978,59696,345898,458145,461252,763895,837706,878972,174629,340563],"pairs":[2,5,4,8,9,9,10,10,4,8,6,4,7,7,4,5,2,8,8,9,5,3,5,1,4,10,6,6,0,7,6,5,5,4,4,8,6,7,4,5,3,6,3,8,5,9,9,5,5,2,9,6,5,7,2,7,6,6,9,10,8,8,7,8,3,5,6,6,3,8,8,5,12,6,4,6,5,5,9,5,6,9,2,3,7,3,9,9,3,6,9,6,6,6,8,6,7,10,7,4],"pairOrder":[42,24,46,60,3,83,35,55,53,38,89,90,4,22,47,72,27,70,10,0,7,78,87,50,1,12,68,84,45,57,79,29,92,97,69,91,18,86,61,71,13,51,17,56,67,25,2,26,75,11,14,44,9,93,81,63,37,32,76,77,58,39,23,19,6,88,80,15,59,94,43,30,8,98,85,5,73,95,65,64,31,96,36,41,62,20,40,33,48,66,21,74,52,49,16,82,54,99,34],"combos":[12,33,32,40,31,48,43,49,31,44,0,17,33,26,26,37,32,38,40,46,0,0,23,26,27,35,35,43,24,34,0,0,0,17,31,48,38,33,31,38,0,0,0,0,14,37,36,25,29,35,0,0,0,0,0,18,38,43,33,45,0,0,0,0,0,0,20,40,34,49,0,0,0,0,0,0,0,22,47,38,0,0,0,0,0,0,0,0,12,42,0,0,0,0,0,0,0,0,0,17],"comboOrder":[24,44,46,4,34,26,2,23,6,36,3,38,58,88,35,33,55,89,8,48,28,9,49,29,22,47,27,77,7,1,17,18,0,78,5,15,25,57,12,68,56,67,69,45,59,79,99,16,66,19,11,37,13,14,39],"lastSeen":[95,-1,63,81,80,57,117,51,23,102,-1,47,62,-1,-1,-1,77,48,27,53,-1,90,2,-1,106,10,74,100,-1,119,58,-1,37,-1,-1,20,82,17,1,-1,-1,83,29,91,89,114,110,-1,-1,-1,12,65,115,59,-1,-1,109,68,19,22,-1,18,88,120,-1,108,-1,84,21,39,3,15,118,50,-1,13,-1,96,111,94,-1,75,60,36,-1,-1,-1,99,101,42,78,-1,104,79,97,116,112,67,113,-1],"gapSum":[0,0,0,81,0,32,77,19,0,9,0,0,32,0,0,0,0,39,0,25,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,6,0,0,0,0,0,0,0,0,20,0,46,0,0,0,0,0,66,0,0,0,0,0,0,0,0,10,2,49,0,21,0,58,0,0,0,0,113,0,0,0,0,0,50,88,0,0,0,0,0,0,0,95,0,0,12,0,0,35,62,44,81,43,37,0],"gapCount":[0,0,0,4,0,3,4,1,0,1,0,0,1,0,0,0,0,2,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,1,0,2,0,0,0,0,0,3,0,0,0,0,0,0,0,0,2,1,3,0,1,0,1,0,0,0,0,5,0,0,0,0,0,1,2,0,0,0,0,0,0,0,1,0,0,1,0,0,1,1,1,2,1,1,0],"gapMin":[0,0,0,8,0,9,1,19,0,9,0,0,32,0,0,0,0,15,0,7,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,6,0,0,0,0,0,0,0,0,20,0,5,0,0,0,0,0,4,0,0,0,0,0,0,0,0,3,2,6,0,21,0,58,0,0,0,0,1,0,0,0,0,0,50,24,0,0,0,0,0,0,0,95,0,0,12,0,0,35,62,44,14,43,37,0],"gapMax":[0,0,0,38,0,14,33,19,0,9,0,0,32,0,0,0,0,24,0,18,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,6,0,0,0,0,0,0,0,0,20,0,41,0,0,0,0,0,54,0,0,0,0,0,0,0,0,7,2,22,0,21,0,58,0,0,0,0,62,0,0,0,0,0,50,64,0,0,0,0,0,0,0,95,0,0,12,0,0,35,62,44,67,43,37,0],"gapOrder":[3,38,22,70,87,72,79,61,17,25,50,75,35,71,37,58,68,59,8,97,5,67,18,19,42,12,96,7,94,83,32,69,6,89,93,11,52,73,30,53,82,78,2,46,51,90,57,44,63,95,26,81,98,16,4,36,41,62,65,21,43,9,0,77,27,88,92,24,56,45,29]},"last2":{"width":2,"k":1,"digitCum":[0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,0,0,0,2,0,0,0,1,0,1,0,1,0,2,0,0,0,1,0,2,1,1,0,2,0,1,0,1,0,2,1,1,0,2,0,2,1,1,0,2,1,2,0,2,0,2,1,1,1,2,1,3,0,2,1,2,1,1,1,2,1,3,0,2,2,3,1,1,1,2,1,4,0,2,2,3,1,2,1,2,1,4,1,2,2,3,1,2,1,3,2,4,1,2,2,3,1,3,1,3,2,4,1,2,2,3,2,3,1,4,2,4,2,3,2,3,2,3,1,4,2,4,2,3,2,3,2,4,1,5,3,4,2,3,2,3,2,4,1,6,3,4,2,4,2,3,2,4,2,6,3,4,2,5,2,3,2,4,3,6,3,4,2,5,2,4,2,4,3,7,3,4,2,5,2,5,2,5,3,7,3,4,3,5,2,5,2,5,4,7,3,4,3,6,2,5,2,5,5,7,3,4,3,7,2,5,3,5,5,7,3,4,4,7,2,5,3,5,5,8,4,4,4,8,2,5,3,5,5,8,4,4,4,8,2,6,3,6,5,8,5,4,4,8,2,6,3,7,5,8,6,4,4,9,2,6,3,7,5,8,7,5,4,9,2,6,3,7,5,8,7,5,4,9,2,7,3,7,6,8,8,5,4,9,2,7,3,7,6,9,9,5,4,9,2,7,4,7,6,9,10,5,5,9,2,7,4,7,6,9,10,5,6,9,2,7,4,7,6,10,10,6,6,9,2,7,5,7,6,10,10,6,6,10,2,8,5,7,6,10,10,7,6,10,3,8,5,7,6,10,10,7,7,10,4,8,5,7,6,10,10,7,7,11,4,8,5,7,7,10,10,7,7,11,4,9,5,8,7,10,11,7,7,11,4,10,5,8,7,10,11,8,7,11,4,11,5,8,7,10,12,8,7,11,4,11,5,9,7,10,12,8,7,11,5,11,6,9,7,10,13,8,7,11,5,11,6,9,8,10,13,9,7,11,6,11,6,9,8,10,13,9,7,11,6,12,6,9,9,10,13,9,7,11,7,12,6,10,9,10,13,9,8,11,7,12,6,10,9,11,14,9,8,11,7,12,6,10,10,11,14,9,8,11,7,14,6,10,10,11,14,9,8,12,7,14,6,11,10,11,14,9,8,12,7,14,6,11,10,13,14,10,8,12,7,14,6,12,10,13,14,10,8,12,7,15,7,12,10,13,14,10,8,12,7,15,7,12,10,15,15,10,8,12,7,15,7,12,10,16,16,10,8,13,7,15,7,12,10,16,16,11,8,13,7,15,8,12,10,16,16,11,9,13,7,15,9,12,10,16,16,13,9,13,7,15,9,12,10,16,16,13,9,13,7,15,10,13,10,16,16,14,9,13,7,15,10,13,10,17,16,14,9,13,8,15,11,13,10,17,16,14,9,13,8,15,13,13,10,17,16,14,9,13,10,15,13,13,10,17,16,14,9,14,10,15,14,13,10,17,16,15,9,14,11,15,14,13,10,17,16,16,9,14,11,15,14,13,10,18,16,16,9,14,11,16,14,13,11,18,16,16,9,14,11,16,14,13,12,19,16,17,9,14,11,16,15,13,12,19,17,17,9,14,11,16,15,13,12,20,17,17,9,15,12,16,15,13,12,20,17,17,9,15,12,16,15,14,12,21,17,17,9,15,12,16,15,15,13,21,18,17,9,15,12,16,15,15,13,22,18,17,9,15,12,16,15,16,13,23,18,18,9,15,12,16,15,17,13,23,19,18,9,15,12,16,16,17,13,23,19,18,10,15,13,16,16,17,13,23,19,19,10,16,13,16,16,17,13,23,19,19,10,16,13,16,16,17,14,24,19,20,11,16,13,16,16,17,14,24,19,20,11,16,14,16,17,17,14,24,19,20,12,16,14,16,17,17,15,24,19,20,12,16,15,16,17,17,15,25,19,20,12,17,15,16,17,18,15,25,19,20,12,17,15,17,17,18,15,26,21,20,12,17,15,17,17,18,15,26,21,20,13,18,15,17,17,18,15,26,21,20,13,19,15,17,17,18,16,26,21,21,13,19,15,17,18,18,16,26,21,22,14,19,15,17,18,18,16,26,21,23,14,19,15,18,18,18,16,26,21,23,15,20,15,18,18,18,16,26,21,24,15,20,15,19,18,18,16,26,22,24,15,20,15,20,18,18,16,26,22,24,15,20,16,21,18,18,16,26,22,24,16,21,16,21,18,18,16,26,22,24,16,22,16,21,19,18,16,26,22,24,16,22,16,22,19,18,17,26,23,24,16,22,16,22,20,18,17,26,23,24,16,22,16,22,20,19,18,26,24,24,17,22,16,22,20,19,18,26,25,24,17,22,16,22,21,19,18,26,25,25,17,22,16,22,21,19,18,27,25,25,18,22,16,22,22,19,18,27,26,25,18,22,16,23,22,19,18,27,26,25,18,23,16,23,23,19,18,27,26,26,18,24,16,23,23,19,18,27,26,26,18,24,16,24,23,19,19,27,26,26,18,24,16,24,23,21,19,27,26,27,18,24,16,24,24,21,19,27,26,27,18,24,16,24,24,22,20,27,26,27,18,25,16,24,24,23,20,27,26,27,20,25,16,24,24,23,20,27,26,27,21,25,16,25,24,23,20,27,26,28,21,25,16,25,25,23,20,27,27,28,22,25,16,25,25,23,20,27,27,28,22,25,17,25,25,23,21,27,28,28,22,25,17,25,25,24,21,27],"numbers":[39,73,19,5,56,18,14,45,17,29,70,69,23,79,90,83,38,95,57,82,83,36,92,30,57,7,3,10,58,9,6,2,92,61,53,14,42,83,75,50,15,70,64,8,14,58,47,92,80,55,73,99,71,65,99,9,30,16,62,11,67,91,46,66,44,63,14,91,85,89,61,9,43,79,78,90,79,17,60,42,31,89,21,46,28,94,37,59,0,32,38,61,21,51,23,51,50,54,32,36,85,6,87,20,6,91,26,50,63,31,58,77,61,87,37,22,52,16,2,48,7],"pairs":[1,0,2,1,0,1,3,2,1,3,1,1,0,0,4,1,2,2,1,1,1,2,1,2,0,0,1,0,1,1,2,2,2,0,0,0,2,2,2,1,0,0,2,1,1,1,2,1,1,0,3,2,1,1,1,1,1,2,3,1,1,4,1,2,1,1,1,1,0,1,2,1,0,2,0,1,0,1,1,3,1,0,1,3,0,2,0,2,0,2,2,3,3,0,1,1,0,0,0,2],"pairOrder":[39,73,19,5,56,18,14,45,17,29,70,69,23,79,90,83,38,95,57,82,36,92,30,7,3,10,58,9,6,2,61,53,42,75,50,15,64,8,47,80,55,99,71,65,16,62,11,67,91,46,66,44,63,85,89,43,78,60,31,21,28,94,37,59,0,32,51,54,87,20,26,77,22,52,48],"combos":[1,1,3,3,0,4,4,4,2,5,0,1,2,2,4,3,6,3,1,4,0,0,1,4,2,1,2,0,2,4,0,0,0,0,1,1,4,4,5,1,0,0,0,0,1,2,3,1,1,1,0,0,0,0,0,1,2,3,5,2,0,0,0,0,0,0,1,1,0,1,0,0,0,0,0,0,0,1,3,3,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,2],"comboOrder":[39,37,19,5,56,18,14,45,17,29,7,69,23,79,9,38,59,57,28,36,3,1,58,6,2,16,35,24,15,46,8,47,55,99,26,11,67,66,44,89,34,78,13,12,49,0,77,22,25,48],"lastSeen":[88,-1,118,26,-1,3,104,120,43,71,27,59,-1,-1,66,40,117,77,5,2,103,92,115,94,-1,-1,106,-1,84,9,56,109,98,-1,-1,-1,99,114,90,0,-1,-1,79,72,64,7,83,46,119,-1,107,95,116,34,97,49,4,24,110,87,78,112,58,108,42,53,63,60,-1,11,41,52,-1,50,-1,38,-1,111,74,76,48,-1,19,37,-1,100,-1,113,-1,81,75,105,47,-1,85,17,-1,-1,-1,54],"gapSum":[0,0,87,0,0,0,74,95,0,42,0,0,0,0,60,0,60,69,0,0,0,10,0,82,0,0,0,0,0,0,33,29,9,0,0,0,78,28,74,0,0,0,43,0,0,0,21,0,0,0,68,2,0,0,0,0,0,6,82,0,0,79,0,43,0,0,0,0,0,0,31,0,0,49,0,0,0,0,0,63,0,0,0,22,0,32,0,11,0,12,61,44,25,0,0,0,0,0,0,3],"gapCount":[0,0,1,0,0,0,2,1,0,2,0,0,0,0,3,0,1,1,0,0,0,1,0,1,0,0,0,0,0,0,1,1,1,0,0,0,1,1,1,0,0,0,1,0,0,0,1,0,0,0,2,1,0,0,0,0,0,1,2,0,0,3,0,1,0,0,0,0,0,0,1,0,0,1,0,0,0,0,0,2,0,0,0,2,0,1,0,1,0,1,1,2,2,0,0,0,0,0,0,1],"gapMin":[0,0,87,0,0,0,3,95,0,16,0,0,0,0,9,0,60,69,0,0,0,10,0,82,0,0,0,0,0,0,33,29,9,0,0,0,78,28,74,0,0,0,43,0,0,0,21,0,0,0,11,2,0,0,0,0,0,6,17,0,0,21,0,43,0,0,0,0,0,0,31,0,0,49,0,0,0,0,0,3,0,0,0,5,0,32,0,11,0,12,61,6,10,0,0,0,0,0,0,3],"gapMax":[0,0,87,0,0,0,71,95,0,26,0,0,0,0,29,0,60,69,0,0,0,10,0,82,0,0,0,0,0,0,33,29,9,0,0,0,78,28,74,0,0,0,43,0,0,0,21,0,0,0,57,2,0,0,0,0,0,6,65,0,0,37,0,43,0,0,0,0,0,0,31,0,0,49,0,0,0,0,0,60,0,0,0,17,0,32,0,11,0,12,61,38,15,0,0,0,0,0,0,3],"gapOrder":[39,73,19,5,56,18,14,45,17,29,70,69,23,79,90,83,38,95,57,82,36,92,30,7,3,10,58,9,6,2,61,53,42,75,50,15,64,8,47,80,55,99,71,65,16,62,11,67,91,46,66,44,63,85,89,43,78,60,31,21,28,94,37,59,0,32,51,54,87,20,26,77,22,52,48]},"front3":{"width":3,"k":2,"digitCum":[0,0,0,0,0,0,0,0,0,0,0,2,0,1,0,0,1,0,2,0,1,2,1,2,0,0,1,0,4,1,3,2,2,3,0,0,2,0,4,2,3,2,3,4,0,2,2,1,5,2,4,4,3,6,1,2,2,1,5,2,6,5,3,7,1,2,3,1,6,2,6,6,3,8,2,3,4,1,7,2,7,7,4,9,2,3,5,1,7,3,10,7,4,9,3,4,5,2,7,3,11,7,4,10,4,4,5,4,7,4,12,8,4,10,5,5,5,5,8,4,14,9,4,12,5,5,5,6,8,4,14,10,5,12,6,5,8,6,8,4,15,10,7,13,6,5,8,7,9,4,16,11,7,13,6,5,9,8,10,5,16,12,8,14,6,6,10,8,11,5,17,12,9,14,7,6,12,8,11,6,17,12,10,14,9,7,12,9,12,6,17,13,10,14,11,7,13,10,13,6,18,13,10,15,12,7,13,12,13,7,19,13,11,15,12,7,14,13,13,9,19,14,11,15,12,8,14,14,13,12,19,15,11,16,12,8,15,16,14,12,20,16,12,16,13,8,16,16,14,13,21,16,12,16,15,9,17,16,15,13,21,16,13,18,16,9,18,16,16,13,21,16,13,19,17,10,18,16,17,15,21,17,13,21,17,10,18,17,18,16,21,17,14,21,17,11,18,17,20,18,21,18,14,21,17,12,18,19,22,18,21,18,15,22,18,12,19,21,22,18,21,19,15,22,18,12,20,23,23,19,21,19,16,22,19,14,20,23,24,20,21,19,19,22,20,14,20,24,25,20,21,20,19,23,21,15,20,24,26,21,21,20,20,24,21,15,22,24,27,22,23,21,21,25,21,15,22,25,27,22,23,21,23,25,21,16,22,26,28,23,24,22,23,25,22,17,22,27,28,24,25,22,24,25,22,17,24,27,28,26,26,23,24,26,22,18,24,28,29,26,26,23,26,27,22,18,24,29,30,27,26,23,29,28,22,19,24,30,30,27,27,24,29,28,22,19,25,32,31,27,27,27,30,28,23,19,25,32,31,28,29,27,32,28,23,20,25,33,31,28,29,27,32,30,25,20,25,33,32,29,29,29,32,30,25,20,25,34,34,30,29,30,32,30,26,21,27,34,34,31,29,31,32,30,26,22,27,36,34,33,32,31,33,30,27,22,27,36,35,33,32,35,33,30,28,22,27,36,35,34,33,35,33,30,28,22,29,38,36,34,36,35,33,30,28,23,29,39,37,34,36,35,33,31,28,23,30,41,38,35,39,36,33,31,28,23,31,41,39,35,39,37,34,31,28,24,32,41,40,36,39,38,35,31,28,24,33,42,42,36,39,39,36,32,29,24,34,42,43,36,40,39,37,32,29,24,35,43,45,36,40,40,37,34,30,24,35,44,45,37,40,41,38,34,30,26,36,44,45,38,41,41,38,35,30,26,37,45,45,40,41,41,39,37,31,28,37,45,45,40,41,42,39,38,31,28,38,46,46,41,41,43,39,41,31,29,38,46,46,42,41,44,40,42,33,29,39,46,46,42,42,44,41,42,33,32,40,46,46,42,44,45,41,42,34,33,40,46,47,42,46,45,41,42,35,33,42,46,48,42,46,46,42,43,36,33,42,46,48,44,46,46,42,44,39,34,42,46,48,45,48,46,42,46,39,35,43,46,48,45,50,46,42,46,39,36,43,47,48,47,51,47,42,46,39,38,43,48,48,48,52,48,44,46,39,38,43,48,49,49,52,48,46,46,39,38,43,51,49,50,53,49,46,47,40,38,44,52,49,50,53,49,46,47,41,39,44,54,51,50,53,50,46,48,43,39,45,54,51,51,54,51,47,48,44,39,46,54,52,51,54,51,47,49,44,40,46,55,53,53,55,54,47,51,44,40,46,55,53,53,56,54,47,51,45,41,46,56,54,54,56,55,49,53,46,41,46,56,54,54,57,56,51,54,46,41,46,57,54,54,59,56,52,55,47,41,46,57,54,55,60,57,53,56,47,42,46,57,55,55,60,58,53,56,48,43,48,57,56,55,60,59,55,56,49,44,48,58,56,55,61,59,56,58,49,44,49,58,56,56,61,59,57,58,49,46,51,58,56,57,62,59,59,58,50,46,51,59,56,58,63,59,59,58,52,47,53,59,56,58,63,60,59,58,52,47,55,59,56,61,63,61,60,58,53,48,55,59,58,61,63,62,61,59,53,48,57,59,59,61,64,63,61,61,53,49,57,59,59,62,64,63,62,61,53,51,57,60,59,64,65,63,62,62,53,52,59,61,59,64,65,64,63,63,55,53,59,61,59,64,65,66,64,63,55,53,61,61,60,64,66,68,65,64,55,53,61,61,60,65,66,69,65,66,57,53,61,61,60,66,67,70,66,67,58,53,61,62,60,66,68,71,66,67,58,53,63,62,61,67,68,73,66,67,58,54,63,63,61,69,68,74,68,67,59,56,63,63,61,69,69,74,70,67,60,56,64,64,61,69,70,77,71,68,60,56,64,64,61,69,71,78,72,68,61,57,64,65,61,69,71,78,73,70,62,58,64,65,62,69,71,79,73,71,62,61,64,65,62,70,71,79,74,72,64,61,64,65,63,71,72,79,77,72,65,61,65,65,63,71,72,79,77,73,65,63,66,65,64,72,72,81,77,74,66,63,67,66,64,72,72,81,77,75,68,63,68,67,64,73,72,82,78,75,68,64,68,67,65,75,72,84,78,75,68,65,68,68,65,77,72,85,80,75,69,66,68,69,65,77],"numbers":[861,318,290,838,36,902,755,283,13,143,306,18,615,843,620,193,54,7,794,73,58,174,103,307,421,666,278,302,609,817,285,361,602,964,247,458,648,471,739,740,97,629,591,979,731,786,942,61,85,644,236,834,349,985,738,391,289,859,778,518,247,736,679,817,549,285,287,242,159,834,893,266,271,300,298,725,971,540,206,996,37,158,722,839,722,532,170,786,912,411,7,522,389,443,181,789,195,664,577,919,420,800,111,914,670,678,500,780,739,678,0,681,519,628,281,867,261,384,268,708,431,739,521,596,37,699,355,324,167,398,335,913,346,412,55,265,58,410,600,648,429,931,454,943,56,330,900,975,571,509,122,809,729,727,104,763,885,747,194,364,16,428,839,975,11,331,408,579,212,334,173,220,230,904,53,812,561,648,174,225,36,923,559,626,290,742,446,65,699,961,285,418,268,613,139,530,595,927,635,760,413,254,826,116,109,231,349,134,243,17,680,169,995,171,142,525,247,602,131,12,512,740,843,532,531,955,449,328,242,602,655,389,431,176,347,694,299,815,917,195,527,241],"pairs":[9,6,5,5,2,6,4,4,3,5,4,5,7,7,3,4,4,10,5,6,4,3,6,4,8,4,7,5,10,7,7,9,4,4,8,3,6,2,5,8,4,6,9,8,4,2,2,6,3,4,2,3,4,5,5,6,2,3,4,6,6,8,4,2,7,3,4,6,4,4,3,5,5,8,6,3,3,2,8,4,4,7,1,6,3,7,4,1,1,5,5,7,2,3,5,5,4,5,3,5],"pairOrder":[86,61,31,18,29,90,83,38,3,36,2,75,55,28,1,13,14,43,30,6,15,84,62,20,19,93,5,54,0,7,79,94,73,58,17,74,10,42,21,66,27,78,60,9,81,85,96,64,24,47,45,48,71,39,40,97,59,91,8,44,23,34,49,98,89,77,51,67,87,26,72,25,99,37,22,53,32,70,12,41,11,52,95,57,80,50,68,69,35,16,33,46,65,56,4,76,63,88,92,82],"combos":[10,13,14,17,9,14,18,17,11,11,0,9,17,23,19,14,15,17,14,20,0,0,9,11,19,17,17,17,16,14,0,0,0,4,22,10,11,13,17,18,0,0,0,0,5,7,13,13,12,14,0,0,0,0,0,8,9,10,14,21,0,0,0,0,0,0,6,12,15,14,0,0,0,0,0,0,0,4,15,16,0,0,0,0,0,0,0,0,2,12,0,0,0,0,0,0,0,0,0,7],"comboOrder":[68,18,16,13,38,29,2,9,88,3,6,36,57,55,28,23,1,14,34,8,56,15,48,26,19,39,5,4,45,0,7,79,47,49,37,58,17,24,12,66,27,78,69,25,46,59,99,67,44,89,77,22,35,11,33],"lastSeen":[73,-1,114,11,86,-1,39,45,83,102,68,82,110,100,51,118,101,119,95,56,85,61,75,90,63,107,101,120,113,76,97,116,111,-1,103,99,90,62,27,97,110,120,114,111,24,-1,93,117,88,113,-1,-1,-1,87,100,115,72,-1,68,91,99,94,-1,77,79,93,35,64,96,105,52,106,-1,85,89,81,116,49,54,83,105,57,-1,3,58,95,43,33,-1,115,92,27,-1,35,117,119,61,20,64,118],"gapSum":[37,0,112,0,9,0,34,37,24,88,0,38,66,96,0,112,21,105,95,7,78,49,34,0,0,70,10,44,57,56,25,94,69,0,78,34,88,22,26,78,91,0,91,107,0,0,27,100,70,87,0,0,0,0,92,112,0,0,58,63,0,94,0,0,63,26,23,7,37,0,9,88,0,76,79,8,0,0,41,62,52,10,0,0,0,80,21,0,0,87,91,6,0,28,108,71,22,0,27,56],"gapCount":[5,0,4,0,1,0,1,2,1,3,0,2,5,3,0,1,1,3,3,1,2,1,3,0,0,2,1,2,2,2,2,7,1,0,3,1,3,1,1,5,2,0,4,5,0,0,1,4,2,3,0,0,0,0,2,4,0,0,3,2,0,5,0,0,2,1,1,1,1,0,1,4,0,1,1,1,0,0,3,2,1,2,0,0,0,5,1,0,0,3,1,1,0,1,2,3,1,0,1,2],"gapMin":[2,0,3,0,9,0,34,3,24,1,0,7,1,4,0,112,21,15,5,7,35,49,1,0,0,18,10,22,24,6,11,3,69,0,9,34,5,22,26,6,19,0,7,2,0,0,27,9,19,6,0,0,0,0,29,3,0,0,7,6,0,6,0,0,31,26,23,7,37,0,9,2,0,76,79,8,0,0,2,10,52,2,0,0,0,2,21,0,0,1,91,6,0,28,38,8,22,0,27,24],"gapMax":[14,0,92,0,9,0,34,34,24,60,0,31,22,61,0,112,21,73,66,7,43,49,30,0,0,52,10,22,33,50,14,38,69,0,50,34,60,22,26,22,72,0,59,40,0,0,27,48,51,71,0,0,0,0,63,60,0,0,28,57,0,35,0,0,32,26,23,7,37,0,9,36,0,76,79,8,0,0,23,52,52,8,0,0,0,46,21,0,0,68,91,6,0,28,70,50,22,0,27,32],"gapOrder":[61,18,90,38,36,2,55,83,13,43,6,15,20,93,54,7,94,73,58,74,3,21,66,78,9,17,85,64,47,48,71,39,40,97,29,91,79,31,86,42,44,34,49,89,59,87,0,98,25,96,37,22,32,70,12,11,81,95,77,19,14,80,28,67,84,68,8,99,24,35,46,65,10,56,30,75,27,4,63,16,53,23,26,60,69,76,41]},"back3":{"width":3,"k":2,"digitCum":[0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,1,0,2,1,0,3,2,0,0,0,2,1,2,2,0,3,2,1,1,0,3,3,2,2,1,3,2,1,3,0,4,3,4,2,2,3,2,2,3,2,4,4,5,3,2,3,3,3,3,3,4,4,5,4,4,4,3,4,3,3,4,5,7,4,5,4,3,5,4,3,4,5,9,5,6,4,3,5,4,5,4,7,10,6,6,4,6,5,4,7,5,7,10,6,6,4,6,7,6,7,5,7,11,6,7,6,6,7,6,8,6,7,12,7,7,7,7,7,7,8,8,8,12,7,7,7,8,8,8,9,9,8,12,8,7,9,8,8,9,9,9,8,14,8,8,9,8,8,10,11,9,8,15,8,10,9,8,9,10,11,10,8,16,9,12,9,9,9,12,11,12,8,17,9,12,9,9,10,12,14,13,8,17,10,12,10,10,10,12,16,14,8,17,11,12,10,10,12,12,17,15,9,18,11,12,10,11,12,12,19,16,9,19,11,13,10,13,13,12,19,17,9,19,11,15,11,13,13,12,20,19,9,19,12,16,11,14,14,12,20,20,10,19,13,17,11,15,15,13,21,20,11,19,13,18,11,15,15,13,21,20,11,20,16,20,12,15,15,13,21,21,11,22,18,20,13,16,15,14,22,22,11,22,19,20,14,17,16,15,23,23,11,22,19,20,15,17,17,16,24,24,12,22,19,20,15,18,19,17,24,25,13,22,19,20,16,19,21,17,24,25,14,22,20,20,18,19,23,17,25,26,14,22,20,20,19,20,24,17,25,26,15,23,20,21,19,20,26,17,27,26,15,24,21,21,19,20,27,17,28,26,16,25,23,21,21,21,28,17,29,26,17,25,23,21,21,22,29,19,30,26,18,25,23,21,21,23,30,19,31,26,18,26,24,22,22,23,30,19,31,26,20,27,24,24,22,23,32,21,32,26,20,27,24,25,22,24,32,22,32,27,20,29,24,26,23,25,33,22,34,27,20,29,24,27,23,25,33,23,34,30,20,29,25,28,24,25,35,23,35,32,20,29,25,28,24,25,35,23,37,33,21,29,26,29,25,27,35,23,38,33,23,29,26,29,25,27,36,25,38,34,23,31,26,29,25,27,36,25,40,34,23,32,28,30,25,27,36,26,42,37,23,32,28,30,26,27,37,26,42,37,24,32,29,32,26,28,37,26,42,39,24,34,29,33,26,29,38,26,42,39,25,35,30,34,26,30,38,28,42,39,26,36,30,35,26,31,38,29,42,39,27,37,31,36,27,31,40,29,43,39,27,38,32,36,27,32,40,29,45,39,27,39,32,38,29,32,40,29,45,39,29,40,33,38,30,33,40,30,45,39,30,41,34,38,30,33,41,31,46,39,30,44,34,38,30,34,43,31,46,39,31,44,34,40,31,34,43,32,48,40,31,45,34,40,31,35,44,32,49,41,33,45,34,40,32,35,46,32,49,41,33,47,34,41,33,36,46,33,50,41,33,47,34,43,33,37,46,33,50,41,34,49,35,44,35,37,48,33,50,41,34,49,36,45,35,37,48,33,52,42,35,49,37,46,35,37,49,33,53,43,36,49,39,46,35,38,49,34,53,44,38,49,39,47,35,39,49,34,55,46,38,49,39,48,35,39,49,35,55,48,38,51,40,48,36,39,50,37,55,48,38,52,41,48,36,39,51,38,56,48,38,53,41,50,36,39,51,38,57,50,38,54,41,52,38,40,52,38,58,51,38,54,41,52,38,40,52,41,59,51,39,54,42,52,40,41,52,42,59,51,39,56,42,52,40,42,53,43,61,51,39,57,42,52,40,42,54,43,64,51,40,58,42,52,40,42,54,43,65,51,41,61,43,52,40,44,55,43,66,51,42,61,44,52,42,44,57,43,66,51,43,62,44,52,42,44,58,43,66,51,44,64,45,53,43,44,58,44,67,51,44,64,47,54,46,44,58,44,68,51,44,64,49,54,47,44,58,44,68,52,46,65,49,55,47,45,58,45,69,52,46,65,49,58,48,46,59,47,69,52,47,65,49,58,49,46,59,47,70,53,47,66,50,59,50,46,59,47,71,54,48,66,51,60,50,47,59,49,71,54,48,66,53,61,50,47,60,50,71,54,49,68,53,62,50,47,60,50,74,54,49,70,54,62,50,47,61,50,75,55,50,70,56,62,52,48,62,50,75,56,51,70,56,62,52,49,62,50,75,57,53,71,57,62,53,49,62,51,76,58,53,72,57,63,54,50,62,51,76,58,56,72,58,63,55,50,62,51,78,58,57,74,58,63,55,51,63,51,78,58,60,75,58,63,55,52,63,52,78,59,62,75,58,64,57,52,63,53,80,59,62,76,58,64,57,52,64,54,80,59,63,77,58,66,57,54,65,54,80,59,64,77,59,67,58,54,65,56,81,59,65,77,60,67,58,56,66,56,81,60,65,77,61,68,58,56,66,57,82,60,65,77,63,70,60,56,69,57,82,60,65,77,63,71,62,56,69,59,82,60,65,78,64,71,64,56,70,59,82,61,66,78,65,71,64,56,70,59,83,61,67,79,67,72,65,59,70,59,83,61,68,79,67,73,65,59,71,61,83,61,68,79,68,75,65,60,71,62,83,62,68,80,68,77,66,61,71,62,86,62,68,80,68,78,66,61,72,62,86,63,69,81,70,78,66,61,73,64,86,63,72,81,70,78,68,62,73,64,88,63,72,81,71,78,68,63,73,64,88,64,73,82,72,79],"numbers":[57,817,51,806,396,256,393,577,264,478,498,129,276,970,978,723,447,668,511,414,233,927,4,785,160,355,123,458,379,7,379,449,295,798,331,755,844,245,401,485,476,522,419,547,119,529,509,485,592,816,234,691,989,788,578,870,413,508,41,325,236,540,213,652,228,106,2,542,61,279,447,282,284,876,210,604,631,432,194,278,606,799,343,922,157,973,409,421,855,593,250,425,564,849,101,664,377,523,748,984,355,544,290,698,797,551,269,187,693,731,386,971,202,874,491,947,66,780,387,601,737,742,692,291,57,344,426,615,272,970,19,349,778,961,92,280,584,964,882,456,196,635,544,591,587,375,382,703,794,329,559,947,154,200,634,833,137,70,421,734,426,447,647,778,421,618,622,70,697,728,94,388,8,408,79,566,493,919,63,231,980,547,98,654,339,881,376,297,448,477,685,824,652,1,656,781,457,309,180,666,474,760,167,662,965,631,307,44,299,736,918,261,84,336,512,891,834,989,22,209,308,703,280,605,476,889,111,690,239,389,137,995,14,449,288,765,662,363,408,41,578,169],"pairs":[6,6,3,2,5,4,6,5,6,7,3,4,3,4,2,3,4,1,4,6,3,5,5,8,2,4,5,5,7,8,3,5,3,5,7,3,4,8,5,4,5,5,8,2,11,4,0,13,4,7,3,4,5,0,8,6,5,7,3,4,6,5,3,6,5,6,8,1,2,8,7,1,3,5,4,2,7,5,11,8,6,4,4,2,6,5,1,6,6,5,2,7,5,4,5,2,5,8,8,3],"pairOrder":[5,57,81,17,51,80,6,39,96,25,56,93,77,26,64,47,78,49,98,12,29,27,76,97,70,72,23,44,66,68,11,41,14,33,92,0,4,85,16,60,35,55,45,58,37,79,7,95,31,75,84,24,40,1,48,52,22,19,54,50,9,59,34,69,91,89,88,87,13,8,32,36,21,65,28,10,2,42,61,82,63,43,94,99,15,73,74,90,18,38,86,71,20,3,83,62,30,67],"combos":[8,16,15,6,15,8,14,17,15,14,0,6,11,11,14,10,15,9,10,18,0,0,8,14,14,15,17,10,15,19,0,0,0,8,12,9,15,19,10,16,0,0,0,0,13,19,14,24,20,18,0,0,0,0,0,6,16,16,12,11,0,0,0,0,0,0,11,11,9,13,0,0,0,0,0,0,0,7,24,20,0,0,0,0,0,0,0,0,6,17,0,0,0,0,0,0,0,0,0,6],"comboOrder":[5,7,57,18,78,17,1,15,8,68,6,39,36,69,25,26,56,33,77,24,46,47,48,49,89,12,19,29,27,67,79,9,37,23,44,66,11,14,0,4,58,16,35,55,13,45,59,22,34,99,88,28,2,38,3],"lastSeen":[76,96,56,110,37,111,40,103,119,109,37,113,107,31,116,63,24,0,105,88,-1,82,109,48,95,45,80,10,84,74,-1,102,38,77,108,70,106,115,-1,114,30,119,60,41,103,18,-1,90,94,116,45,52,96,-1,91,50,97,98,13,75,100,105,118,118,68,117,99,101,8,120,83,55,64,42,100,72,112,94,120,87,111,97,73,-1,106,95,55,72,117,114,113,107,67,88,85,115,70,93,91,104],"gapSum":[0,77,23,37,26,0,39,89,91,86,0,104,0,3,107,0,0,0,23,67,0,39,89,41,0,16,17,0,52,69,0,85,0,67,83,0,76,55,0,22,0,90,27,0,85,0,0,82,45,101,0,51,65,0,15,38,95,98,0,0,88,71,17,29,64,15,41,0,0,67,77,0,0,0,44,0,106,91,116,73,53,5,38,0,70,84,0,19,91,88,62,82,43,85,46,99,68,41,86,64],"gapCount":[0,3,1,1,1,0,2,1,4,3,0,1,0,1,1,0,0,0,1,3,0,2,3,2,0,1,1,0,1,2,0,4,0,1,3,0,2,2,0,1,0,1,1,0,4,0,0,7,1,3,0,1,1,0,1,3,2,3,0,0,1,2,1,1,3,1,2,0,0,1,4,0,0,0,1,0,4,2,6,3,4,1,2,0,3,3,0,2,2,3,1,4,2,3,2,1,1,2,3,1],"gapMin":[0,12,23,37,26,0,8,89,0,11,0,104,0,3,107,0,0,0,23,1,0,3,21,6,0,16,17,0,52,17,0,13,0,67,2,0,2,18,0,22,0,90,27,0,9,0,0,1,45,19,0,51,65,0,15,5,28,20,0,0,88,32,17,29,1,15,12,0,0,67,5,0,0,0,44,0,14,45,3,1,9,5,4,0,13,4,0,6,32,2,62,4,6,10,11,99,68,9,11,64],"gapMax":[0,37,23,37,26,0,31,89,58,55,0,104,0,3,107,0,0,0,23,43,0,36,42,35,0,16,17,0,52,52,0,35,0,67,52,0,74,37,0,22,0,90,27,0,32,0,0,22,45,51,0,51,65,0,15,27,67,42,0,0,88,39,17,29,42,15,29,0,0,67,37,0,0,0,44,0,57,46,39,53,23,5,34,0,38,72,0,13,59,82,62,36,37,41,35,99,68,32,40,64],"gapOrder":[57,17,51,6,96,56,93,77,64,78,98,29,76,70,23,47,68,11,14,33,27,4,85,60,55,58,79,7,49,95,31,44,45,1,22,19,9,92,16,34,91,89,88,13,8,41,25,36,40,52,28,2,42,61,82,84,10,32,94,99,43,73,21,50,48,90,97,69,87,86,71,74,66,80,37,26,15,72,35,75,3,59,54,0,18,63,39,81,24,67,62,65,12,5]}}};
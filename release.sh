@@ -77,6 +77,7 @@ zip -r "$DIST_DIR/$ZIP_NAME" \
   popup.js \
   lotteryData.js \
   lotteryAnalysis.js \
+  lotteryAnalysisSnapshot.js \
   lotteryStaticData.js \
   chart.min.js \
   background.js \
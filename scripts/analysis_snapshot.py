@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+analysis_snapshot.py — ผลรวมสถิติที่คำนวณไว้ล่วงหน้าจาก static data (lotteryAnalysisSnapshot.js)
+
+static data เปลี่ยนเฉพาะตอนรัน update_static_data.py จึงคำนวณส่วนที่ต้องวนทุกเลขไว้ตอน build
+ต่อประเภทรางวัล (first, last2, front3, back3):
+  - digitCum   prefix sum ของจำนวนหลัก 0-9 ต่องวด → ความถี่ของช่วงงวดใดก็ได้ = ลบกัน 2 แถว
+  - numbers    ทุกเลขของแต่ละงวด (k ตัวต่องวด) — ใช้ตรวจว่าข้อมูลตรงกับ snapshot ทุกเลข
+               + rolling sum ของ moving average (เลขตัวแรก)
+  - pairs/combos        จำนวนคู่เลขติดกัน / คู่เลขในเลขเดียวกัน ทั้งช่วง static
+  - lastSeen/gap*       งวดล่าสุดที่เลขท้าย 2 ตัวออก และผลรวม/จำนวน/ต่ำสุด/สูงสุดของช่วงห่าง
+  - *Order     ลำดับที่ key ปรากฏครั้งแรก (ให้ Object.entries ฝั่ง JS เรียงเหมือนคำนวณสด)
+lotteryAnalysis.js ใช้ snapshot เมื่อข้อมูลที่ส่งเข้ามาตรงกับ static data
+แล้ว fold งวด live ที่ใหม่กว่าเข้าไปทีละงวด แทนการวนทุกเลขของทุกงวด
+
+Requires: pip install numpy
+
+Usage:
+  python3 scripts/analysis_snapshot.py             # สร้าง lotteryAnalysisSnapshot.js จาก lotteryStaticData.js
+  python3 scripts/analysis_snapshot.py --verify    # ตรวจ fold และ fast path ของ lotteryAnalysis.js เทียบกับคำนวณสด
+"""
+
+import argparse, json, os, shutil, subprocess, sys, tempfile
+
+import numpy as np
+
+from lottery_analysis import DrawMatrix, TIERS, ROOT_DIR
+
+OUTPUT = os.path.join(ROOT_DIR, 'lotteryAnalysisSnapshot.js')
+KINDS = ('first', 'last2', 'front3', 'back3')
+# ต้องตรงกับ SNAPSHOT_VERSION ใน lotteryAnalysis.js — ไม่ตรงกัน extension จะไม่ใช้ snapshot (คำนวณสดทุกครั้ง)
+SNAPSHOT_VERSION = 2
+
+
+def first_seen_order(codes):
+    """code ที่ไม่ซ้ำ เรียงตามตำแหน่งที่พบครั้งแรก"""
+    codes = np.asarray(codes).ravel()
+    uniq, first = np.unique(codes, return_index=True)
+    return uniq[np.argsort(first)].tolist()
+
+
+def build_kind(s):
+    """snapshot ของรางวัลหนึ่งประเภท (Series เรียงเก่า → ใหม่) — None ถ้ามีเลขที่ไม่ใช่ตัวเลข"""
+    if not s.valid.all():
+        return None  # JS นับ placeholder ('---') ต่างจากเลขปกติ → ให้ประเภทนี้คำนวณสดเสมอ
+    n, k = s.valid.shape
+    draw_idx = np.broadcast_to(np.arange(n)[:, None, None], s.digits.shape)
+    per_draw = np.zeros((n, 10), dtype=np.int64)
+    np.add.at(per_draw, (draw_idx.ravel(), s.digits.ravel().astype(np.int64)), 1)
+    digit_cum = np.vstack([np.zeros((1, 10), dtype=np.int64), np.cumsum(per_draw, axis=0)])
+
+    nums = s.numbers().astype(np.int64)
+    consecutive = nums[:, :-1] * 10 + nums[:, 1:]
+    i, j = np.triu_indices(s.width, k=1)
+    combos = np.minimum(nums[:, i], nums[:, j]) * 10 + np.maximum(nums[:, i], nums[:, j])
+
+    vals, idx = s.values()
+    last2 = vals % 100
+    order = np.argsort(last2, kind='stable')
+    k_sorted, i_sorted = last2[order], idx[order]
+    same = k_sorted[1:] == k_sorted[:-1]
+    gaps, gap_keys = (i_sorted[1:] - i_sorted[:-1])[same], k_sorted[1:][same]
+    last_seen = np.full(100, -1, dtype=np.int64)
+    last_seen[k_sorted] = i_sorted  # ค่าหลังทับค่าก่อน → ได้งวดล่าสุดของแต่ละเลข
+    gap_count = np.bincount(gap_keys, minlength=100)
+    gap_min = np.full(100, np.iinfo(np.int64).max, dtype=np.int64)
+    gap_max = np.zeros(100, dtype=np.int64)
+    np.minimum.at(gap_min, gap_keys, gaps)
+    np.maximum.at(gap_max, gap_keys, gaps)
+    gap_min[gap_count == 0] = 0
+
+    return {
+        'width': s.width,
+        'k': k,
+        'digitCum': digit_cum.ravel().tolist(),
+        'numbers': vals.tolist(),
+        'pairs': np.bincount(consecutive.ravel(), minlength=100).tolist(),
+        'pairOrder': first_seen_order(consecutive),
+        'combos': np.bincount(combos.ravel(), minlength=100).tolist(),
+        'comboOrder': first_seen_order(combos),
+        'lastSeen': last_seen.tolist(),
+        'gapSum': np.bincount(gap_keys, weights=gaps, minlength=100).astype(np.int64).tolist(),
+        'gapCount': gap_count.tolist(),
+        'gapMin': gap_min.tolist(),
+        'gapMax': gap_max.tolist(),
+        'gapOrder': first_seen_order(last2),
+    }
+
+
+def build(draws):
+    matrix = DrawMatrix(draws)
+    kinds = {kind: build_kind(matrix.series(kind)) for kind in KINDS}
+    return {
+        'version': SNAPSHOT_VERSION,
+        'n': len(matrix.dates),
+        'dates': matrix.dates,
+        'kinds': {kind: snap for kind, snap in kinds.items() if snap is not None},
+    }
+
+
+def add_code(snap, counts, order, code):
+    if snap[counts][code] == 0:
+        snap[order].append(code)
+    snap[counts][code] += 1
+
+
+def fold(snapshot, live):
+    """เพิ่มงวดใหม่ (draw dict แบบ lotteryStaticData.js เรียงเก่า → ใหม่) ต่อท้าย snapshot
+
+    เหมือนที่ lotteryAnalysis.js ทำตอน runtime — build(static + live) ต้องเท่ากับ fold(build(static), live)
+    """
+    snapshot = json.loads(json.dumps(snapshot))
+    for d in live:
+        idx = snapshot['n']
+        for kind, snap in snapshot['kinds'].items():
+            field, _, scalar = TIERS[kind]
+            numbers = [d[field]] if scalar else d[field]
+            row = snap['digitCum'][-10:]
+            for num in numbers:
+                digits = [int(c) for c in num]
+                for x in digits:
+                    row[x] += 1
+                for a, b in zip(digits, digits[1:]):
+                    add_code(snap, 'pairs', 'pairOrder', a * 10 + b)
+                for p in range(len(digits)):
+                    for q in range(p + 1, len(digits)):
+                        add_code(snap, 'combos', 'comboOrder',
+                                 min(digits[p], digits[q]) * 10 + max(digits[p], digits[q]))
+                key = int(num) % 100
+                seen = snap['lastSeen'][key]
+                if seen < 0:
+                    snap['gapOrder'].append(key)
+                else:
+                    gap = idx - seen
+                    snap['gapMin'][key] = min(snap['gapMin'][key], gap) if snap['gapCount'][key] else gap
+                    snap['gapMax'][key] = max(snap['gapMax'][key], gap)
+                    snap['gapSum'][key] += gap
+                    snap['gapCount'][key] += 1
+                snap['lastSeen'][key] = idx
+            snap['digitCum'].extend(row)
+            snap['numbers'].extend(int(num) for num in numbers)
+        snapshot['dates'].append(d['date'])
+        snapshot['n'] += 1
+    return snapshot
+
+
+def render_js(snapshot):
+    dates = snapshot['dates']
+    return (f"/** Precomputed analysis snapshot — {snapshot['n']} draws ({dates[0]} to {dates[-1]})\n"
+            f" * สร้างจาก lotteryStaticData.js ชุดเดียวกัน — generate ใหม่ทุกครั้งที่ static data เปลี่ยน\n"
+            f" * Script: scripts/analysis_snapshot.py\n */\n\n"
+            "const LOTTERY_ANALYSIS_SNAPSHOT = " + json.dumps(snapshot, separators=(',', ':')) + ";\n")
+
+
+def write_snapshot(draws, path=OUTPUT):
+    snapshot = build(draws)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(render_js(snapshot))
+    os.replace(tmp, path)  # ถูกขัดจังหวะกลางทาง → ไฟล์เดิมยังใช้ได้ ไม่เหลือ snapshot ครึ่งไฟล์
+    return snapshot
+
+
+# ========== Verification ==========
+
+NODE_RUNNER = """
+const fs = require('fs'), vm = require('vm');
+const [analysisJs, snapshotJs] = process.argv.slice(1);
+const cases = JSON.parse(fs.readFileSync(0, 'utf8'));
+const run = withSnapshot => {
+  const ctx = { LotteryData: {}, console };
+  vm.createContext(ctx);
+  if (withSnapshot) vm.runInContext(fs.readFileSync(snapshotJs, 'utf8'), ctx);
+  vm.runInContext(fs.readFileSync(analysisJs, 'utf8') + '\\nthis.LotteryAnalysis = LotteryAnalysis;', ctx);
+  return cases.map(c => JSON.stringify(ctx.LotteryAnalysis[c.fn](c.data, c.arg)));
+};
+const slow = run(false), fast = run(true);
+process.stdout.write(JSON.stringify(cases.map((c, i) => slow[i] === fast[i])));
+"""
+
+JS_CASES = (('frequencyAnalysis', 'single'), ('gapAnalysis', None), ('pairAnalysis', None),
+            ('movingAverageAnalysis', 5), ('combinedPrediction', None), ('getFrequencyChartData', None))
+
+
+def corrected(num):
+    """เลขเดียวกันแต่หลักสุดท้ายต่างไป (จำลองผลที่ถูกแก้)"""
+    return num[:-1] + str((int(num[-1]) + 1) % 10)
+
+
+def verify(draws, live_count=3):
+    """1) fold ฝั่ง Python == build ใหม่ทั้งหมด
+    2) lotteryAnalysis.js ที่มี snapshot (static) + งวด live ให้ผลเหมือนไม่มี snapshot ทุกตัวอักษร"""
+    draws = sorted(draws, key=lambda d: d['date'])
+    static, live = draws[:-live_count], draws[-live_count:]
+    base = build(static)
+    problems = []
+    if fold(base, live) != build(draws):
+        problems.append("fold(static, live) ไม่ตรงกับ build(static + live)")
+
+    node = shutil.which('node')
+    if not node:
+        print("   ⚠️ ไม่มี node — ข้ามการตรวจ fast path ของ lotteryAnalysis.js")
+        return problems
+
+    matrix = DrawMatrix(draws)
+    cases = []
+    for kind in KINDS:
+        # ช่วงที่ UI ใช้ (12-96, ทั้งหมด) ทั้งแบบมีงวด live และแบบจบที่ static
+        for count in (12, 24, 48, 96, len(draws)):
+            s = matrix.series(kind, count)
+            data = [{'date': d, 'numbers': [''.join(map(str, n)) for n in row[v]]}
+                    for d, row, v in zip(s.dates, s.digits, s.valid)]
+            # ผลที่ถูกแก้หลัง build (เลขตัวสุดท้ายของงวดแรกเปลี่ยน) → ต้องไม่ใช้ snapshot
+            fixed = [dict(data[0], numbers=data[0]['numbers'][:-1] + [corrected(data[0]['numbers'][-1])])] + data[1:]
+            for suffix, window in (('', data), ('/static', data[:-live_count]), ('/corrected', fixed)):
+                for fn, arg in JS_CASES:
+                    cases.append({'fn': fn, 'arg': arg, 'data': window,
+                                  'label': f"{kind}/{count}{suffix}/{fn}"})
+
+    with tempfile.NamedTemporaryFile('w', suffix='.js', delete=False, encoding='utf-8') as f:
+        f.write(render_js(base))
+    try:
+        out = subprocess.run([node, '-e', NODE_RUNNER, os.path.join(ROOT_DIR, 'lotteryAnalysis.js'), f.name],
+                             input=json.dumps(cases), capture_output=True, text=True, check=True)
+    finally:
+        os.unlink(f.name)
+    for case, ok in zip(cases, json.loads(out.stdout)):
+        if not ok:
+            problems.append(f"{case['label']}: fast path ไม่ตรงกับคำนวณสด")
+    print(f"   ตรวจ fast path ของ lotteryAnalysis.js {len(cases)} กรณี")
+    return problems
+
+
+def main(argv=None):
+    from update_static_data import load_static_data, OUTPUT as STATIC_OUTPUT
+
+    ap = argparse.ArgumentParser(description='สร้าง/ตรวจ lotteryAnalysisSnapshot.js')
+    ap.add_argument('--input', default=STATIC_OUTPUT, help='lotteryStaticData.js')
+    ap.add_argument('--output', default=OUTPUT, help='ไฟล์ snapshot ที่จะเขียน')
+    ap.add_argument('--verify', action='store_true', help='ตรวจ fold และ fast path ของ lotteryAnalysis.js (ต้องมี node)')
+    args = ap.parse_args(argv)
+
+    draws = load_static_data(args.input)
+    if args.verify:
+        problems = verify(draws)
+        for p in problems:
+            print(f"   ❌ {p}")
+        print("✅ Snapshot ถูกต้อง" if not problems else f"❌ พบปัญหา {len(problems)} รายการ")
+        sys.exit(1 if problems else 0)
+
+    snapshot = write_snapshot(draws, args.output)
+    print(f"✅ {os.path.abspath(args.output)} — {snapshot['n']} งวด, "
+          f"{len(snapshot['kinds'])} ประเภท ({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
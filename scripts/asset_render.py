@@ -0,0 +1,173 @@
+"""
+asset_render.py — ส่วนกลางของ gen_icons.py / gen_store_images.py
+
+- font cache: หา path ของ font ครั้งเดียวต่อรายการ candidate และสร้าง ImageFont.truetype
+  ครั้งเดียวต่อ (path, size) — เดิมทุกขนาด/ทุกข้อความ probe os.path.exists แล้วโหลด font ใหม่
+- render_all(): render ทุกไฟล์พร้อมกันใน process pool (แต่ละไฟล์ = Job ที่คืน PIL Image)
+- content-hash cache (scripts/.cache/asset_cache.json): key = sha256 ของ source code, argument,
+  ไฟล์ input (เช่น icon128.png) และ font ที่มีในเครื่อง ถ้า key เดิมและไฟล์ output ยังเป็นไฟล์ที่เขียนไว้
+  จะข้ามไม่ render ซ้ำ
+
+Requires: pip install Pillow
+"""
+
+import hashlib, json, os, time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
+
+from PIL import ImageFont
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(SCRIPT_DIR, '.cache', 'asset_cache.json')
+CACHE_VERSION = 1
+
+
+# ========== Fonts ==========
+
+@lru_cache(maxsize=None)
+def find_font(*candidates):
+    """path แรกที่มีอยู่จริงใน candidates (None ถ้าไม่มีเลย) — probe ครั้งเดียวต่อรายการ"""
+    return next((p for p in candidates if os.path.exists(p)), None)
+
+
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """ImageFont ของ (path, size) — โหลดครั้งเดียวแล้วใช้ซ้ำ; path ใช้ไม่ได้ → None"""
+    if path is None:
+        return None
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def default_font():
+    return ImageFont.load_default()
+
+
+def font_fingerprint(candidates):
+    """font ที่มีในเครื่อง (path, ขนาดไฟล์) — เปลี่ยนเครื่อง/ลง font ใหม่แล้ว cache จะไม่ตรง"""
+    return [(p, os.path.getsize(p)) for p in dict.fromkeys(candidates) if os.path.exists(p)]
+
+
+# ========== Jobs ==========
+
+class Job(NamedTuple):
+    name: str             # ชื่อที่แสดงในรายงาน
+    path: str             # ไฟล์ output
+    fn: object            # ฟังก์ชันระดับ module (pickle ได้) → PIL Image
+    args: tuple = ()
+    inputs: tuple = ()    # ไฟล์ที่ fn อ่าน (เปลี่ยนแล้วต้อง render ใหม่)
+
+
+def file_digest(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def job_key(job, code, fonts):
+    data = {
+        'fn': f"{job.fn.__module__}.{job.fn.__qualname__}",
+        'args': repr(job.args),
+        'code': [file_digest(p) for p in code],
+        'inputs': [(os.path.basename(p), file_digest(p)) for p in job.inputs],
+        'fonts': font_fingerprint(fonts),
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def render_job(job):
+    """render + บันทึก (tmp แล้ว os.replace) → (ms ที่ใช้ render, ms ที่ใช้บันทึก, sha256 ของไฟล์)"""
+    t = time.perf_counter()
+    img = job.fn(*job.args)
+    rendered = time.perf_counter()
+    os.makedirs(os.path.dirname(os.path.abspath(job.path)), exist_ok=True)
+    root, ext = os.path.splitext(job.path)
+    tmp = f"{root}.tmp{ext}"
+    img.save(tmp)
+    os.replace(tmp, job.path)
+    saved = time.perf_counter()
+    return (rendered - t) * 1000, (saved - rendered) * 1000, file_digest(job.path)
+
+
+def load_cache(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache['outputs'] if cache.get('v') == CACHE_VERSION else {}
+    except (FileNotFoundError, ValueError, KeyError):
+        return {}
+
+
+def save_cache(path, outputs):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'v': CACHE_VERSION, 'outputs': outputs}, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def render_all(jobs, code, fonts=(), processes=None, force=False, cache_path=CACHE_PATH, chunksize=1):
+    """render เฉพาะ job ที่ key เปลี่ยนหรือไฟล์ output ไม่ตรงกับที่เขียนไว้ → list ของผลต่อ job
+
+    ผลแต่ละ job: {'name', 'path', 'status': 'rendered'|'cached', 'render_ms', 'save_ms'}
+    processes: จำนวน process (None = เท่ากับจำนวน CPU, 1 = render ใน process นี้)
+    chunksize: job ติดกันกี่ตัวที่ส่งให้ process เดียวกัน (ให้ job ที่ใช้ cache ใน process ร่วมกันอยู่ด้วยกัน)
+    """
+    outputs = load_cache(cache_path) if cache_path else {}
+    results, todo = {}, []
+    for job in jobs:
+        key = job_key(job, code, fonts)
+        entry = outputs.get(os.path.abspath(job.path))
+        if not force and entry and entry['key'] == key and file_digest(job.path) == entry['sha']:
+            results[job.name] = {'name': job.name, 'path': job.path, 'status': 'cached',
+                                 'render_ms': 0.0, 'save_ms': 0.0}
+        else:
+            todo.append((job, key))
+
+    processes = processes or os.cpu_count() or 1
+    if processes > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(min(processes, len(todo))) as pool:
+            done = list(pool.map(render_job, [job for job, _ in todo], chunksize=chunksize))
+    else:
+        done = [render_job(job) for job, _ in todo]
+
+    for (job, key), (render_ms, save_ms, sha) in zip(todo, done):
+        outputs[os.path.abspath(job.path)] = {'key': key, 'sha': sha}
+        results[job.name] = {'name': job.name, 'path': job.path, 'status': 'rendered',
+                             'render_ms': render_ms, 'save_ms': save_ms}
+    if cache_path and todo:
+        save_cache(cache_path, outputs)
+    return [results[job.name] for job in jobs]
+
+
+def add_arguments(ap):
+    """option ที่ gen_icons.py / gen_store_images.py ใช้ร่วมกัน"""
+    ap.add_argument('--processes', type=int, help='จำนวน process ที่ render พร้อมกัน (default: จำนวน CPU)')
+    ap.add_argument('--force', action='store_true', help='render ใหม่ทุกไฟล์ (ไม่ใช้ content-hash cache)')
+    ap.add_argument('--bench', action='store_true', help='รายงานเวลา render/บันทึกของแต่ละไฟล์')
+    ap.add_argument('--cache', default=CACHE_PATH, help='ไฟล์ content-hash cache')
+
+
+def report(results, wall, bench):
+    rendered = [r for r in results if r['status'] == 'rendered']
+    for r in results:
+        if r['status'] == 'cached':
+            print(f"⏭️  {r['name']} ไม่เปลี่ยน (cache)")
+        else:
+            print(f"✅ Created {r['path']}")
+    if bench:
+        print(f"\n{'ไฟล์':<36} {'render ms':>10} {'save ms':>9}")
+        for r in results:
+            if r['status'] == 'cached':
+                print(f"{r['name']:<36} {'cached':>10} {'':>9}")
+            else:
+                print(f"{r['name']:<36} {r['render_ms']:>10.1f} {r['save_ms']:>9.1f}")
+        total = sum(r['render_ms'] + r['save_ms'] for r in rendered)
+        print(f"⏱️  render {len(rendered)}/{len(results)} ไฟล์: wall {wall * 1000:.0f} ms "
+              f"(รวมเวลาทุกไฟล์ {total:.0f} ms)")
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+backtest.py — walk-forward backtest ของวิธีทำนายใน lotteryAnalysis.js (ผ่าน lottery_analysis.py)
+
+ทุกงวด t ในประวัติ: ทำนายด้วยข้อมูล window งวดก่อนหน้า [t - window, t) เท่านั้น แล้ววัดกับผลจริงของงวด t
+แทนที่จะเรียก combined_prediction() ใหม่ทุกจุดตัด (O(งวด × window)) ทุกสถานะเก็บแบบ incremental ครั้งเดียว:
+  - จำนวนครั้งของหลัก / คู่เลข / เลขท้าย 2 ตัว / pattern คู่-คี่ ต่องวด → prefix sum
+    จำนวนใน window ใดก็ได้ = P[t] - P[t - window]
+  - งวดแรกที่พบ code ตั้งแต่งวด i (scan ถอยหลัง) และงวดล่าสุดก่อน t (scan ไปข้างหน้า)
+    → ช่วงห่างเฉลี่ย (gap) และลำดับ first-seen ที่ JS ใช้ตัดสินเมื่อคะแนนเท่ากัน
+  - แล้วจัดอันดับทุกจุดตัดพร้อมกันด้วย argsort/lexsort ของ NumPy
+ผลทำนายตรงกับ lottery_analysis.py ที่คำนวณใหม่ทั้ง window ทุกจุด (ตรวจได้ด้วย --verify)
+
+แต่ละวิธีวัดแบบนี้ (ทุกเลขที่ออกในงวด t คือหนึ่งครั้งที่ทดสอบ):
+  frequency / hotCold / combined   3 หลักอันดับแรก — สัดส่วนหลักของเลขจริงที่อยู่ในชุด (สุ่ม = 30%)
+  gap                              overdue 10 อันดับ — เลขท้าย 2 ตัวอยู่ในชุด
+  pairs                            คู่เลขติดกัน 5 อันดับ — เลขจริงมีคู่ใดคู่หนึ่ง
+  pattern                          pattern คู่-คี่ที่พบบ่อยสุด — ตรงทั้ง pattern
+  movingAverage                    predictedValue — ห่างจากเลขจริงไม่เกิน 5% ของช่วงค่า
+  combined 2/3 ตัว                 predicted2 / predicted3 — ตรงกับเลขท้าย 2/3 ตัว
+
+--sweep ลองทุก window × ชุดน้ำหนักของ combined (ความถี่, ร้อน, เย็น, คู่เลข) กระจายใน process pool
+
+Requires: pip install numpy
+
+Usage:
+  python3 scripts/backtest.py                                   # first, window 24/48/96/ทั้งหมด
+  python3 scripts/backtest.py --kind first,last2,front3,back3 --sweep
+  python3 scripts/backtest.py --verify 40                       # เทียบ 40 จุดตัดกับการคำนวณใหม่ทั้ง window
+  python3 scripts/backtest.py --scale 40 --sweep --bench        # จำลองประวัติ 40 เท่า + เวลาแบบคำนวณใหม่
+"""
+
+import argparse, itertools, os, sys, time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import lottery_analysis as la
+from lottery_analysis import DrawMatrix, Series
+
+WINDOWS = ('24', '48', '96', 'all')
+MIN_HISTORY = 12
+DEFAULT_WEIGHTS = (2, 3, 1.5, 1)   # ความถี่, ร้อน, เย็น, คู่เลข — ตาม combinedPrediction
+SWEEP_GRID = ((0, 1, 2, 3), (0, 1.5, 3, 4.5), (0, 1.5, 3), (0, 1, 2))
+TOP_DIGITS = 3
+TOP_PAIRS = 5
+TOP_OVERDUE = 10
+
+
+# ========== สถานะต่องวด ==========
+
+def _prefix(per_draw):
+    """(N, C) → (N + 1, C): ผลรวมของงวด [a, t) = P[t] - P[a]"""
+    out = np.zeros((per_draw.shape[0] + 1, per_draw.shape[1]), dtype=np.int64)
+    np.cumsum(per_draw, axis=0, out=out[1:])
+    return out
+
+
+def _next_seen(present):
+    """NXT[i, c] = งวดแรก >= i ที่มี code c (N = ไม่มี)"""
+    n = present.shape[0]
+    nxt = np.full((n + 1, present.shape[1]), n, dtype=np.int64)
+    for i in range(n - 1, -1, -1):
+        nxt[i] = np.where(present[i], i, nxt[i + 1])
+    return nxt
+
+
+def _prev_seen(present):
+    """PRV[t, c] = งวดล่าสุด < t ที่มี code c (-1 = ไม่มี)"""
+    prv = np.full((present.shape[0] + 1, present.shape[1]), -1, dtype=np.int64)
+    for i in range(present.shape[0]):
+        prv[i + 1] = np.where(present[i], i, prv[i])
+    return prv
+
+
+class CodeTrack:
+    """เหตุการณ์ของ code ชนิดหนึ่ง (หลัก, คู่เลข ฯลฯ) ต่องวด
+
+    codes/mask: (N, E) — E = เหตุการณ์ต่องวดเรียงตามลำดับที่ lottery_analysis พบ (เลข → ตำแหน่ง)
+    """
+
+    def __init__(self, codes, mask, size):
+        n, e = codes.shape
+        self.size, self.span = size, e
+        rows = np.broadcast_to(np.arange(n)[:, None], codes.shape)[mask]
+        ords = np.broadcast_to(np.arange(e)[None, :], codes.shape)[mask]
+        cnt = np.zeros((n, size), dtype=np.int64)
+        np.add.at(cnt, (rows, codes[mask]), 1)
+        first = np.full((n + 1, size), e, dtype=np.int64)
+        np.minimum.at(first, (rows, codes[mask]), ords)
+        self.prefix = _prefix(cnt)
+        self.first = first
+        self.nxt = _next_seen(cnt > 0)
+        self.prv = _prev_seen(cnt > 0)
+
+    def counts(self, a, t):
+        return self.prefix[t] - self.prefix[a]
+
+    def first_seen(self, a):
+        """ลำดับเหตุการณ์แรกของแต่ละ code ใน window ที่เริ่มงวด a (ใช้เทียบกันเท่านั้น)"""
+        nxt = self.nxt[a]
+        return nxt * (self.span + 1) + self.first[nxt, np.arange(self.size)]
+
+
+def js_tiebreak(track, a):
+    """ลำดับ key แบบ Object.entries ของ code 2 หลัก: '10'–'99' ตามค่า แล้ว '00'–'09' ตามลำดับที่พบ"""
+    codes = np.arange(track.size)
+    index_key = codes >= 10
+    group = np.broadcast_to(~index_key, (len(a), track.size))
+    return group, np.where(index_key, codes, track.first_seen(a))
+
+
+def _top(order, ok, m):
+    """m อันดับแรกของ order ที่ ok (ที่เหลือ = -1)"""
+    top = order[:, :m]
+    return np.where(np.take_along_axis(ok, top, axis=1), top, -1)
+
+
+class WalkForward:
+    """ทุกจุดตัดของ series หนึ่งประเภทรางวัลที่ window หนึ่ง ('all' = ข้อมูลทั้งหมดก่อนหน้า)"""
+
+    def __init__(self, series, window='all', min_history=MIN_HISTORY):
+        self.series = s = series
+        n = len(s)
+        self.window = None if window in (None, 'all') else int(window)
+        start = max(min_history, self.window or 0)
+        self.t = np.arange(start, n)
+        self.a = np.maximum(0, self.t - self.window) if self.window else np.zeros_like(self.t)
+        self.n = self.t - self.a
+        w, k = s.width, s.valid.shape[1]
+
+        digits = s.digits.astype(np.int64)
+        valid = s.valid
+        self.values = digits @ (10 ** np.arange(w - 1, -1, -1, dtype=np.int64))
+        dmask = np.repeat(valid, w, axis=1)
+        self.digits = CodeTrack(np.where(dmask, digits.reshape(n, k * w), 0), dmask, 10)
+        pairs = digits[:, :, :-1] * 10 + digits[:, :, 1:]
+        pmask = np.repeat(valid, w - 1, axis=1)
+        self.pairs = CodeTrack(np.where(pmask, pairs.reshape(n, k * (w - 1)), 0), pmask, 100)
+        self.last2 = CodeTrack(np.where(valid, self.values % 100, 0), valid, 100)
+        odd = (digits % 2) @ (2 ** np.arange(w - 1, -1, -1, dtype=np.int64))
+        self.patterns = CodeTrack(np.where(valid, odd, 0), valid, 2 ** w)
+        self.lead = self.values[:, 0]   # เลขตัวแรกของแต่ละงวด (moving average)
+
+    def __len__(self):
+        return len(self.t)
+
+    # ---------- แต่ละวิธี: ผลของทุกจุดตัดพร้อมกัน ----------
+
+    def frequency(self):
+        """(counts, ลำดับหลัก) — frequency_analysis(..., 'single')['topNumbers']"""
+        cnt = self.digits.counts(self.a, self.t)
+        return cnt, np.argsort(-cnt, axis=1, kind='stable')
+
+    def hot_cold(self):
+        """ลำดับหลักตาม ratio ของ hot_cold_analysis (hot = 5 ตัวแรก, cold = 5 ตัวท้ายกลับด้าน)"""
+        recent_count = np.minimum(12, self.n // 2)
+        split = np.where(recent_count > 0, self.n - recent_count, 0)
+        recent_len, older_len = self.n - split, split
+        recent = self.digits.counts(self.a + split, self.t).astype(float)
+        older = self.digits.counts(self.a, self.a + split).astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = recent / (older / np.maximum(older_len, 1)[:, None]) * np.maximum(recent_len, 1)[:, None]
+        ratio = np.where(older > 0, ratio, recent)
+        return np.argsort(-ratio, axis=1, kind='stable')
+
+    def pairs_top(self, m=TOP_PAIRS):
+        """m คู่เลขติดกันอันดับแรก — pair_analysis()['consecutivePairs']"""
+        cnt = self.pairs.counts(self.a, self.t)
+        group, tb = js_tiebreak(self.pairs, self.a)
+        return _top(np.lexsort((tb, group, -cnt), axis=-1), cnt > 0, m)
+
+    def pattern_top(self):
+        """pattern คู่-คี่ที่พบบ่อยสุด (bitmask, 1 = คี่) — pattern_analysis()['oddEven'][0]"""
+        cnt = self.patterns.counts(self.a, self.t)
+        order = np.lexsort((self.patterns.first_seen(self.a), -cnt), axis=-1)
+        return _top(order, cnt > 0, 1)[:, 0]
+
+    def gap_overdue(self, m=TOP_OVERDUE):
+        """m เลขท้าย 2 ตัวที่ overdue มากสุด — gap_analysis()['overdue']"""
+        tr = self.last2
+        cnt = tr.counts(self.a, self.t)
+        first, last = tr.nxt[self.a], tr.prv[self.t]
+        since = (self.t - 1)[:, None] - last
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg = (last - first) / (cnt - 1)
+            ratio = since / avg
+        overdue = (cnt >= 2) & (since > avg)
+        ratio = np.where(overdue, ratio, 0)
+        group, tb = js_tiebreak(tr, self.a)
+        return _top(np.lexsort((tb, group, -ratio, ~overdue), axis=-1), overdue, m)
+
+    def moving_average(self, window=5):
+        """predictedValue ของ moving_average_analysis (ใช้แค่ window + 4 งวดล่าสุด)"""
+        csum = np.r_[0, np.cumsum(self.lead)]
+        ma = np.floor((csum[window:] - csum[:-window]) / window + 0.5)   # ma[j] = งวด j .. j + window - 1
+        last, first = ma[self.t - window], ma[self.t - window - 4]
+        return np.maximum(0, np.floor(last + (last - first) / 5 + 0.5)).astype(np.int64)
+
+    def combined_points(self):
+        """คะแนนแยกตามแหล่ง (4, T, 10) — combined = น้ำหนัก · points (ลำดับเดียวกับ DEFAULT_WEIGHTS)"""
+        T, rows = len(self), np.arange(len(self))[:, None]
+        points = np.zeros((4, T, 10))
+        cnt, order = self.frequency()
+        seen = np.take_along_axis(cnt, order, axis=1) > 0
+        points[0][rows, order] = np.where(seen, 10 - np.arange(10), 0)
+        hot = self.hot_cold()
+        points[1][rows, hot[:, :5]] = 5 - np.arange(5)
+        points[2][rows, hot[:, ::-1][:, :5]] = 5 - np.arange(5)
+        pairs = self.pairs_top(5)
+        for i in range(5):
+            code = pairs[:, i]
+            ok = code >= 0
+            np.add.at(points[3], (np.nonzero(ok)[0], code[ok] // 10), 5 - i)
+            np.add.at(points[3], (np.nonzero(ok)[0], code[ok] % 10), 5 - i)
+        return points
+
+    @staticmethod
+    def combined_order(points, weights):
+        """ลำดับหลักของ combined ต่อชุดน้ำหนัก: weights (S, 4) → (S, T, 10)"""
+        scores = np.einsum('sk,ktd->std', np.asarray(weights, dtype=float), points)
+        return np.argsort(-scores, axis=2, kind='stable')
+
+    @staticmethod
+    def combos(top, count, length):
+        """predicted2/3 ของ combinedPrediction เป็นจำนวนเต็ม: top (…, 6) → (…, count)"""
+        idx = (np.arange(count)[:, None] + np.arange(length)[None, :]) % top.shape[-1]
+        return top[..., idx] @ (10 ** np.arange(length - 1, -1, -1))
+
+    # ---------- วัดผล ----------
+
+    def trials(self):
+        """ทุกเลขที่ออกในงวด t → (index จุดตัด, หลัก (m, w), ค่า (m,))"""
+        s = self.series
+        valid = s.valid[self.t]
+        cut = np.broadcast_to(np.arange(len(self))[:, None], valid.shape)[valid]
+        return cut, s.digits[self.t][valid].astype(np.int64), self.values[self.t][valid]
+
+    def evaluate(self, weights=(DEFAULT_WEIGHTS,)):
+        """hit rate ของทุกวิธี → (ผลต่อวิธี {ชื่อ: (hit, baseline)}, ผล combined ต่อชุดน้ำหนัก [(hit, hit 2 ตัว)])"""
+        if not len(self):
+            return {}, []
+        w = self.series.width
+        cut, dig, vals = self.trials()
+        if not len(cut):
+            return {}, []
+        rows = np.arange(len(self))[:, None]
+
+        def coverage(order):
+            member = np.zeros((len(self), 10), dtype=bool)
+            member[rows, order[:, :TOP_DIGITS]] = True
+            return member[cut[:, None], dig].mean()
+
+        def in_set(codes, target):
+            return (codes[cut] == target[:, None]).any(axis=1)
+
+        cnt, order = self.frequency()
+        top_f = np.where(np.take_along_axis(cnt, order, axis=1) > 0, order, order[:, :1])  # หลักที่ไม่เคยออกไม่นับ
+        gap = self.gap_overdue()
+        pairs = self.pairs_top()
+        pair_codes = dig[:, :-1] * 10 + dig[:, 1:]
+        odd = (dig % 2) @ (2 ** np.arange(w - 1, -1, -1))
+        pattern = self.pattern_top()
+        band = 10 ** w // 20
+        ma = self.moving_average()
+
+        results = {
+            'frequency': (coverage(top_f), TOP_DIGITS / 10),
+            'hotCold': (coverage(self.hot_cold()), TOP_DIGITS / 10),
+            'gap': (in_set(gap, vals % 100).mean(), ((gap >= 0).sum(1)[cut] / 100).mean()),
+            'pairs': ((pairs[cut][:, :, None] == pair_codes[:, None, :]).any(axis=(1, 2)).mean(),
+                      (1 - (1 - (pairs >= 0).sum(1)[cut] / 100) ** (w - 1)).mean()),
+            'pattern': ((pattern[cut] == odd).mean(), 1 / 2 ** w),
+            'movingAverage': ((np.abs(vals - ma[cut]) <= band).mean(), (2 * band + 1) / 10 ** w),
+        }
+
+        points = self.combined_points()
+        orders = self.combined_order(points, weights)
+        sweep = []
+        for order_s in orders:
+            p2 = self.combos(order_s[:, :6], 5, 2)
+            sweep.append((coverage(order_s), in_set(p2, vals % 100).mean()))
+        default = self.combined_order(points, [DEFAULT_WEIGHTS])[0]
+        results['combined'] = (coverage(default), TOP_DIGITS / 10)
+        results['combined 2 ตัว'] = (in_set(self.combos(default[:, :6], 5, 2), vals % 100).mean(), 5 / 100)
+        if w >= 3:
+            results['combined 3 ตัว'] = (in_set(self.combos(default[:, :6], 4, 3), vals % 1000).mean(), 4 / 1000)
+        return results, sweep
+
+    # ---------- เทียบกับการคำนวณใหม่ทั้ง window ----------
+
+    def window_series(self, i):
+        a, t = self.a[i], self.t[i]
+        s = self.series
+        return Series(s.dates[a:t], s.digits[a:t], s.valid[a:t])
+
+    def recompute(self, i):
+        """ผลทำนายของจุดตัด i ด้วย lottery_analysis.py แบบเดิม (คำนวณ window ใหม่ทั้งหมด)"""
+        sub = self.window_series(i)
+        comb = la.combined_prediction(sub)
+        methods = comb['methods']
+        pattern = methods['pattern']['oddEven']
+        return {
+            'frequency': [int(k) for k, _ in methods['frequency']['topNumbers']],
+            'hotCold': [int(x['digit']) for x in methods['hotCold']['hotDigits']],
+            'gap': [int(k) for k, _ in la.gap_analysis(sub)['overdue']],
+            'pairs': [int(k) for k, _ in methods['pairs']['consecutivePairs'][:TOP_PAIRS]],
+            'pattern': int(pattern[0][0].replace('O', '1').replace('E', '0'), 2) if pattern else -1,
+            'movingAverage': methods['movingAverage']['predictedValue'],
+            'combined': [int(d) for d in comb['topDigits']] + [int(x) for x in comb['predicted2']],
+        }
+
+    def verify(self, cuts):
+        """เทียบผลทำนายของ engine กับ recompute() ที่จุดตัด cuts → (จำนวนที่ตรวจ, [จุดที่ต่าง])"""
+        cnt, order = self.frequency()
+        seen = np.take_along_axis(cnt, order, axis=1) > 0
+        fast = {
+            'frequency': [order[i][seen[i]].tolist() for i in range(len(self))],
+            'hotCold': self.hot_cold()[:, :5].tolist(),
+            'gap': self.gap_overdue().tolist(),
+            'pairs': self.pairs_top().tolist(),
+            'pattern': self.pattern_top().tolist(),
+            'movingAverage': self.moving_average().tolist(),
+        }
+        top = self.combined_order(self.combined_points(), [DEFAULT_WEIGHTS])[0][:, :6]
+        fast['combined'] = np.c_[top, self.combos(top, 5, 2)].tolist()
+        checked, diffs = 0, []
+        for i in cuts:
+            checked += 1
+            try:
+                slow = self.recompute(i)
+            except Exception as e:
+                diffs.append(f"{self.series.dates[self.t[i]]} recompute: {type(e).__name__}: {e}")
+                continue
+            for name, expect in slow.items():
+                got = fast[name][i]
+                if isinstance(got, list):
+                    got = [x for x in got if x >= 0]
+                if got != expect:
+                    diffs.append(f"{self.series.dates[self.t[i]]} {name}: {got} != {expect}")
+        return checked, diffs
+
+
+# ========== Sweep ใน process pool ==========
+
+_SERIES = {}
+
+
+def _init(series):
+    _SERIES.update(series)
+
+
+def run_task(task):
+    """หนึ่ง (ประเภทรางวัล, window) กับทุกชุดน้ำหนัก → dict ของผล"""
+    kind, window, weights, min_history = task
+    t0 = time.perf_counter()
+    wf = WalkForward(_SERIES[kind], window, min_history)
+    results, sweep = wf.evaluate(weights)
+    return {'kind': kind, 'window': window, 'cuts': len(wf), 'results': results, 'sweep': sweep,
+            'ms': (time.perf_counter() - t0) * 1000}
+
+
+def run_sweep(series, windows, weights, processes=None, min_history=MIN_HISTORY):
+    tasks = [(kind, window, weights, min_history) for kind in series for window in windows]
+    processes = processes or os.cpu_count() or 1
+    if processes > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(min(processes, len(tasks)), initializer=_init, initargs=(series,)) as pool:
+            return list(pool.map(run_task, tasks))
+    _init(series)
+    return [run_task(task) for task in tasks]
+
+
+def scaled(s, scale):
+    """จำลองประวัติยาวขึ้น scale เท่า (ต่อ series ซ้ำ; วันที่ใช้แสดงผลเท่านั้น)"""
+    if scale <= 1:
+        return s
+    return Series([f"#{k}:{d}" for k in range(scale) for d in s.dates],
+                  np.concatenate([s.digits] * scale), np.concatenate([s.valid] * scale))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Walk-forward backtest ของวิธีทำนายใน lotteryAnalysis.js')
+    ap.add_argument('--input', help='lotteryStaticData.js (default: ไฟล์ของ extension)')
+    ap.add_argument('--kind', default='first', help='ประเภทรางวัล คั่นด้วย , (first, last2, front3, back3, ...)')
+    ap.add_argument('--windows', default=','.join(WINDOWS), help="จำนวนงวดที่ใช้ทำนาย คั่นด้วย , ('all' = ทั้งหมดก่อนหน้า)")
+    ap.add_argument('--min-history', type=int, default=MIN_HISTORY, help=f'งวดขั้นต่ำก่อนเริ่มทำนาย (default: {MIN_HISTORY})')
+    ap.add_argument('--sweep', action='store_true', help='ลองทุกชุดน้ำหนักของ combined (ความถี่, ร้อน, เย็น, คู่เลข)')
+    ap.add_argument('--processes', type=int, help='จำนวน process (default: จำนวน CPU)')
+    ap.add_argument('--verify', type=int, metavar='N', help='เทียบ N จุดตัดต่อ window กับการคำนวณใหม่ทั้ง window')
+    ap.add_argument('--bench', action='store_true', help='จับเวลาการคำนวณใหม่ทุกจุดตัดเพื่อเทียบ')
+    ap.add_argument('--scale', type=int, default=1, help='จำลองประวัติยาวขึ้น N เท่า')
+    args = ap.parse_args(argv)
+
+    kinds = [k for k in args.kind.split(',') if k]
+    unknown = [k for k in kinds if k not in la.TIERS]
+    if unknown:
+        ap.error(f"ไม่รู้จักประเภทรางวัล: {', '.join(unknown)}")
+    windows = [w for w in args.windows.split(',') if w]
+    if any(w != 'all' and (not w.isdigit() or int(w) < args.min_history) for w in windows):
+        ap.error(f"window ต้องเป็น 'all' หรือจำนวนเต็ม >= {args.min_history}")
+
+    matrix = DrawMatrix.from_file(args.input)
+    series = {k: scaled(matrix.series(k), args.scale) for k in kinds}
+    weights = list(itertools.product(*SWEEP_GRID)) if args.sweep else [DEFAULT_WEIGHTS]
+    print(f"📦 {len(matrix.dates) * args.scale:,} งวด, {len(kinds)} ประเภท × {len(windows)} window"
+          f" × {len(weights)} ชุดน้ำหนัก")
+
+    t = time.perf_counter()
+    reports = run_sweep(series, windows, weights, args.processes, args.min_history)
+    wall = time.perf_counter() - t
+
+    for r in reports:
+        print(f"\n🎯 {r['kind']} window {r['window']}: {r['cuts']:,} จุดตัด ({r['ms']:.0f} ms)")
+        if not r['results']:
+            print("   (ข้อมูลไม่พอ)")
+            continue
+        print(f"   {'วิธี':<16} {'hit':>7} {'สุ่ม':>7} {'เท่า':>6}")
+        for name, (hit, base) in r['results'].items():
+            lift = f"{hit / base:5.2f}x" if base else '   -  '
+            print(f"   {name:<16} {hit:7.1%} {base:7.1%} {lift:>6}")
+
+    if args.sweep:
+        rows = [(cov, p2, r['kind'], r['window'], w)
+                for r in reports for (cov, p2), w in zip(r['sweep'], weights)]
+        rows.sort(key=lambda x: (-x[0], -x[1]))
+        print(f"\n🏆 ชุดน้ำหนัก combined ที่ดีที่สุด (ความถี่, ร้อน, เย็น, คู่เลข) จาก {len(rows):,} แบบ")
+        for cov, p2, kind, window, w in rows[:10]:
+            mark = '  ← ค่าเดิม' if tuple(w) == DEFAULT_WEIGHTS else ''
+            print(f"   {kind:<7} window {window:>4}  {str(w):<22} 3 หลัก {cov:6.1%}  2 ตัว {p2:6.1%}{mark}")
+
+    cuts_total = sum(r['cuts'] for r in reports)
+    print(f"\n⏱️  {cuts_total:,} จุดตัด × {len(weights)} ชุดน้ำหนัก: {wall * 1000:.0f} ms")
+
+    if args.bench:
+        s = series[kinds[0]]
+        wf = WalkForward(s, windows[0], args.min_history)
+        sample = np.linspace(0, len(wf) - 1, min(len(wf), 20)).astype(int)
+        t = time.perf_counter()
+        for i in sample:
+            la.combined_prediction(wf.window_series(i))
+            la.gap_analysis(wf.window_series(i))
+        per_cut = (time.perf_counter() - t) / len(sample)
+        naive = per_cut * cuts_total * len(weights)
+        print(f"   คำนวณใหม่ทุกจุดตัด: ~{per_cut * 1000:.1f} ms/จุด → ประมาณ {naive:,.0f} s "
+              f"(เร็วขึ้น ~{naive / wall:,.0f} เท่า)")
+
+    if args.verify:
+        failed = False
+        for kind in kinds:
+            for window in windows:
+                wf = WalkForward(series[kind], window, args.min_history)
+                cuts = np.linspace(0, len(wf) - 1, min(len(wf), args.verify)).astype(int) if len(wf) else []
+                checked, diffs = wf.verify(cuts)
+                failed |= bool(diffs)
+                print(f"   {'✅' if not diffs else '❌'} verify {kind} window {window}: "
+                      f"{checked - len({d.split(' ')[0] for d in diffs})}/{checked} จุดตัดตรงกัน")
+                for d in diffs[:5]:
+                    print(f"      {d}")
+        sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
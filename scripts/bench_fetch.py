@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+bench_fetch.py — วัดผล update_static_data.py แบบ end-to-end กับ mock_api.py (ไม่ต้องใช้ API จริง)
+
+แต่ละ scenario เปิด mock server ใหม่ (latency / error / rate limit ตามที่กำหนด) แล้วรัน generator
+ทั้งกระบวนการ (list → fetch → เขียนไฟล์) แบบไม่ใช้ cache วัด:
+  wall time, requests/วินาที, latency ต่อ request ฝั่ง client (p50/p99 รวม retry ที่ล้ม)
+  และตรวจว่าไฟล์ที่ได้ตรงกับ lotteryStaticData.js ต้นฉบับทุกงวด (เฉพาะงวดในช่วง YEARS_BACK)
+
+Usage:
+  python3 scripts/bench_fetch.py                                # ทุก scenario, workers 1 และ 8
+  python3 scripts/bench_fetch.py --scenario wan --workers 1 4 8 16
+  python3 scripts/bench_fetch.py --repeat 3 --json /tmp/bench.json
+"""
+
+import argparse, contextlib, io, json, os, statistics, sys, tempfile, time
+
+import mock_api
+import update_static_data as usd
+from http_pool import HttpClient
+
+# scenario → เงื่อนไขของ mock server (ms, สัดส่วน, request/วินาที)
+SCENARIOS = {
+    'local': {},
+    'wan': {'latency': 60, 'jitter': 40},
+    'flaky': {'latency': 60, 'jitter': 40, 'error_rate': 0.05},
+    'throttled': {'latency': 60, 'jitter': 40, 'rate_limit': 10},
+}
+
+
+class TimedClient(HttpClient):
+    """HttpClient ที่จดเวลาของทุก request (รวม request ที่ error)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = []
+
+    def get(self, url, headers=None):
+        t = time.perf_counter()
+        try:
+            return super().get(url, headers)
+        finally:
+            self.latencies.append(time.perf_counter() - t)
+
+
+def percentile(values, p):
+    """nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(p / 100 * len(ordered) + 0.5) - 1))]
+
+
+def run_once(routes, expected, conditions, workers, rate, seed, discovery='calendar'):
+    server, url = mock_api.start_in_thread(routes, seed=seed, **conditions)
+    client = TimedClient(timeout=15)
+    saved = usd.HTTP_CLIENT, usd.HTTP_CACHE
+    usd.HTTP_CLIENT, usd.HTTP_CACHE = client, None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'out.js')
+            argv = ['--api', url, '--output', output, '--workers', str(workers), '--rate', str(rate),
+                    '--no-cache', '--no-snapshot', '--no-index', '--discovery', discovery,
+                    '--journal', os.path.join(tmp, 'journal.jsonl'),
+                    '--failure-report', os.path.join(tmp, 'failures.json'),
+                    '--metrics', os.path.join(tmp, 'run_metrics.json')]  # ไม่ทับรายงานของรอบจริง
+            t = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                try:
+                    usd.main(argv)
+                except SystemExit:
+                    pass
+            wall = time.perf_counter() - t
+            got = usd.load_static_data(output) if os.path.exists(output) else []
+    finally:
+        usd.HTTP_CLIENT, usd.HTTP_CACHE = saved
+        client.close()
+        server.stop()
+
+    lat = client.latencies
+    return {
+        'wall': wall,
+        'requests': len(lat),
+        'rps': len(lat) / wall if wall else 0.0,
+        'p50_ms': percentile(lat, 50) * 1000,
+        'p99_ms': percentile(lat, 99) * 1000,
+        'connections': client.stats['connections'],
+        'server': {k: v for k, v in server.stats.items() if k.startswith('status_')},
+        'draws': len(got),
+        'correct': got == expected,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark update_static_data.py กับ mock API')
+    ap.add_argument('--scenario', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    ap.add_argument('--workers', nargs='+', type=int, default=[1, 8])
+    ap.add_argument('--rate', type=float, default=usd.DEFAULT_RATE, help='--rate ที่ส่งให้ generator')
+    ap.add_argument('--repeat', type=int, default=1, help='รันซ้ำกี่รอบต่อกรณี (รายงานรอบที่ wall time เป็นค่ามัธยฐาน)')
+    ap.add_argument('--input', help='lotteryStaticData.js ที่ใช้สร้าง payload (default: ไฟล์ของ extension)')
+    ap.add_argument('--seed', type=int, default=1, help='seed ของ jitter/error ใน mock server')
+    ap.add_argument('--discovery', choices=['calendar', 'list'], default='calendar', help='--discovery ที่ส่งให้ generator')
+    ap.add_argument('--json', help='บันทึกผลทั้งหมดเป็น JSON')
+    args = ap.parse_args(argv)
+
+    draws = sorted(usd.load_static_data(args.input or usd.OUTPUT), key=lambda d: d['date'], reverse=True)
+    routes = mock_api.Routes(draws)
+    cutoff = usd.cutoff_date()
+    expected = [d for d in draws if d['date'] >= cutoff]  # generator ตัดงวดที่เก่ากว่า YEARS_BACK ทิ้ง
+    print(f"🏁 Benchmark: {len(expected)} งวด, rate ≤{args.rate:g} req/s, discovery {args.discovery}, repeat {args.repeat}")
+    print(f"\n{'scenario':<10} {'workers':>7} {'wall s':>8} {'req':>5} {'req/s':>7} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'conns':>5}  {'ผลลัพธ์'}")
+
+    results = []
+    for name in args.scenario:
+        for workers in args.workers:
+            runs = [run_once(routes, expected, SCENARIOS[name], workers, args.rate, args.seed + i, args.discovery)
+                    for i in range(args.repeat)]
+            r = sorted(runs, key=lambda x: x['wall'])[len(runs) // 2]
+            r.update(scenario=name, workers=workers, conditions=SCENARIOS[name],
+                     wall_all=[x['wall'] for x in runs])
+            results.append(r)
+            errors = ' '.join(f"{k[7:]}×{v}" for k, v in sorted(r['server'].items()) if k != 'status_200')
+            verdict = '✅' if r['correct'] else f"❌ ได้ {r['draws']}/{len(expected)} งวด"
+            spread = f" (±{statistics.pstdev(r['wall_all']):.2f})" if args.repeat > 1 else ''
+            print(f"{name:<10} {workers:>7} {r['wall']:>8.2f} {r['requests']:>5} {r['rps']:>7.1f} "
+                  f"{r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['connections']:>5}  {verdict} {errors}{spread}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'draws': len(expected), 'rate': args.rate, 'results': results}, f, indent=2)
+        print(f"\n💾 {os.path.abspath(args.json)}")
+    if not all(r['correct'] for r in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
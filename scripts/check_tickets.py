@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+check_tickets.py — ตรวจสลากจำนวนมาก (หลักล้านบรรทัด) กับผลรางวัลแบบ streaming
+
+อ่านไฟล์ทีละ chunk ผ่าน generator pipeline (หน่วยความจำคงที่ไม่ว่าไฟล์จะใหญ่แค่ไหน):
+  อ่านบรรทัด → แบ่ง chunk → ตรวจกับ hash map ต่อรางวัล (NumberIndex) → เขียนเฉพาะใบที่ถูกรางวัล
+ตรวจแบบหลาย process ได้ด้วย --processes — ไฟล์ปกติส่งเป็นช่วง byte ให้ worker อ่านเอง
+(stdin ส่งเป็นบรรทัด) ผลลัพธ์ออกตามลำดับบรรทัดเดิมเสมอ
+
+ผลรางวัลมาจาก lotteryStaticData.js (default: งวดล่าสุด), response ของ API ที่บันทึกไว้
+หรือดึงสดจาก API — ทั้งหมดผ่าน parse_draw() ใน update_static_data.py
+
+Usage:
+  python3 scripts/check_tickets.py tickets.txt                     # ตรวจกับงวดล่าสุดใน static data
+  python3 scripts/check_tickets.py tickets.csv --column 2 --date 2026-03-16 --date 2026-03-01
+  python3 scripts/check_tickets.py tickets.txt --all-draws -o winners.tsv
+  python3 scripts/check_tickets.py tickets.txt --fetch latest      # ดึงผลงวดล่าสุดจาก API
+  python3 scripts/check_tickets.py tickets.txt --draw-json 16032569.json
+  zcat huge.txt.gz | python3 scripts/check_tickets.py - --processes 4
+
+Output (TSV, เฉพาะใบที่ถูกรางวัล): บรรทัด, เลข, งวด, รางวัล, เงินรางวัล
+"""
+
+import argparse, json, os, sys, time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from number_index import NumberIndex, TIERS
+
+DEFAULT_CHUNK = 50_000
+
+INDEX = None  # NumberIndex ของแต่ละ worker process (สร้างใน init_worker)
+
+
+# ========== Draw sources ==========
+
+def select_draws(args):
+    """รวมผลรางวัลจากทุก source ที่ระบุ (งวดซ้ำใช้ตัวที่มาทีหลัง)"""
+    from update_static_data import api_get, parse_draw, load_static_data, API, OUTPUT
+
+    draws = {}
+    for path in args.draw_json:
+        with open(path, encoding='utf-8') as f:
+            draw = parse_draw(json.load(f))
+        if not draw:
+            raise ValueError(f"{path}: ไม่ใช่ response ของ /lotto/{{id}}")
+        draws[draw['date']] = draw
+    for draw_id in args.fetch:
+        url = f"{args.api or API}/latest" if draw_id == 'latest' else f"{args.api or API}/lotto/{draw_id}"
+        draw = parse_draw(api_get(url))
+        if not draw:
+            raise ValueError(f"{url}: ไม่มีข้อมูลงวด")
+        draws[draw['date']] = draw
+
+    if args.date or args.all_draws or not draws:
+        static = {d['date']: d for d in load_static_data(args.static or OUTPUT)}
+        if args.all_draws:
+            wanted = list(static)
+        elif args.date:
+            missing = [d for d in args.date if d not in static]
+            if missing:
+                raise ValueError(f"ไม่มีงวด {', '.join(missing)} ใน static data")
+            wanted = args.date
+        else:
+            wanted = [max(static)]
+        for date in wanted:
+            draws.setdefault(date, static[date])
+    return list(draws.values())
+
+
+# ========== Pipeline ==========
+
+def read_chunks(stream, size):
+    """บรรทัดดิบทีละ chunk (list) — generator จึงไม่ถือทั้งไฟล์ไว้ในหน่วยความจำ"""
+    while True:
+        lines = list(islice(stream, size))
+        if not lines:
+            return
+        yield lines
+
+
+def byte_ranges(path, size):
+    """แบ่งไฟล์เป็นช่วง byte (start, end) ที่ขอบตรงกับต้นบรรทัด ประมาณ size บรรทัดต่อช่วง
+
+    ใช้กับ process pool: worker เปิดไฟล์อ่านช่วงของตัวเอง process หลักจึงไม่ต้องอ่าน/pickle ทุกบรรทัด
+    """
+    total = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        sample = f.read(64 * 1024)
+        step = max(1, size * len(sample) // max(1, sample.count(b'\n')))
+        start = 0
+        while start < total:
+            f.seek(min(start + step, total))
+            f.readline()  # เลื่อนไปต้นบรรทัดถัดไป
+            end = min(f.tell(), total)
+            yield start, end
+            start = end
+
+
+def check_lines(index, lines, column, delimiter):
+    """ตรวจหนึ่ง chunk → (จำนวนบรรทัด, จำนวนบรรทัดที่ไม่ใช่เลข 6 หลัก, [(บรรทัดใน chunk, เลข, งวด, รางวัล)])"""
+    match = index.match
+    hits, invalid = [], 0
+    for i, line in enumerate(lines):
+        fields = line.split(delimiter) if delimiter else (line,)
+        if column >= len(fields):
+            invalid += 1
+            continue
+        ticket = fields[column].strip().strip('"')
+        if len(ticket) != 6 or not ticket.isdigit():
+            invalid += 1  # header ของ CSV, บรรทัดว่าง ฯลฯ
+            continue
+        for di, ti in match(ticket):
+            hits.append((i, ticket, di, ti))
+    return len(lines), invalid, hits
+
+
+def init_worker(draws):
+    global INDEX
+    INDEX = NumberIndex.build(draws)
+
+
+def check_range_worker(path, start, end, column, delimiter):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        lines = f.read(end - start).decode('utf-8', 'replace').splitlines()
+    return check_lines(INDEX, lines, column, delimiter)
+
+
+def check_lines_worker(lines, column, delimiter):
+    return check_lines(INDEX, lines, column, delimiter)
+
+
+def run_serial(index, chunks, column, delimiter):
+    for lines in chunks:
+        yield check_lines(index, lines, column, delimiter)
+
+
+def run_parallel(draws, jobs, processes):
+    """ส่งงานให้ process pool โดยมีงานค้างไม่เกิน 2 × processes (หน่วยความจำคงที่) และคืนผลตามลำดับ"""
+    with ProcessPoolExecutor(processes, initializer=init_worker, initargs=(draws,)) as pool:
+        pending = deque()
+        for fn, *job in jobs:
+            pending.append(pool.submit(fn, *job))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='ตรวจสลากจำนวนมากกับผลรางวัล (streaming)')
+    ap.add_argument('input', help="ไฟล์เลขสลาก (หนึ่งเลขต่อบรรทัด หรือ CSV) — '-' = stdin")
+    ap.add_argument('-o', '--output', help='ไฟล์ผลลัพธ์ TSV (default: stdout)')
+    ap.add_argument('--column', type=int, default=0, help='คอลัมน์ของเลขสลากใน CSV (เริ่มที่ 0)')
+    ap.add_argument('--delimiter', default=',', help="ตัวคั่นคอลัมน์ ('' = ทั้งบรรทัดคือเลข)")
+    ap.add_argument('--static', help='lotteryStaticData.js (default: ไฟล์ของ extension)')
+    ap.add_argument('--date', action='append', default=[], help='งวดใน static data ที่จะตรวจ (ระบุซ้ำได้)')
+    ap.add_argument('--all-draws', action='store_true', help='ตรวจกับทุกงวดใน static data')
+    ap.add_argument('--draw-json', action='append', default=[], help='response ของ /lotto/{id} ที่บันทึกไว้')
+    ap.add_argument('--fetch', action='append', default=[], help="ดึงผลจาก API ตาม id หรือ 'latest'")
+    ap.add_argument('--api', help='API base URL (ใช้กับ --fetch)')
+    ap.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK, help=f'บรรทัดต่อ chunk (default: {DEFAULT_CHUNK})')
+    ap.add_argument('--processes', type=int, default=1, help='จำนวน process (1 = ตรวจใน process เดียว)')
+    args = ap.parse_args(argv)
+
+    try:
+        draws = select_draws(args)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"📦 ตรวจกับ {len(draws)} งวด: {', '.join(sorted(d['date'] for d in draws)[-5:])}"
+          f"{' ...' if len(draws) > 5 else ''}", file=sys.stderr)
+
+    index = NumberIndex.build(draws)
+    col, delim = args.column, args.delimiter
+    src = None
+    if args.processes > 1 and args.input != '-':
+        jobs = ((check_range_worker, args.input, a, b, col, delim) for a, b in byte_ranges(args.input, args.chunk_size))
+        results = run_parallel(draws, jobs, args.processes)
+    else:
+        src = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8', errors='replace')
+        chunks = read_chunks(src, args.chunk_size)
+        if args.processes > 1:
+            results = run_parallel(draws, ((check_lines_worker, lines, col, delim) for lines in chunks),
+                                   args.processes)
+        else:
+            results = run_serial(index, chunks, col, delim)
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+
+    t = time.perf_counter()
+    total = invalid = wins = 0
+    dates = index.dates
+    try:
+        out.write("line\tticket\tdate\ttier\tprize\n")
+        for n, bad, hits in results:
+            out.writelines(f"{total + i + 1}\t{ticket}\t{dates[di]}\t{TIERS[ti][2]}\t{TIERS[ti][3]}\n"
+                           for i, ticket, di, ti in hits)
+            total, invalid, wins = total + n, invalid + bad, wins + len(hits)
+    finally:
+        if src not in (None, sys.stdin):
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - t
+
+    print(f"✅ ตรวจ {total - invalid:,} ใบ ถูกรางวัล {wins:,} รายการ"
+          f"{f' (ข้าม {invalid:,} บรรทัดที่ไม่ใช่เลข 6 หลัก)' if invalid else ''}", file=sys.stderr)
+    print(f"⚡ {total / elapsed if elapsed else 0:,.0f} tickets/s ({elapsed:.2f} s, "
+          f"{args.processes} process)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+dataset_versions.py — static data แบบมี version (content-addressed) + delta ระหว่าง version
+
+โครงสร้าง:
+  dataset/manifest.json             version ล่าสุด, รายการ version และ delta ที่ใช้ได้
+  dataset/versions/{id}.json        ข้อมูลทั้งชุด (JSON array เดียวกับ LOTTERY_STATIC_DATA ใหม่ → เก่า)
+  dataset/deltas/{from}-{to}.json   ส่วนต่างจาก version เก่าไป version ล่าสุด:
+                                      added   งวดใหม่ (packed_format ถ้า round-trip ได้)
+                                      changed เฉพาะรางวัลที่ค่าเปลี่ยนของงวดเดิม
+                                      expired วันที่ของงวดที่หลุดช่วง YEARS_BACK
+id ของ version = 16 ตัวแรกของ sha256 ของข้อมูลทั้งชุด (ไฟล์ใน versions/ จึงตรวจตัวเองได้)
+ทุกครั้งที่ publish จะสร้าง delta จาก version ก่อนหน้า (ไม่เกิน --depth version) มายัง version ใหม่
+client/mirror ที่ถือ version N อยู่: อ่าน manifest → มี delta จาก N ก็โหลดแค่ delta แล้ว apply()
+(ตรวจ sha256 ของผลกับ delta) ไม่มีก็โหลด versions/{latest}.json ทั้งไฟล์
+
+สร้างด้วย: python3 scripts/update_static_data.py --dataset
+
+Usage:
+  python3 scripts/dataset_versions.py                                   # สรุป dataset/manifest.json
+  python3 scripts/dataset_versions.py --publish lotteryStaticData.js    # เพิ่ม version จากไฟล์ที่มีอยู่
+  python3 scripts/dataset_versions.py --verify                          # ตรวจ sha256 + apply ทุก delta
+  python3 scripts/dataset_versions.py --apply dataset/deltas/a-b.json --base old.json -o new.json
+"""
+
+import argparse, hashlib, json, os, sys
+from datetime import datetime, timezone
+
+from draw_model import to_dicts
+from lottery_archive import decode_shard, encode_shard, file_digest, write_atomic
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DIR = os.path.join(SCRIPT_DIR, '..', 'dataset')
+MANIFEST = 'manifest.json'
+DATASET_VERSION = 1
+DEFAULT_DEPTH = 8   # version เก่าที่เก็บไว้ (และสร้าง delta มายัง version ล่าสุดได้)
+ID_LENGTH = 16
+
+
+def canonical(draws):
+    """bytes ที่ใช้ hash: JSON array ใหม่ → เก่า (เหมือน body ของ lotteryStaticData.js แบบ json)"""
+    draws = sorted(to_dicts(draws), key=lambda d: d['date'], reverse=True)
+    return json.dumps(draws, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def version_id(sha):
+    return sha[:ID_LENGTH]
+
+
+def load_draws(path):
+    """draws จาก versions/{id}.json (JSON array) หรือ lotteryStaticData.js (json/packed)"""
+    if path.endswith('.js'):
+        from update_static_data import load_static_data
+        return load_static_data(path)
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ========== Delta ==========
+
+def diff(old, new):
+    """ส่วนต่าง old → new: (added, changed, expired) — changed เก็บเฉพาะ field ที่ค่าเปลี่ยน"""
+    old_by = {d['date']: d for d in to_dicts(old)}
+    new_by = {d['date']: d for d in to_dicts(new)}
+    added = [new_by[k] for k in sorted(new_by.keys() - old_by.keys(), reverse=True)]
+    expired = sorted(old_by.keys() - new_by.keys(), reverse=True)
+    changed = []
+    for k in sorted(new_by.keys() & old_by.keys(), reverse=True):
+        a, b = old_by[k], new_by[k]
+        if list(a) != list(b):
+            changed.append(b)  # key เปลี่ยน (ไม่ใช่รูปแบบ parse_draw) → ส่งทั้งงวด
+            continue
+        fields = {f: v for f, v in b.items() if a[f] != v}
+        if fields:
+            changed.append({'date': k, **fields})
+    return added, changed, expired
+
+
+def make_delta(old, new, old_sha, new_sha):
+    added, changed, expired = diff(old, new)
+    fmt, data = encode_shard(added) if added else ('json', b'[]')
+    return {
+        'v': DATASET_VERSION,
+        'from': version_id(old_sha),
+        'to': version_id(new_sha),
+        'sha256': new_sha,
+        'draws': len(new),
+        'added': {'format': fmt, 'data': json.loads(data)},
+        'changed': changed,
+        'expired': expired,
+    }
+
+
+def apply(draws, delta):
+    """draws ของ version delta['from'] + delta → draws ของ version delta['to'] (ใหม่ → เก่า)
+
+    ValueError ถ้า version ต้นทางไม่ตรง หรือผลลัพธ์มี sha256 ไม่ตรงกับที่ delta ระบุ
+    """
+    if delta.get('v') != DATASET_VERSION:
+        raise ValueError(f"ไม่รู้จัก delta version {delta.get('v')}")
+    base = canonical(draws)
+    if version_id(hashlib.sha256(base).hexdigest()) != delta['from']:
+        raise ValueError(f"ข้อมูลต้นทางไม่ใช่ version {delta['from']}")
+    by_date = {d['date']: d for d in json.loads(base)}
+    for date in delta['expired']:
+        by_date.pop(date, None)
+    for d in delta['changed']:
+        old = by_date.get(d['date'])
+        by_date[d['date']] = {**old, **d} if old and set(d) <= set(old) else d
+    added = delta['added']
+    for d in decode_shard(added['format'], json.dumps(added['data'])):
+        by_date[d['date']] = d
+    result = sorted(by_date.values(), key=lambda d: d['date'], reverse=True)
+    if hashlib.sha256(canonical(result)).hexdigest() != delta['sha256']:
+        raise ValueError(f"ผลของ delta {delta['from']} → {delta['to']} มี sha256 ไม่ตรง")
+    return result
+
+
+# ========== Store ==========
+
+def read_manifest(path=DEFAULT_DIR):
+    with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('v') != DATASET_VERSION:
+        raise ValueError(f"{path}: ไม่รู้จัก dataset version {manifest.get('v')}")
+    return manifest
+
+
+def _dump(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def publish(draws, path=DEFAULT_DIR, depth=DEFAULT_DEPTH):
+    """เพิ่ม draws เป็น version ใหม่ + delta จาก version ก่อนหน้า → (manifest, สร้าง version ใหม่หรือไม่)
+
+    เก็บไว้แค่ depth version ล่าสุด และเฉพาะ delta ที่ชี้มายัง version ล่าสุด (client ใช้ delta เดียวเสมอ)
+    manifest เขียนเป็นไฟล์สุดท้าย — ถ้าถูกขัดจังหวะ manifest เดิมยังชี้ไฟล์ที่ถูกต้อง
+    """
+    data = canonical(draws)
+    sha = hashlib.sha256(data).hexdigest()
+    vid = version_id(sha)
+    exists = os.path.exists(os.path.join(path, MANIFEST))
+    manifest = read_manifest(path) if exists else {'v': DATASET_VERSION, 'latest': None, 'versions': [], 'deltas': []}
+    if manifest['latest'] == vid:
+        return manifest, False
+
+    for sub in ('versions', 'deltas'):
+        os.makedirs(os.path.join(path, sub), exist_ok=True)
+    name = f"versions/{vid}.json"
+    if file_digest(os.path.join(path, name)) != sha:
+        write_atomic(os.path.join(path, name), data)
+    new = json.loads(data)
+
+    previous = [v for v in manifest['versions'] if v['id'] != vid][-(depth - 1):] if depth > 1 else []
+    deltas = []
+    for v in previous:
+        base_path = os.path.join(path, v['file'])
+        if file_digest(base_path) != v['sha256']:
+            continue  # version เก่าหาย/เสีย — client ของ version นั้นต้องโหลดทั้งชุด
+        delta = make_delta(load_draws(base_path), new, v['sha256'], sha)
+        body = _dump(delta)
+        file = f"deltas/{v['id']}-{vid}.json"
+        write_atomic(os.path.join(path, file), body)
+        deltas.append({'from': v['id'], 'to': vid, 'file': file, 'bytes': len(body),
+                       'sha256': hashlib.sha256(body).hexdigest(), 'added': delta_counts(delta)[0],
+                       'changed': len(delta['changed']), 'expired': len(delta['expired'])})
+
+    versions = previous + [{
+        'id': vid,
+        'sha256': sha,
+        'file': name,
+        'created': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'draws': len(new),
+        'from': new[-1]['date'] if new else None,
+        'to': new[0]['date'] if new else None,
+        'bytes': len(data),
+    }]
+    old_files = {v['file'] for v in manifest['versions']} | {d['file'] for d in manifest['deltas']}
+    manifest = {'v': DATASET_VERSION, 'latest': vid, 'versions': versions, 'deltas': deltas}
+    write_atomic(os.path.join(path, MANIFEST), json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8'))
+
+    keep = {v['file'] for v in versions} | {d['file'] for d in deltas}
+    for file in old_files - keep:
+        stale = os.path.join(path, file)
+        if os.path.exists(stale):
+            os.remove(stale)
+    return manifest, True
+
+
+def delta_counts(delta):
+    """(งวดที่เพิ่ม, เปลี่ยน, หมดอายุ) ของ delta"""
+    added = delta['added']
+    n = len(added['data']) if added['format'] == 'json' else len(decode_shard(added['format'], json.dumps(added['data'])))
+    return n, len(delta['changed']), len(delta['expired'])
+
+
+def verify(path=DEFAULT_DIR):
+    """ตรวจทุก version (sha256 ของไฟล์) และทุก delta (apply กับ version ต้นทางแล้วได้ version ปลายทาง)"""
+    manifest = read_manifest(path)
+    versions = {v['id']: v for v in manifest['versions']}
+    problems = []
+    for v in manifest['versions']:
+        if file_digest(os.path.join(path, v['file'])) != v['sha256']:
+            problems.append(f"{v['file']}: sha256 ไม่ตรงกับ manifest")
+    for d in manifest['deltas']:
+        file = os.path.join(path, d['file'])
+        if file_digest(file) != d['sha256']:
+            problems.append(f"{d['file']}: sha256 ไม่ตรงกับ manifest")
+            continue
+        if d['from'] not in versions:
+            continue  # version ต้นทางถูกตัดออกแล้ว ตรวจได้แค่ checksum
+        try:
+            with open(file, encoding='utf-8') as f:
+                apply(load_draws(os.path.join(path, versions[d['from']]['file'])), json.load(f))
+        except (OSError, ValueError) as e:
+            problems.append(f"{d['file']}: {e}")
+    return problems
+
+
+def write_output(draws, output):
+    """.js → lotteryStaticData.js (รูปแบบ json), อื่น ๆ → JSON array แบบเดียวกับ versions/"""
+    if output.endswith('.js'):
+        from update_static_data import render_js
+        data = render_js(draws).encode('utf-8')
+    else:
+        data = canonical(draws)
+    write_atomic(output, data)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='static data แบบมี version + delta ระหว่าง version')
+    ap.add_argument('--path', default=DEFAULT_DIR, help='โฟลเดอร์ dataset')
+    ap.add_argument('--publish', metavar='FILE', help='เพิ่ม version จาก lotteryStaticData.js หรือ JSON array')
+    ap.add_argument('--depth', type=int, default=DEFAULT_DEPTH,
+                    help=f'จำนวน version ที่เก็บ/สร้าง delta ให้ (default: {DEFAULT_DEPTH})')
+    ap.add_argument('--verify', action='store_true', help='ตรวจ sha256 ทุกไฟล์ และ apply ทุก delta')
+    ap.add_argument('--apply', metavar='DELTA', help='ไฟล์ delta ที่จะ apply กับ --base')
+    ap.add_argument('--base', help='ข้อมูลของ version ต้นทาง (lotteryStaticData.js หรือ versions/{id}.json)')
+    ap.add_argument('-o', '--output', help='ไฟล์ผลลัพธ์ของ --apply (.js = lotteryStaticData.js)')
+    args = ap.parse_args(argv)
+
+    if args.apply:
+        if not args.base or not args.output:
+            ap.error('--apply ต้องใช้คู่กับ --base และ --output')
+        with open(args.apply, encoding='utf-8') as f:
+            delta = json.load(f)
+        try:
+            draws = apply(load_draws(args.base), delta)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        write_output(draws, args.output)
+        added, changed, expired = delta_counts(delta)
+        print(f"✅ {delta['from']} → {delta['to']}: +{added} งวด, เปลี่ยน {changed}, หมดอายุ {expired} "
+              f"({len(draws)} งวด, sha256 ตรง) → {os.path.abspath(args.output)}")
+        return
+
+    if args.publish:
+        draws = load_draws(args.publish)
+        manifest, created = publish(draws, args.path, args.depth)
+        print(f"{'🆕' if created else '♻️ '} version {manifest['latest']} "
+              f"({'ใหม่' if created else 'ไม่เปลี่ยน'}, {len(draws)} งวด)")
+
+    try:
+        manifest = read_manifest(args.path)
+    except (OSError, ValueError) as e:
+        print(f"❌ เปิด dataset ไม่ได้: {e}")
+        sys.exit(1)
+    latest = manifest['versions'][-1]
+    print(f"📦 {os.path.abspath(args.path)}: latest {manifest['latest']} — {latest['draws']} งวด "
+          f"({latest['from']} – {latest['to']}), {latest['bytes'] / 1024:.0f} KB")
+    for v in manifest['versions'][:-1]:
+        print(f"   {v['id']}  {v['created']}  {v['draws']:4d} งวด  {v['bytes'] / 1024:6.1f} KB")
+    for d in manifest['deltas']:
+        print(f"   Δ {d['from']} → {d['to']}: +{d['added']} งวด, เปลี่ยน {d['changed']}, "
+              f"หมดอายุ {d['expired']} — {d['bytes']:,} B")
+
+    if args.verify:
+        problems = verify(args.path)
+        for p in problems:
+            print(f"   ❌ {p}")
+        print("✅ ทุก version และ delta ถูกต้อง" if not problems else f"❌ พบปัญหา {len(problems)} ไฟล์")
+        sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+digit_stats.py — สถิติหลักตามตำแหน่งและคู่เลขที่ออกร่วมกัน ของทุกประเภทรางวัล (รวมรางวัลที่ 4/5)
+
+pairAnalysis() / extractDigits() ใน lotteryAnalysis.js นับเฉพาะบาง field และ split string ใหม่ทุกครั้ง
+DigitStats สร้างครั้งเดียวต่อชุดข้อมูล (งวดเก่า → ใหม่) แล้วเพิ่มทีละงวดได้:
+  positions    หลัก × ตำแหน่ง ต่อรางวัล                  (ตำแหน่ง, 10)
+  digit_pairs  หลัก × หลัก × คู่ตำแหน่ง (i < j) ต่อรางวัล   (คู่ตำแหน่ง, 10, 10) — ในเลขเดียวกัน
+  endings      เลขท้าย 2 ตัว × เลขท้าย 2 ตัว ที่ออกในงวดเดียวกัน (100, 100)
+               นับเป็นจำนวนงวด จากเลขทุกตัวของงวด ยกเว้น front3 (ไม่ใช่ท้ายของเลขสลาก);
+               แนวทแยง = จำนวนงวดที่มีเลขท้ายนั้น
+
+ต่องวดเก็บแบบ sparse (key ของหลัก/คู่หลักที่ออกจริง uint16 + เลขท้ายที่มีในงวด ~7 KB) ไม่เก็บตารางเต็ม
+แต่ละสถิติเป็น WindowCounts: ผลรวมสะสมทุก BLOCK งวด (checkpoint) + ผลรวมทั้งหมด
+ผลรวมของ N งวดล่าสุด = ผลรวมทั้งหมด − ผลรวมสะสมที่งวด n − N
+(checkpoint ที่ใกล้ที่สุด ± นับงวดที่เหลือไม่เกิน BLOCK / 2 งวดใหม่ด้วย bincount / Xᵀ·X)
+จึงใช้เวลาคงที่ไม่ขึ้นกับ N หรือความยาวประวัติ; ผลของแต่ละช่วงถูก cache ไว้จนกว่าจะ add งวดใหม่
+
+Requires: pip install numpy
+
+Usage:
+  python3 scripts/digit_stats.py                              # เลขท้าย 2 ตัวที่ออกร่วมกันบ่อยสุด (ทุกงวด)
+  python3 scripts/digit_stats.py --last 24 --tier prize5      # หลักตามตำแหน่ง/คู่หลักของรางวัลที่ 5 ใน 24 งวด
+  python3 scripts/digit_stats.py --with 07 --last 48          # เลขท้ายที่ออกคู่กับ 07 บ่อยสุด
+  python3 scripts/digit_stats.py --verify                     # เทียบกับการนับจาก string ทีละงวด
+  python3 scripts/digit_stats.py --bench --scale 40           # เวลา build / add / query
+"""
+
+import argparse, sys, time, timeit
+
+import numpy as np
+
+from draw_model import to_draw
+from lottery_analysis import TIERS, DrawMatrix
+
+BLOCK = 16  # งวดต่อ checkpoint (ใหญ่ขึ้น = ใช้หน่วยความจำน้อยลง แต่ query ต้องนับงวดที่เหลือมากขึ้น)
+ENDING_TIERS = [k for k in TIERS if k != 'front3']
+
+WIDTHS = {kind: width for kind, (_, width, _) in TIERS.items()}
+PAIRS = {w: np.triu_indices(w, k=1) for w in set(WIDTHS.values())}  # คู่ตำแหน่ง (i, j) ของเลข w หลัก
+
+
+def _offsets(sizes):
+    out, pos = {}, 0
+    for kind, size in sizes.items():
+        out[kind] = (pos, pos + size)
+        pos += size
+    return out, pos
+
+
+POS_SPAN, POS_SIZE = _offsets({k: w * 10 for k, w in WIDTHS.items()})
+PAIR_SPAN, PAIR_SIZE = _offsets({k: len(PAIRS[w][0]) * 100 for k, w in WIDTHS.items()})
+ENDING_SIZE = 100 * 100
+UPPER = np.flatnonzero(np.triu(np.ones((100, 100), dtype=bool), k=1))  # คู่ a < b ใน endings
+
+
+class Ragged:
+    """แถวของแต่ละงวด (จำนวนไม่เท่ากัน) ต่อกันใน buffer เดียว — ต่อท้าย/ตัดท้ายได้ ตัดช่วงงวดได้ทันที"""
+
+    def __init__(self, dtype, width=None):
+        self.data = np.empty((256,) if width is None else (256, width), dtype=dtype)
+        self.indptr = [0]
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def extend(self, rows, counts):
+        """rows ของหลายงวดต่อกัน, counts = จำนวนแถวของแต่ละงวด"""
+        used = self.indptr[-1]
+        need = used + len(rows)
+        if need > len(self.data):
+            grown = np.empty((max(need, 2 * len(self.data)),) + self.data.shape[1:], dtype=self.data.dtype)
+            grown[:used] = self.data[:used]
+            self.data = grown
+        self.data[used:need] = rows
+        self.indptr.extend((used + np.cumsum(counts)).tolist())
+
+    def pop(self):
+        self.indptr.pop()
+
+    def rows(self, t0, t1):
+        return self.data[self.indptr[t0]:self.indptr[t1]]
+
+
+class WindowCounts:
+    """จำนวนของ key 0..size-1 สะสมตามงวด — รวมช่วง N งวดล่าสุดได้ในเวลาคงที่
+
+    delta(t0, t1) นับงวด [t0, t1) ใหม่จากข้อมูลดิบ (ใช้ตอนเพิ่มงวด และกับงวดที่อยู่ระหว่าง checkpoint)
+    """
+
+    def __init__(self, size, delta, block=BLOCK):
+        self.size = size
+        self.delta = delta
+        self.block = block
+        self.n = 0
+        self.checkpoints = [np.zeros(size, dtype=np.int32)]  # ผลรวมของ block × i งวดแรก
+        self.total = np.zeros(size, dtype=np.int32)
+        self.cache = {}  # งวดเริ่ม → ผลรวมของช่วงนั้น (ล้างเมื่อมีงวดเปลี่ยน)
+
+    def advance(self, n):
+        """ข้อมูลดิบมีเพิ่มจนครบ n งวด → ปรับผลรวม/checkpoint ทีละ block"""
+        self.cache.clear()
+        while self.n < n:
+            end = min(n, (self.n // self.block + 1) * self.block)
+            self.total += self.delta(self.n, end)
+            self.n = end
+            if end % self.block == 0:
+                self.checkpoints.append(self.total.copy())
+
+    def retreat(self):
+        """เอางวดล่าสุดออก (เรียกก่อนตัดข้อมูลดิบของงวดนั้น)"""
+        self.cache.clear()
+        if self.n % self.block == 0:
+            self.checkpoints.pop()
+        self.total -= self.delta(self.n - 1, self.n)
+        self.n -= 1
+
+    def prefix(self, t):
+        """ผลรวมของ t งวดแรก (checkpoint ที่ใกล้ที่สุด แล้วบวก/ลบงวดที่เหลือ ≤ block / 2 งวด)"""
+        if t >= self.n:
+            return self.total.copy()
+        b, r = divmod(t, self.block)
+        if r > self.block // 2 and b + 1 < len(self.checkpoints):
+            return self.checkpoints[b + 1] - self.delta(t, (b + 1) * self.block)
+        if r == 0:
+            return self.checkpoints[b].copy()
+        return self.checkpoints[b] + self.delta(b * self.block, t)
+
+    def window(self, last=None):
+        """ผลรวมของ last งวดล่าสุด (None = ทุกงวด) — read-only, ใช้ซ้ำจนกว่าจะมีงวดเปลี่ยน"""
+        start = 0 if last is None else max(0, self.n - last)
+        if start not in self.cache:
+            out = self.total.copy() if start == 0 else self.total - self.prefix(start)
+            out.flags.writeable = False
+            self.cache[start] = out
+        return self.cache[start]
+
+    def nbytes(self):
+        return sum(c.nbytes for c in self.checkpoints) + self.total.nbytes
+
+
+def _top(values, k, keys=None):
+    """k อันดับแรกที่มากกว่า 0 (เท่ากันเรียงตาม key) → [(key, count)]"""
+    keys = np.arange(len(values)) if keys is None else keys
+    k = min(k, int(np.count_nonzero(values)))
+    if k <= 0:
+        return []
+    idx = np.argpartition(-values, k - 1)[:k]
+    idx = idx[np.lexsort((keys[idx], -values[idx]))]
+    return [(int(keys[i]), int(values[i])) for i in idx]
+
+
+class DigitStats:
+    """สถิติหลัก/คู่เลขของทุกรางวัล — build ครั้งเดียว, add ทีละงวด, query ช่วง N งวดล่าสุด
+
+    ข้อมูลต่องวด (sparse): key ของหลักตามตำแหน่ง / คู่หลัก ของเลขทุกตัว (uint16 — ซ้ำได้)
+    + เลขท้าย 2 ตัวที่มีในงวด (bool × 100)
+    """
+
+    def __init__(self, block=BLOCK):
+        self.dates = []
+        self.position_keys = Ragged(np.uint16)
+        self.pair_keys = Ragged(np.uint16)
+        self.present = Ragged(bool, 100)
+        self.positions_ = WindowCounts(POS_SIZE, self._position_delta, block)
+        self.pairs_ = WindowCounts(PAIR_SIZE, self._pair_delta, block)
+        self.endings_ = WindowCounts(ENDING_SIZE, self._ending_delta, block)
+
+    @classmethod
+    def build(cls, draws, block=BLOCK):
+        return cls.from_matrix(DrawMatrix(draws), block)
+
+    @classmethod
+    def from_matrix(cls, matrix, block=BLOCK):
+        stats = cls(block)
+        stats._extend(matrix)
+        return stats
+
+    @classmethod
+    def from_static_data(cls, path=None, block=BLOCK):
+        return cls.from_matrix(DrawMatrix.from_file(path), block)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def _tables(self):
+        return self.positions_, self.pairs_, self.endings_
+
+    def _extend(self, matrix):
+        """ต่อท้ายทุกงวดใน matrix (เรียงเก่า → ใหม่): key ของทุกรางวัลวางเป็นคอลัมน์ของงวด แล้วตัดเลขที่ใช้ไม่ได้ทิ้ง"""
+        n = len(matrix.dates)
+        ends = np.zeros((n, 100), dtype=bool)
+        pos_keys, pos_ok, pair_keys, pair_ok = [], [], [], []
+        for kind, w in WIDTHS.items():
+            digits, valid = matrix.tiers[kind]
+            digs = np.maximum(digits, 0).astype(np.int32)  # (n, k, w) — เลขที่ใช้ไม่ได้ถูกตัดด้วย mask
+            i, j = PAIRS[w]
+            pos_keys.append((POS_SPAN[kind][0] + np.arange(w) * 10 + digs).reshape(n, -1))
+            pos_ok.append(np.repeat(valid, w, axis=1))
+            pair_keys.append((PAIR_SPAN[kind][0] + np.arange(len(i)) * 100
+                              + digs[:, :, i] * 10 + digs[:, :, j]).reshape(n, -1))
+            pair_ok.append(np.repeat(valid, len(i), axis=1))
+            if kind in ENDING_TIERS:
+                di, ki = np.nonzero(valid)
+                ends[di, digs[di, ki, -2] * 10 + digs[di, ki, -1]] = True
+        for rows, keys, ok in ((self.position_keys, pos_keys, pos_ok), (self.pair_keys, pair_keys, pair_ok)):
+            keys, ok = np.hstack(keys), np.hstack(ok)
+            rows.extend(keys[ok].astype(np.uint16), ok.sum(axis=1))
+        self.present.extend(ends, np.ones(n, dtype=np.int64))
+        self.dates.extend(matrix.dates)
+        for table in self._tables():
+            table.advance(len(self.dates))
+
+    def add(self, draw):
+        """เพิ่มงวดใหม่ (ต้องใหม่กว่างวดล่าสุด; วันเดียวกับงวดล่าสุด = แทนที่ เช่นผล live ที่ออกเพิ่ม)"""
+        draw = to_draw(draw)
+        if self.dates and draw.date < self.dates[-1]:
+            raise ValueError(f"งวด {draw.date} เก่ากว่างวดล่าสุด {self.dates[-1]} — สร้างใหม่ด้วย DigitStats.build")
+        if self.dates and draw.date == self.dates[-1]:
+            for table in self._tables():
+                table.retreat()
+            for rows in (self.position_keys, self.pair_keys, self.present):
+                rows.pop()
+            self.dates.pop()
+        self._extend(DrawMatrix([draw]))
+
+    # ---------- นับจากข้อมูลดิบของงวด [t0, t1) ----------
+
+    def _position_delta(self, t0, t1):
+        return np.bincount(self.position_keys.rows(t0, t1), minlength=POS_SIZE).astype(np.int32)
+
+    def _pair_delta(self, t0, t1):
+        return np.bincount(self.pair_keys.rows(t0, t1), minlength=PAIR_SIZE).astype(np.int32)
+
+    def _ending_delta(self, t0, t1):
+        x = self.present.rows(t0, t1).astype(np.int32)
+        return (x.T @ x).ravel()
+
+    # ---------- Queries (last = N งวดล่าสุด, None = ทุกงวด) ----------
+
+    def positions(self, kind, last=None):
+        """(ตำแหน่ง, 10) จำนวนครั้งที่หลักนั้นออกในตำแหน่งนั้น"""
+        a, b = POS_SPAN[kind]
+        return self.positions_.window(last)[a:b].reshape(WIDTHS[kind], 10)
+
+    def digit_pairs(self, kind, last=None):
+        """(คู่ตำแหน่ง, 10, 10) — คู่ตำแหน่งที่ p คือ (PAIRS[w][0][p], PAIRS[w][1][p])"""
+        a, b = PAIR_SPAN[kind]
+        return self.pairs_.window(last)[a:b].reshape(-1, 10, 10)
+
+    def top_digit_pairs(self, kind, k=10, last=None):
+        """คู่ (ตำแหน่ง i, ตำแหน่ง j, 'หลัก i หลัก j') ที่ออกบ่อยสุด"""
+        i, j = PAIRS[WIDTHS[kind]]
+        return [(int(i[key // 100]), int(j[key // 100]), f"{key % 100:02d}", n)
+                for key, n in _top(self.digit_pairs(kind, last).ravel(), k)]
+
+    def endings(self, last=None):
+        """(100, 100) สมมาตร — [a, b] = จำนวนงวดที่มีเลขท้าย a และ b, [a, a] = จำนวนงวดที่มี a"""
+        return self.endings_.window(last).reshape(100, 100)
+
+    def top_endings(self, k=10, last=None, partner=None):
+        """คู่เลขท้าย 2 ตัวที่ออกงวดเดียวกันบ่อยสุด → [('ab', 'cd', จำนวนงวด)]
+        partner='07' → เฉพาะคู่ของ 07 → [('07', 'cd', จำนวนงวด)]"""
+        flat = self.endings_.window(last)
+        if partner is None:
+            return [(f"{key // 100:02d}", f"{key % 100:02d}", n) for key, n in _top(flat[UPPER], k, UPPER)]
+        e = int(partner)
+        row = flat[e * 100:(e + 1) * 100].copy()
+        row[e] = 0
+        return [(f"{e:02d}", f"{key:02d}", n) for key, n in _top(row, k)]
+
+    def nbytes(self):
+        raw = sum(r.data.nbytes for r in (self.position_keys, self.pair_keys, self.present))
+        return raw + sum(t.nbytes() for t in self._tables())
+
+
+# ========== ตรวจกับการนับจาก string ==========
+
+def brute_force(dicts, last=None):
+    """นับแบบตรงไปตรงมาทีละงวด/ทีละ string (ใช้ตรวจ DigitStats)"""
+    dicts = sorted(dicts, key=lambda d: d['date'])
+    dicts = dicts[-last:] if last else dicts
+    pos = {k: np.zeros((w, 10), dtype=np.int64) for k, w in WIDTHS.items()}
+    pairs = {k: np.zeros((len(PAIRS[w][0]), 10, 10), dtype=np.int64) for k, w in WIDTHS.items()}
+    endings = np.zeros((100, 100), dtype=np.int64)
+    for d in dicts:
+        present = set()
+        for kind, (field, w, scalar) in TIERS.items():
+            for num in ([d[field]] if scalar else d[field]):
+                if len(num) != w or not num.isdigit():
+                    continue
+                for p, ch in enumerate(num):
+                    pos[kind][p, int(ch)] += 1
+                for p, (i, j) in enumerate(zip(*PAIRS[w])):
+                    pairs[kind][p, int(num[i]), int(num[j])] += 1
+                if kind in ENDING_TIERS:
+                    present.add(int(num[-2:]))
+        for a in present:
+            for b in present:
+                endings[a, b] += 1
+    return pos, pairs, endings
+
+
+def verify(draws, lasts=(1, 5, 24, None)):
+    """เทียบทุก query กับ brute_force และเทียบ build ทั้งชุดกับ build + add ทีละงวด → รายการที่ไม่ตรง"""
+    dicts = sorted(draws, key=lambda d: d['date'])
+    stats = DigitStats.build(dicts)
+    failures = []
+    for last in lasts:
+        pos, pairs, endings = brute_force(dicts, last)
+        for kind in TIERS:
+            if not np.array_equal(stats.positions(kind, last), pos[kind]):
+                failures.append(f"positions {kind} last={last}")
+            if not np.array_equal(stats.digit_pairs(kind, last), pairs[kind]):
+                failures.append(f"digit_pairs {kind} last={last}")
+        if not np.array_equal(stats.endings(last), endings):
+            failures.append(f"endings last={last}")
+
+    k = min(BLOCK + 3, len(dicts) - 1)
+    inc = DigitStats.build(dicts[:-k])
+    for d in dicts[-k:]:
+        inc.add(d)
+    inc.add(dicts[-1])  # วันเดียวกับงวดล่าสุด = แทนที่
+    for name in ('positions_', 'pairs_', 'endings_'):
+        a, b = getattr(stats, name), getattr(inc, name)
+        if a.n != b.n or not all(np.array_equal(x, y) for x, y in zip(a.checkpoints + [a.total],
+                                                                               b.checkpoints + [b.total])):
+            failures.append(f"incremental {name}")
+    return len(lasts) * (2 * len(TIERS) + 1) + 3, failures
+
+
+def _scaled(matrix, scale):
+    """ต่อข้อมูลซ้ำ scale เท่า (วันที่ใช้แสดงผลเท่านั้น)"""
+    if scale <= 1:
+        return matrix
+    m = object.__new__(DrawMatrix)
+    m.dates = [f"#{k}:{d}" for k in range(scale) for d in matrix.dates]
+    m.tiers = {kind: (np.concatenate([dg] * scale), np.concatenate([v] * scale))
+               for kind, (dg, v) in matrix.tiers.items()}
+    return m
+
+
+def _cold(stats, fn, number=200):
+    """เวลาต่อ query เมื่อยังไม่มี cache ของช่วงนั้น"""
+    def run():
+        for table in stats._tables():
+            table.cache.clear()
+        fn()
+    return timeit.timeit(run, number=number) / number
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='สถิติหลักตามตำแหน่ง / คู่เลขที่ออกร่วมกัน ของทุกรางวัล')
+    ap.add_argument('--input', help='lotteryStaticData.js (default: ไฟล์ของ extension)')
+    ap.add_argument('--last', type=int, help='เฉพาะ N งวดล่าสุด (default: ทุกงวด)')
+    ap.add_argument('--tier', choices=list(TIERS), help='แสดงหลักตามตำแหน่ง + คู่หลักของรางวัลนี้')
+    ap.add_argument('--with', dest='partner', metavar='NN', help='เลขท้าย 2 ตัวที่ออกคู่กับ NN บ่อยสุด')
+    ap.add_argument('--top', type=int, default=10, help='จำนวนอันดับที่แสดง')
+    ap.add_argument('--verify', action='store_true', help='เทียบกับการนับจาก string ทีละงวด')
+    ap.add_argument('--bench', action='store_true', help='วัดเวลา build / add / query')
+    ap.add_argument('--scale', type=int, default=1, help='จำลองประวัติยาวขึ้น N เท่า (ใช้กับ --bench)')
+    args = ap.parse_args(argv)
+
+    from update_static_data import load_static_data, OUTPUT
+    draws = load_static_data(args.input or OUTPUT)
+
+    if args.verify:
+        total, failures = verify(draws)
+        for f in failures:
+            print(f"   ❌ {f}")
+        print(f"{'✅' if not failures else '❌'} {total - len(failures)}/{total} ตรงกับการนับจาก string")
+        sys.exit(1 if failures else 0)
+
+    t = time.perf_counter()
+    matrix = _scaled(DrawMatrix(draws), args.scale)
+    stats = DigitStats.from_matrix(matrix)
+    built = time.perf_counter() - t
+    window = f"{min(args.last, len(stats))} งวดล่าสุด" if args.last else f"ทุกงวด ({len(stats):,})"
+    print(f"📦 {len(stats):,} งวด ({built * 1000:.1f} ms, {stats.nbytes() / 1024:.0f} KB)")
+
+    if args.tier:
+        pos = stats.positions(args.tier, args.last)
+        print(f"\n🔢 {args.tier} — หลักที่ออกบ่อยสุดแต่ละตำแหน่ง ({window})")
+        for p, row in enumerate(pos):
+            top = ', '.join(f"{d}×{row[d]}" for d in np.argsort(-row, kind='stable')[:3] if row[d])
+            print(f"   ตำแหน่ง {p + 1}: {top or '-'}")
+        print(f"\n🔗 {args.tier} — คู่หลัก (ตำแหน่ง i, j)")
+        for i, j, digits, n in stats.top_digit_pairs(args.tier, args.top, args.last):
+            print(f"   [{i + 1},{j + 1}] {digits}: {n}")
+    else:
+        label = f"ที่ออกคู่กับ {args.partner}" if args.partner else 'ที่ออกงวดเดียวกัน'
+        print(f"\n🔗 เลขท้าย 2 ตัว{label} ({window})")
+        for a, b, n in stats.top_endings(args.top, args.last, args.partner):
+            print(f"   {a} + {b}: {n} งวด")
+
+    if args.bench:
+        print()
+        n = len(stats)
+        draw = to_draw(draws[0])  # งวดล่าสุด — add ซ้ำวันเดิม = pop + add
+        sec = timeit.timeit(lambda: stats.add(draw), number=50) / 50 if args.scale == 1 else None
+        for last in (12, 48, n // 2 + 1, None):
+            q = {
+                'endings': lambda: stats.top_endings(10, last),
+                'positions': lambda: stats.positions('prize5', last),
+                'digit_pairs': lambda: stats.top_digit_pairs('prize5', 10, last),
+            }
+            times = ', '.join(f"{name} {_cold(stats, fn) * 1e6:.0f}/{timeit.timeit(fn, number=500) / 500 * 1e6:.0f} µs"
+                              for name, fn in q.items())
+            print(f"⏱️  last {last or 'all'} (ใหม่/cache): {times}")
+        if sec is not None:
+            print(f"⏱️  add หนึ่งงวด: {sec * 1e6:.0f} µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+draw_calendar.py — ปฏิทินวันออกรางวัล: คาดวันออกของแต่ละงวดจากประวัติใน lotteryStaticData.js
+
+หวยออกวันที่ 1 และ 16 ของทุกเดือน (slot) แต่บาง slot ถูกเลื่อนเป็นประจำ เช่น
+  1 ม.ค.  → 30 ธ.ค. ปีก่อน หรือ 2 ม.ค.      16 ม.ค. → 17 ม.ค. (วันครู)
+  1 พ.ค.  → 2 พ.ค. (วันแรงงาน)              1 ส.ค.  → 31 ก.ค. (วันหยุดทางศาสนา) ฯลฯ
+DrawCalendar จับคู่ทุกงวดในประวัติกับ slot ที่ใกล้ที่สุด แล้วจำว่า slot เดียวกัน (เดือน + วันที่)
+เคยเลื่อนกี่วัน → วันที่ผู้สมัครของ slot ในอนาคต เรียงตาม: ค่าเลื่อนของปีล่าสุด, ค่าที่เจอบ่อย, ไม่เลื่อน
+
+update_static_data.py ใช้ปฏิทินนี้ขอ /lotto/{id} ของงวดที่ขาดโดยตรง แล้วไล่ /list แค่จนเจอหน้าที่ทุกงวดรู้จักแล้ว
+(ปกติหน้าเดียว) เพื่อเก็บงวดที่ปฏิทินไม่รู้จัก — slot ที่หาไม่เจอทำให้ไล่ต่อจนถึงหน้าที่มีงวดนั้น
+
+Usage:
+  python3 scripts/draw_calendar.py                     # งวดถัดไป 6 งวด
+  python3 scripts/draw_calendar.py --from 2026-01-01 --to 2026-12-31
+  python3 scripts/draw_calendar.py --backtest          # เรียนจากปีก่อนหน้า ทายปีถัดไป วัดความแม่น
+"""
+
+import argparse
+from collections import Counter
+from datetime import date, timedelta
+
+SLOT_DAYS = (1, 16)
+MAX_CANDIDATES = 3
+MAX_SHIFT = 5  # งวดที่ห่างจาก slot เกินนี้ถือว่าไม่ใช่งวดตามปฏิทิน
+
+
+def draw_id(d):
+    """วันที่ → id ของ API (DDMM + ปี พ.ศ.)"""
+    return f"{d.day:02d}{d.month:02d}{d.year + 543}"
+
+
+def nominal_slots(start, end):
+    """slot (วันที่ 1/16) ทั้งหมดใน [start, end]"""
+    y, m = start.year, start.month
+    while date(y, m, 1) <= end:
+        for day in SLOT_DAYS:
+            if start <= date(y, m, day) <= end:
+                yield date(y, m, day)
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+
+
+def nearest_slot(d):
+    """slot ที่ใกล้วันนั้นที่สุด (ดู 16 เดือนก่อน ถึง 1 เดือนถัดไป)"""
+    prev = date(d.year - 1, 12, 16) if d.month == 1 else date(d.year, d.month - 1, 16)
+    nxt = date(d.year + 1, 1, 1) if d.month == 12 else date(d.year, d.month + 1, 1)
+    return min((prev, date(d.year, d.month, 1), date(d.year, d.month, 16), nxt), key=lambda s: abs((d - s).days))
+
+
+class DrawCalendar:
+    """ค่าเลื่อนวันของแต่ละ slot ที่เรียนจากประวัติ"""
+
+    def __init__(self, dates=()):
+        self.shifts = {}    # (เดือน, วันที่ของ slot) → [(ปี, จำนวนวันที่เลื่อน), ...]
+        self.observed = {}  # slot → วันที่ออกจริง
+        self.extra = []     # งวดที่ไม่ตรง slot ใด (ห่างเกิน MAX_SHIFT)
+        for d in sorted(dates):
+            self.add(d if isinstance(d, date) else date.fromisoformat(d))
+
+    @classmethod
+    def from_static_data(cls, path=None):
+        from update_static_data import load_static_data, OUTPUT
+        return cls(d['date'] for d in load_static_data(path or OUTPUT))
+
+    def add(self, d):
+        slot = nearest_slot(d)
+        offset = (d - slot).days
+        if abs(offset) > MAX_SHIFT:
+            self.extra.append(d)
+            return
+        self.observed[slot] = d
+        self.shifts.setdefault((slot.month, slot.day), []).append((slot.year, offset))
+
+    def candidates(self, slot):
+        """วันที่ที่งวดของ slot นี้น่าจะออก เรียงจากน่าจะเป็นมากสุด (ไม่เกิน MAX_CANDIDATES วัน)"""
+        if slot in self.observed:
+            return [self.observed[slot]]
+        history = [h for h in self.shifts.get((slot.month, slot.day), []) if h[0] < slot.year]
+        counts = Counter(off for _, off in history)
+        order = []
+        if history:
+            order.append(max(history)[1])  # ปีล่าสุดก่อน — กฎวันหยุดเปลี่ยนได้
+        order += [off for off, _ in counts.most_common()]
+        order.append(0)
+        return [slot + timedelta(days=off) for off in dict.fromkeys(order)][:MAX_CANDIDATES]
+
+    def expected(self, start, end):
+        """[(slot, [วันที่ผู้สมัคร])] ของทุก slot ที่มีวันที่ผู้สมัครอยู่ใน [start, end]"""
+        result = []
+        for slot in nominal_slots(start - timedelta(days=MAX_SHIFT), end + timedelta(days=MAX_SHIFT)):
+            cands = [c for c in self.candidates(slot) if start <= c <= end]
+            if cands:
+                result.append((slot, cands))
+        return result
+
+    def next_draws(self, after, count=6):
+        """วันออกรางวัลที่คาดไว้ (ตัวเลือกแรกของแต่ละ slot) หลังวัน after"""
+        result, start = [], after + timedelta(days=1)
+        while len(result) < count:
+            end = start + timedelta(days=62)
+            result += [(slot, cands) for slot, cands in self.expected(start, end) if cands[0] >= start]
+            start = end + timedelta(days=1)
+        return sorted(result, key=lambda x: x[1][0])[:count]
+
+    def is_draw_day(self, d):
+        """วันนี้น่าจะเป็นวันออกรางวัลหรือไม่ (ตัวเลือกแรกของ slot ตรงกับวันนี้)"""
+        return any(cands[0] == d for _, cands in self.expected(d, d))
+
+
+def backtest(dates):
+    """ทายแต่ละปีจากประวัติปีก่อนหน้าเท่านั้น → {ปี: (slot, ถูกตั้งแต่ตัวแรก, ถูกในผู้สมัคร, request ที่ใช้)}"""
+    dates = sorted(date.fromisoformat(d) for d in dates)
+    report = {}
+    for year in sorted({d.year for d in dates})[1:]:
+        cal = DrawCalendar(d for d in dates if d < date(year - 1, 12, 20))
+        actual = DrawCalendar(d for d in dates if d.year == year or (d.year == year - 1 and d.month == 12))
+        slots = [s for s in actual.observed if s.year == year]
+        first = within = probes = 0
+        for slot in slots:
+            cands = cal.candidates(slot)
+            real = actual.observed[slot]
+            first += cands[0] == real
+            within += real in cands
+            probes += cands.index(real) + 1 if real in cands else len(cands)
+        report[year] = (len(slots), first, within, probes)
+    return report
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='ปฏิทินวันออกรางวัลจากประวัติ')
+    ap.add_argument('--input', help='lotteryStaticData.js (default: ไฟล์ของ extension)')
+    ap.add_argument('--from', dest='start', help='แสดง slot ตั้งแต่ YYYY-MM-DD')
+    ap.add_argument('--to', dest='end', help='แสดง slot ถึง YYYY-MM-DD')
+    ap.add_argument('--backtest', action='store_true', help='วัดความแม่นโดยทายทีละปีจากปีก่อนหน้า')
+    args = ap.parse_args(argv)
+
+    from update_static_data import load_static_data, OUTPUT
+    dates = [d['date'] for d in load_static_data(args.input or OUTPUT)]
+    cal = DrawCalendar(dates)
+    shifted = {k: v for k, v in cal.shifts.items() if any(off for _, off in v)}
+    print(f"📅 เรียนจาก {len(dates)} งวด ({min(dates)} – {max(dates)}), slot ที่เคยเลื่อน {len(shifted)} แบบ"
+          f"{f', งวดนอกปฏิทิน {len(cal.extra)}' if cal.extra else ''}")
+
+    if args.backtest:
+        total = [0, 0, 0, 0]
+        for year, row in backtest(dates).items():
+            n, first, within, probes = row
+            total = [a + b for a, b in zip(total, row)]
+            print(f"   {year}: {n:2d} งวด  ถูกตัวแรก {first:2d}  อยู่ในผู้สมัคร {within:2d}  ใช้ {probes} request")
+        n, first, within, probes = total
+        print(f"✅ ถูกตัวแรก {first / n:.1%}, อยู่ในผู้สมัคร {within / n:.1%}, "
+              f"เฉลี่ย {probes / n:.2f} request/งวด (ไม่ต้องไล่ /list)")
+        return
+
+    if args.start or args.end:
+        start = date.fromisoformat(args.start) if args.start else date.today()
+        end = date.fromisoformat(args.end) if args.end else start + timedelta(days=180)
+        rows = cal.expected(start, end)
+    else:
+        rows = cal.next_draws(date.today())
+    for slot, cands in rows:
+        alt = f"  (หรือ {', '.join(c.isoformat() for c in cands[1:])})" if len(cands) > 1 else ''
+        mark = '' if cands[0] == slot else f"  ← เลื่อนจาก {slot.isoformat()}"
+        print(f"   {cands[0].isoformat()}  id {draw_id(cands[0])}{mark}{alt}")
+
+
+if __name__ == '__main__':
+    main()
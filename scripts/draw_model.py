@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+draw_model.py — Draw: ผลรางวัลหนึ่งงวดแบบกะทัดรัด (แทน dict ของ list ของ string)
+
+dict จาก parse_draw() หนึ่งงวดมี string ~170 ตัว (รางวัลที่ 4/5 อย่างเดียว 150 ตัว) + list 8 อัน
+Draw เก็บเลขทุกรางวัลเป็นจำนวนเต็มใน array('I') เดียว เรียงตาม TIERS ของ packed_format:
+  values   เลขทุกตัวต่อกัน (placeholder '------' = 10^หลัก เหมือน packed_format)
+  counts   จำนวนเลขของแต่ละรางวัล (bytes)
+  odd      {ตำแหน่งใน values: string เดิม} เฉพาะเลขที่ไม่ใช่ตัวเลขครบหลัก (ปกติ None)
+แปลงกลับเป็น dict รูปแบบเดิมได้ทุก byte (to_dict) และอ่านแบบ dict ได้ (draw['prize4'], draw.get, keys)
+โค้ดเดิมที่รับ dict จึงใช้ Draw ได้เลย ส่วนงานคำนวณเรียก draw.ints('prize4') ได้ array ของ int ทันที
+
+Usage:
+  python3 scripts/draw_model.py                        # ตรวจ round-trip + เทียบหน่วยความจำกับ dict
+  python3 scripts/draw_model.py --input /tmp/out.js --scale 40
+"""
+
+import argparse, json, sys, time
+from array import array
+
+from packed_format import TIERS
+
+ODD = 0xFFFFFFFF  # เลขที่ไม่ใช่ตัวเลขครบหลัก — ค่าจริงอยู่ใน Draw.odd
+KEYS = ['date'] + [t[0] for t in TIERS] + ['source']
+_TIER_POS = {t[0]: i for i, t in enumerate(TIERS)}
+
+# จำนวนเลขของงวดที่ประกาศครบ (ลำดับเดียวกับ TIERS) — ใช้ร่วมกันทั้ง update_static_data / draw_validator / live_poller
+EXPECTED = {
+    'first': 1, 'near1': 2, 'prize2': 5, 'prize3': 10, 'prize4': 50, 'prize5': 100,
+    'front3': 2, 'back3': 2, 'last2': 1,
+}
+
+
+def tier_numbers(draw, tier):
+    """เลขของรางวัลนั้นเป็น list เสมอ (รางวัลที่ 1 / เลขท้าย 2 ตัวเป็น string เดียว, ไม่มี = [])"""
+    value = draw.get(tier)
+    return [] if value is None else [value] if isinstance(value, str) else value
+
+
+def encode_value(s, width):
+    if len(s) == width and s.isdigit():
+        return int(s)
+    if s == '-' * width:
+        return 10 ** width
+    return ODD
+
+
+class Draw:
+    """ผลรางวัลหนึ่งงวด — read-only, อ่านแบบ dict ได้ (key/ลำดับเดียวกับ parse_draw)"""
+
+    __slots__ = ('date', 'source', 'values', 'counts', 'odd')
+
+    def __init__(self, date, values, counts, source='static', odd=None):
+        self.date = date
+        self.source = source
+        self.values = values
+        self.counts = counts
+        self.odd = odd
+
+    @classmethod
+    def from_dict(cls, d):
+        """dict รูปแบบ parse_draw → Draw (ValueError ถ้า key ไม่ตรงรูปแบบ จะแปลงกลับไม่ได้ทุก byte)"""
+        if list(d) != KEYS:
+            raise ValueError(f"งวด {d.get('date')} มี key ไม่ตรงรูปแบบ: {list(d)}")
+        values, counts, odd = array('I'), bytearray(), None
+        for name, width, scalar, _ in TIERS:
+            nums = (d[name],) if scalar else d[name]
+            if not isinstance(nums, (list, tuple)) or len(nums) > 255 or (scalar and not isinstance(d[name], str)):
+                raise ValueError(f"งวด {d['date']}: {name} ไม่ตรงรูปแบบ")
+            for s in nums:
+                v = encode_value(s, width)
+                if v == ODD:
+                    odd = odd or {}
+                    odd[len(values)] = s
+                values.append(v)
+            counts.append(len(nums))
+        return cls(d['date'], values, bytes(counts), d['source'], odd)
+
+    def _span(self, name):
+        i = _TIER_POS[name]
+        start = sum(self.counts[:i])
+        return start, start + self.counts[i]
+
+    def ints(self, name):
+        """เลขของรางวัลนั้นเป็น array('I') — placeholder = 10^หลัก, เลขผิดรูปแบบ = ODD"""
+        a, b = self._span(name)
+        return self.values[a:b]
+
+    def numbers(self, name):
+        """เลขของรางวัลนั้นเป็น list ของ string (รูปแบบเดิม)"""
+        a, b = self._span(name)
+        width = TIERS[_TIER_POS[name]][1]
+        blank, empty, odd = '-' * width, 10 ** width, self.odd
+        out = []
+        for pos in range(a, b):
+            v = self.values[pos]
+            out.append(str(v).zfill(width) if v < empty else blank if v == empty else odd[pos])
+        return out
+
+    def __getitem__(self, key):
+        if key == 'date':
+            return self.date
+        if key == 'source':
+            return self.source
+        if key not in _TIER_POS:
+            raise KeyError(key)
+        nums = self.numbers(key)
+        return nums[0] if TIERS[_TIER_POS[key]][2] else nums
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(KEYS)
+
+    def __iter__(self):
+        return iter(KEYS)
+
+    def __contains__(self, key):
+        return key in KEYS
+
+    def to_dict(self):
+        return {k: self[k] for k in KEYS}
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        if not isinstance(other, Draw):
+            return NotImplemented
+        return (self.date, self.source, self.values, self.counts, self.odd) == \
+               (other.date, other.source, other.values, other.counts, other.odd)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Draw({self.date} first={self['first']} {len(self.values)} numbers)"
+
+    def __reduce__(self):
+        return Draw, (self.date, self.values, self.counts, self.source, self.odd)
+
+
+def to_draw(d):
+    return d if isinstance(d, Draw) else Draw.from_dict(d)
+
+
+def to_dicts(draws):
+    """list ของ Draw/dict → list ของ dict (สำหรับ json.dumps / packed_format)"""
+    return [d.to_dict() if isinstance(d, Draw) else d for d in draws]
+
+
+def _deep_size(obj, seen=None):
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_deep_size(x, seen) for x in obj)
+    elif isinstance(obj, Draw):
+        size += sum(_deep_size(getattr(obj, a), seen) for a in Draw.__slots__)
+    return size
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='ตรวจ/วัดผล Draw model เทียบกับ dict')
+    ap.add_argument('--input', help='lotteryStaticData.js (default: ไฟล์ของ extension)')
+    ap.add_argument('--scale', type=int, default=1, help='ทำสำเนาข้อมูล N เท่าเพื่อจำลองประวัติหลายสิบปี')
+    args = ap.parse_args(argv)
+
+    from update_static_data import load_static_data, OUTPUT
+
+    dicts = load_static_data(args.input or OUTPUT)
+    dicts = [json.loads(json.dumps(d)) for _ in range(args.scale) for d in dicts]  # สำเนาจริง ไม่แชร์ string
+    draws = [Draw.from_dict(d) for d in dicts]
+    lossless = all(d.to_dict() == x and json.dumps(d.to_dict(), ensure_ascii=False) ==
+                   json.dumps(x, ensure_ascii=False) for d, x in zip(draws, dicts))
+    odd = sum(1 for d in draws if d.odd)
+
+    dict_bytes, draw_bytes = _deep_size(dicts), _deep_size(draws)
+    print(f"📦 {len(draws):,} งวด ({odd} งวดมีเลขผิดรูปแบบ)")
+    print(f"   dict : {dict_bytes / 1024 / 1024:7.2f} MB ({dict_bytes / len(draws):,.0f} B/งวด)")
+    print(f"   Draw : {draw_bytes / 1024 / 1024:7.2f} MB ({draw_bytes / len(draws):,.0f} B/งวด)"
+          f" — เล็กกว่า {dict_bytes / draw_bytes:.1f} เท่า")
+
+    t = time.perf_counter()
+    total = sum(int(n) for d in dicts for n in d['prize4'] + d['prize5'] if n.isdigit())
+    s_dict = time.perf_counter() - t
+    t = time.perf_counter()
+    total2 = sum(v for d in draws for tier in ('prize4', 'prize5') for v in d.ints(tier) if v < 1_000_000)
+    s_draw = time.perf_counter() - t
+    print(f"   ผลรวมรางวัลที่ 4/5: dict {s_dict * 1000:.1f} ms (int() ทุกตัว), Draw.ints {s_draw * 1000:.1f} ms")
+
+    ok = lossless and total == total2
+    print("✅ แปลงกลับเป็น dict ได้ตรงทุก byte" if ok else "❌ round-trip ไม่ตรง")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
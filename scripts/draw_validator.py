@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+draw_validator.py — ตรวจความถูกต้องของข้อมูลทั้งชุดด้วย NumPy (ก่อนเขียนไฟล์ทุกรอบ และก่อน merge ผล live)
+
+parse_draw() เติม placeholder ('------', '---') แทนรางวัลที่ไม่มี และ thai_to_iso() ใช้เดือน '01'
+เมื่อไม่รู้จักชื่อเดือน — ข้อมูลผิดแบบนี้ไม่มีใครเห็นจนกว่าสถิติจะเพี้ยน
+validate() โหลดทุกงวดเป็น array ก้อนเดียว (เลขทุกตัวต่อกัน + จำนวนเลขต่อรางวัล + วันที่)
+แล้วตรวจทุกข้อด้วย array operation (วน Python เฉพาะตอนสร้างรายการปัญหาที่เจอ):
+
+  error    format            เลขไม่ใช่ตัวเลขครบหลัก (จาก Draw.odd)
+           placeholder       ยังเป็น '------' / '---' / '--'
+           range             ค่าเกิน 10^หลัก
+           count             จำนวนเลขของรางวัลไม่ตรง EXPECTED
+           duplicate_number  เลข 6 หลักซ้ำกันในงวดเดียว (รางวัลที่ 1 ถึงรางวัลที่ 5)
+           near1             ข้างเคียงรางวัลที่ 1 ไม่ใช่ ±1 ของรางวัลที่ 1
+           date              วันที่ไม่ใช่ YYYY-MM-DD
+           duplicate_date    วันที่ซ้ำ
+           duplicate_slot    สองงวดอยู่ใน slot เดียวกัน (งวดวันที่ 1/16 — เช่นเดือนผิดจาก thai_to_iso)
+           duplicate_result  ผลรางวัลที่ 1/ข้างเคียง/รางวัลที่ 2 เหมือนงวดอื่นทุกตัว (API คืนงวดผิด)
+  warning  cadence           ห่างจากวันที่ 1/16 เกิน MAX_SHIFT วัน (ไม่ตรงปฏิทิน)
+           missing_slot      slot ระหว่างงวดแรกถึงงวดล่าสุดที่ไม่มีงวดเลย
+
+dedupe() เหลืองวดละหนึ่งชุดต่อวันที่ (เลือกชุดที่มีเลขครบมากสุด เท่ากันเลือกชุดที่มาทีหลัง)
+
+Requires: pip install numpy
+
+Usage:
+  python3 scripts/draw_validator.py                       # ตรวจ lotteryStaticData.js
+  python3 scripts/draw_validator.py --archive archive/    # ตรวจ archive ทุกปี
+  python3 scripts/draw_validator.py --scale 40 --bench    # จำลองประวัติ 40 เท่า วัดเวลา
+  python3 scripts/draw_validator.py --json                # รายการปัญหาเป็น JSON
+"""
+
+import argparse, json, sys, time
+from typing import NamedTuple
+
+import numpy as np
+
+from draw_calendar import MAX_SHIFT
+from draw_model import EXPECTED, ODD, to_draw
+from packed_format import TIERS
+
+NAMES = [t[0] for t in TIERS]
+WIDTHS = np.array([t[1] for t in TIERS], dtype=np.int64)
+TICKET = WIDTHS == 6  # รางวัลที่เป็นเลขสลากจริง — ห้ามซ้ำในงวดเดียว
+RESULT_KEY = 1 + 2 + 5  # รางวัลที่ 1 + ข้างเคียง + รางวัลที่ 2 (เลขต้นของแต่ละงวด) ใช้หาผลซ้ำข้ามงวด
+
+
+class Issue(NamedTuple):
+    check: str
+    severity: str       # 'error' | 'warning'
+    date: str
+    tier: str = None
+    detail: str = ''
+
+
+class DrawArrays:
+    """ทุกงวดในรูป array: values (เลขทุกตัวต่อกัน), counts (งวด × รางวัล), dates (datetime64[D])
+
+    tier_of / draw_of บอกว่าเลขแต่ละตัวใน values เป็นของรางวัล/งวดไหน (ไม่ต้องวน loop ต่องวด)
+    """
+
+    def __init__(self, draws):
+        self.draws = [to_draw(d) for d in draws]
+        n = len(self.draws)
+        self.date_strings = [d.date for d in self.draws]
+        self.dates = parse_dates(self.date_strings)
+        self.counts = np.frombuffer(b''.join(d.counts for d in self.draws), dtype=np.uint8) \
+            .reshape(n, len(TIERS)).astype(np.int64)
+        self.values = np.frombuffer(b''.join(d.values.tobytes() for d in self.draws), dtype=np.uint32) \
+            .astype(np.int64)
+        per_draw = self.counts.sum(axis=1)
+        self.offsets = np.concatenate(([0], np.cumsum(per_draw)[:-1])) if n else np.zeros(0, dtype=np.int64)
+        self.draw_of = np.repeat(np.arange(n), per_draw)
+        self.tier_of = np.repeat(np.tile(np.arange(len(TIERS)), n), self.counts.ravel())
+        self.limit = 10 ** WIDTHS[self.tier_of]
+        self.valid = self.values < self.limit
+
+    def __len__(self):
+        return len(self.draws)
+
+    def original(self, pos):
+        """string เดิมของเลขตำแหน่ง pos ใน values (สำหรับข้อความใน Issue)"""
+        d = self.draw_of[pos]
+        v, width = self.values[pos], TIERS[self.tier_of[pos]][1]
+        if v == ODD:
+            return self.draws[d].odd[int(pos - self.offsets[d])]
+        return '-' * width if v == 10 ** width else str(v).zfill(width)
+
+
+def parse_dates(strings):
+    """'YYYY-MM-DD' → datetime64[D] (รูปแบบผิด = NaT)"""
+    try:
+        return np.array(strings, dtype='datetime64[D]')
+    except ValueError:
+        out = np.full(len(strings), np.datetime64('NaT'), dtype='datetime64[D]')
+        for i, s in enumerate(strings):
+            try:
+                if len(s) == 10:
+                    out[i] = np.datetime64(s, 'D')
+            except ValueError:
+                pass
+        return out
+
+
+def slots_of(dates):
+    """วันที่ → (slot ที่ใกล้ที่สุดเป็น datetime64[D], เลข slot ต่อเนื่อง = เดือน × 2 + (วันที่ 16))
+
+    เหมือน draw_calendar.nearest_slot แต่ทำทั้ง array พร้อมกัน
+    """
+    month = dates.astype('datetime64[M]')
+    cands = np.stack([(month - 1).astype('datetime64[D]') + 15, month.astype('datetime64[D]'),
+                      month.astype('datetime64[D]') + 15, (month + 1).astype('datetime64[D]')])
+    dist = np.abs((cands - dates).astype(np.int64))
+    slot = cands[dist.argmin(axis=0), np.arange(len(dates))]
+    slot_month = slot.astype('datetime64[M]')
+    second = (slot - slot_month.astype('datetime64[D]')).astype(np.int64) > 0
+    return slot, slot_month.astype(np.int64) * 2 + second
+
+
+def slot_date(number):
+    return str(np.datetime64(int(number) // 2, 'M').astype('datetime64[D]') + 15 * (int(number) % 2))
+
+
+# ========== Checks ==========
+
+def check_numbers(a, expected=EXPECTED):
+    """ตรวจเลขของทุกงวด (format, placeholder, range, count, duplicate_number, near1, duplicate_result)"""
+    issues = []
+    date = a.date_strings
+
+    for check, mask in (('format', a.values == ODD),
+                        ('placeholder', a.values == a.limit),
+                        ('range', (a.values > a.limit) & (a.values != ODD))):
+        for pos in np.flatnonzero(mask):
+            issues.append(Issue(check, 'error', date[a.draw_of[pos]], NAMES[a.tier_of[pos]], repr(a.original(pos))))
+
+    want = np.array([expected[name] for name in NAMES])
+    for d, t in zip(*np.nonzero(a.counts != want)):
+        issues.append(Issue('count', 'error', date[d], NAMES[t], f"{a.counts[d, t]} เลข (ต้องมี {want[t]})"))
+
+    # เลขสลากซ้ำในงวดเดียว: key = งวด × 10^6 + เลข แล้วหา key ที่ซ้ำ
+    ticket = a.valid & TICKET[a.tier_of]
+    keys = a.draw_of[ticket] * 1_000_000 + a.values[ticket]
+    ordered = np.sort(keys)
+    for key in np.unique(ordered[1:][ordered[1:] == ordered[:-1]]):
+        tiers = sorted({NAMES[t] for t in a.tier_of[ticket][keys == key]}, key=NAMES.index)
+        issues.append(Issue('duplicate_number', 'error', date[key // 1_000_000], ','.join(tiers),
+                            f"{key % 1_000_000:06d}"))
+
+    # ข้างเคียงรางวัลที่ 1 = รางวัลที่ 1 ± 1 (เฉพาะงวดที่มีครบและเป็นตัวเลข)
+    first, near = NAMES.index('first'), NAMES.index('near1')
+    ok = (a.counts[:, first] == 1) & (a.counts[:, near] == 2)
+    if ok.any():
+        base = a.offsets[ok] + a.counts[ok, :first].sum(axis=1)
+        nbase = a.offsets[ok] + a.counts[ok, :near].sum(axis=1)
+        f = a.values[base]
+        n = np.sort(np.stack([a.values[nbase], a.values[nbase + 1]], axis=1), axis=1)
+        want_near = np.sort(np.stack([(f - 1) % 1_000_000, (f + 1) % 1_000_000], axis=1), axis=1)
+        checked = a.valid[base] & a.valid[nbase] & a.valid[nbase + 1]
+        for i in np.flatnonzero(checked & (n != want_near).any(axis=1)):
+            issues.append(Issue('near1', 'error', date[np.flatnonzero(ok)[i]], 'near1',
+                                f"{n[i, 0]:06d},{n[i, 1]:06d} ไม่ติดกับ {f[i]:06d}"))
+
+    # ผลซ้ำข้ามงวด: เลข RESULT_KEY ตัวแรกของงวดเหมือนกันทุกตัว
+    head = a.counts[:, :NAMES.index('prize3')].sum(axis=1) == RESULT_KEY
+    if head.sum() > 1:
+        rows = a.values[a.offsets[head][:, None] + np.arange(RESULT_KEY)]
+        _, inverse, cnt = np.unique(rows, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        idx = np.flatnonzero(head)
+        for group in np.flatnonzero(cnt > 1):
+            same = [date[i] for i in idx[inverse == group]]
+            for d in same:
+                issues.append(Issue('duplicate_result', 'error', d, None,
+                                    f"ผลเหมือนงวด {', '.join(x for x in same if x != d)}"))
+    return issues
+
+
+def check_dates(strings, dates=None):
+    """ตรวจวันที่ของทุกงวดเทียบกับรอบออกรางวัลวันที่ 1/16 (date, duplicate_date, duplicate_slot, cadence, missing_slot)"""
+    issues = []
+    dates = parse_dates(strings) if dates is None else dates
+    bad = np.isnat(dates)
+    for i in np.flatnonzero(bad):
+        issues.append(Issue('date', 'error', strings[i], None, 'ไม่ใช่ YYYY-MM-DD'))
+    idx = np.flatnonzero(~bad)
+    if not len(idx):
+        return issues
+    dates = dates[idx]
+
+    uniq, first, cnt = np.unique(dates, return_index=True, return_counts=True)
+    for i, n in zip(first[cnt > 1], cnt[cnt > 1]):
+        issues.append(Issue('duplicate_date', 'error', strings[idx[i]], None, f"{n} งวด"))
+
+    # งวดละ slot: ใช้แต่ละวันที่ครั้งเดียว (ซ้ำวันรายงานไปแล้วข้างบน)
+    slot, number = slots_of(uniq)
+    offset = (uniq - slot).astype(np.int64)
+    off = np.abs(offset) > MAX_SHIFT
+    for i in np.flatnonzero(off):
+        issues.append(Issue('cadence', 'warning', str(uniq[i]), None,
+                            f"ห่างจากงวดวันที่ {slot[i]} {offset[i]:+d} วัน"))
+    regular = number[~off]
+    slots, first, cnt = np.unique(regular, return_index=True, return_counts=True)
+    for s in slots[cnt > 1]:
+        same = [str(x) for x in uniq[~off][regular == s]]
+        for d in same:
+            issues.append(Issue('duplicate_slot', 'error', d, None,
+                                f"งวดวันที่ {slot_date(s)} มีหลายงวด ({', '.join(same)})"))
+    if len(slots):
+        for s in np.setdiff1d(np.arange(slots[0], slots[-1] + 1), slots):
+            issues.append(Issue('missing_slot', 'warning', slot_date(s), None, 'ไม่มีงวดของ slot นี้'))
+    return issues
+
+
+class Report:
+    """ผลการตรวจ: issues เรียงตามวันที่ใหม่ → เก่า"""
+
+    def __init__(self, issues, draws, elapsed):
+        self.issues = sorted(issues, key=lambda x: (x.date, x.check), reverse=True)
+        self.draws = draws
+        self.elapsed = elapsed
+
+    @property
+    def errors(self):
+        return [x for x in self.issues if x.severity == 'error']
+
+    @property
+    def warnings(self):
+        return [x for x in self.issues if x.severity == 'warning']
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def counts(self):
+        out = {}
+        for x in self.issues:
+            out[x.check] = out.get(x.check, 0) + 1
+        return out
+
+    def summary(self):
+        if not self.issues:
+            return f"{self.draws} งวด ผ่านทุกข้อ ({self.elapsed * 1000:.1f} ms)"
+        checks = ', '.join(f"{k} {v}" for k, v in sorted(self.counts().items()))
+        return (f"{self.draws} งวด — error {len(self.errors)}, warning {len(self.warnings)} "
+                f"({checks}; {self.elapsed * 1000:.1f} ms)")
+
+    def to_dict(self):
+        return {'draws': self.draws, 'ok': self.ok, 'elapsed_ms': round(self.elapsed * 1000, 3),
+                'counts': self.counts(), 'issues': [x._asdict() for x in self.issues]}
+
+
+def validate(draws, expected=EXPECTED):
+    """ตรวจทุกข้อของข้อมูลทั้งชุด → Report"""
+    t = time.perf_counter()
+    a = draws if isinstance(draws, DrawArrays) else DrawArrays(draws)
+    issues = check_numbers(a, expected) + check_dates(a.date_strings, a.dates)
+    return Report(issues, len(a), time.perf_counter() - t)
+
+
+def result_key(draw):
+    """เลข RESULT_KEY ตัวแรกของงวด (รางวัลที่ 1 + ข้างเคียง + รางวัลที่ 2) — ใช้หาผลซ้ำโดยไม่ต้องเก็บทั้งงวด"""
+    return tuple(to_draw(draw).values[:RESULT_KEY])
+
+
+def validate_merge(dates, draw, results=None, expected=EXPECTED):
+    """ตรวจงวดใหม่หนึ่งงวดก่อน merge: เลขของงวดนั้น + วันที่เทียบกับวันที่ของงวดเดิม (dates)
+    + ผลซ้ำกับงวดเดิม (results = {วันที่: result_key} ถ้ามี)
+
+    คืนเฉพาะปัญหาของงวดนี้ — ปัญหาเดิมในไฟล์ไม่ควรกันผลใหม่
+    """
+    t = time.perf_counter()
+    draw = to_draw(draw)
+    issues = check_numbers(DrawArrays([draw]), expected)
+    issues += [x for x in check_dates([d for d in dates if d != draw.date] + [draw.date])
+               if x.date == draw.date]
+    key = result_key(draw)
+    same = [d for d, k in (results or {}).items() if k == key and d != draw.date]
+    if same and len(key) == RESULT_KEY:
+        issues.append(Issue('duplicate_result', 'error', draw.date, None, f"ผลเหมือนงวด {', '.join(same)}"))
+    return Report(issues, 1, time.perf_counter() - t)
+
+
+def dedupe(draws):
+    """งวดละหนึ่งชุดต่อวันที่ → (งวดที่เหลือเรียงใหม่ → เก่า, งวดที่ตัดทิ้ง)
+
+    เลือกชุดที่มีเลขใช้ได้มากสุด (ผลที่ประกาศครบกว่า) ถ้าเท่ากันเลือกชุดที่มาทีหลังใน draws
+    """
+    a = draws if isinstance(draws, DrawArrays) else DrawArrays(draws)
+    if not len(a):
+        return [], []
+    score = np.bincount(a.draw_of, weights=a.valid, minlength=len(a))
+    keys = np.array(a.date_strings)
+    # เรียงตามวันที่ แล้วในวันเดียวกัน คะแนน ↓, ลำดับ ↓ → ตัวแรกของแต่ละวันที่คือชุดที่เก็บ
+    order = np.lexsort((-np.arange(len(a)), -score, keys))
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = keys[order][1:] != keys[order][:-1]
+    return [a.draws[i] for i in order[keep][::-1]], [a.draws[i] for i in order[~keep]]
+
+
+def print_report(report, limit=20):
+    print(f"{'✅' if report.ok else '❌'} {report.summary()}")
+    for x in report.issues[:limit]:
+        icon = '❌' if x.severity == 'error' else '⚠️'
+        print(f"   {icon} {x.date} {x.check}{f' [{x.tier}]' if x.tier else ''}: {x.detail}")
+    if len(report.issues) > limit:
+        print(f"   ... อีก {len(report.issues) - limit} รายการ")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='ตรวจความถูกต้องของข้อมูลหวยทั้งชุด (NumPy)')
+    ap.add_argument('--input', help='lotteryStaticData.js (default: ไฟล์ของ extension)')
+    ap.add_argument('--archive', metavar='DIR', help='ตรวจ archive (lottery_archive.py) แทนไฟล์ static data')
+    ap.add_argument('--scale', type=int, default=1, help='ทำสำเนาข้อมูล N เท่า (ย้อนวันที่ไปทีละชุด) เพื่อวัดเวลา')
+    ap.add_argument('--bench', action='store_true', help='วัดเวลาแยกช่วงโหลด/ตรวจ')
+    ap.add_argument('--json', action='store_true', help='พิมพ์ผลเป็น JSON')
+    ap.add_argument('--limit', type=int, default=20, help='จำนวนปัญหาที่แสดง')
+    args = ap.parse_args(argv)
+
+    if args.archive:
+        from lottery_archive import Archive
+        draws = list(Archive(args.archive).draws())
+    else:
+        from update_static_data import load_static_data, OUTPUT
+        draws = load_static_data(args.input or OUTPUT)
+    draws = [to_draw(d) for d in draws]
+    if args.scale > 1:
+        draws = _scaled(draws, args.scale)
+
+    t = time.perf_counter()
+    arrays = DrawArrays(draws)
+    loaded = time.perf_counter() - t
+    report = validate(arrays)
+    if args.json:
+        json.dump(report.to_dict(), sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_report(report, args.limit)
+        if args.bench:
+            t = time.perf_counter()
+            unique, dropped = dedupe(arrays)
+            print(f"⏱️  {len(draws):,} งวด: โหลดเป็น array {loaded * 1000:.1f} ms, ตรวจ {report.elapsed * 1000:.1f} ms, "
+                  f"dedupe {(time.perf_counter() - t) * 1000:.1f} ms ({len(dropped)} ซ้ำ)")
+    sys.exit(0 if report.ok else 1)
+
+
+def _scaled(draws, scale):
+    """สำเนา scale ชุด ย้อนหลังชุดละช่วงปีของข้อมูล (slot ยังตรงปฏิทิน, ไม่มีวันที่ซ้ำ/ช่องว่างระหว่างชุด)
+    เลขของแต่ละชุดเลื่อนไปคนละค่า (mod 10^หลัก) → ไม่เป็นผลซ้ำข้ามชุด แต่ยังผ่าน/ไม่ผ่านทุกข้อเหมือนต้นฉบับ"""
+    from array import array
+    from draw_model import Draw
+    span = abs(int(draws[-1].date[:4]) - int(draws[0].date[:4])) or 1
+    widths = [t[1] for t in TIERS]
+    out, floor = [], None
+    for k in range(scale):
+        copy = []
+        for d in draws:
+            date = f"{int(d.date[:4]) - k * span:04d}{d.date[4:]}"
+            if floor and date >= floor:
+                continue
+            values, pos = array('I'), 0
+            for w, n in zip(widths, d.counts):
+                for v in d.values[pos:pos + n]:
+                    values.append((v + k * 7919) % 10 ** w if v < 10 ** w else v)
+                pos += n
+            copy.append(Draw(date, values, d.counts, d.source, d.odd))
+        out += copy
+        floor = min(x.date for x in out)
+    return out
+
+
+if __name__ == '__main__':
+    main()
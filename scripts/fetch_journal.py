@@ -0,0 +1,100 @@
+"""
+fetch_journal.py — checkpoint ของการดึงข้อมูลแต่ละรอบ (append-only JSONL)
+
+ทุกบรรทัดเป็น record หนึ่งรายการ:
+  {"type": "run",    "started": ..., "api": ..., "cutoff": ...}   เริ่มรอบใหม่
+  {"type": "draw",   "id": ..., "draw": {...}}                    ดึงงวดนี้สำเร็จ
+  {"type": "failed", "id": ..., "date": ..., "error": ...}         งวดนี้ล้มเหลว
+  {"type": "done",   "finished": ..., "draws": N, "failed": N}    เขียนไฟล์ output แล้ว
+
+ถ้ารอบก่อนถูกขัดจังหวะ ใช้ --resume เพื่ออ่าน journal เดิมแล้วดึงเฉพาะงวดที่ยังไม่มี
+journal จะถูกใช้ต่อก็ต่อเมื่อ run record ตรงกับรอบปัจจุบัน (api / cutoff / output) และรอบนั้นยังไม่ "done"
+ไม่อย่างนั้นจะเริ่ม journal ใหม่ — กันไม่ให้งวดจาก API หรือ output อื่นปนเข้ามา
+"""
+
+import json, os, threading, time
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'fetch_journal.jsonl')
+
+
+def load_journal(path):
+    """อ่าน journal → (run record ล่าสุด, {id: draw}, {id: failure}, จบแล้วหรือยัง) — บรรทัดที่เขียนไม่จบจะถูกข้าม
+
+    run record ที่ตามหลัง "done" คือรอบใหม่ → งวดจากรอบที่จบไปแล้วไม่นับรวม
+    """
+    run, draws, failures, done = None, {}, {}, False
+    if not os.path.exists(path):
+        return run, draws, failures, done
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue  # บรรทัดสุดท้ายที่ถูกตัดตอนโดน kill
+            kind = rec.get('type')
+            if kind == 'run':
+                if done:
+                    draws, failures = {}, {}
+                run, done = rec, False
+            elif kind == 'draw':
+                draws[rec['id']] = rec['draw']
+                failures.pop(rec['id'], None)
+            elif kind == 'failed':
+                failures[rec['id']] = rec
+            elif kind == 'done':
+                done = True
+    return run, draws, failures, done
+
+
+def resumable(run, done, run_info):
+    """None ถ้าใช้ journal ต่อได้ ไม่อย่างนั้นคืนเหตุผลที่ต้องเริ่มใหม่"""
+    if run is None:
+        return 'ไม่มี journal เดิม'
+    if done:
+        return 'รอบก่อนจบไปแล้ว'
+    changed = [k for k, v in run_info.items() if run.get(k) != v]
+    if changed:
+        return f"run record ไม่ตรง ({', '.join(changed)})"
+    return None
+
+
+class FetchJournal:
+    """เขียน record ต่อท้ายไฟล์ทีละบรรทัด (flush ทุกครั้ง) ใช้ร่วมกันได้หลาย thread"""
+
+    def __init__(self, path=DEFAULT_PATH, resume=False, **run_info):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.draws, self.failures = {}, {}
+        if resume:
+            run, draws, failures, done = load_journal(path)
+            reason = resumable(run, done, run_info)
+            if reason:
+                print(f"   ⚠️  --resume: {reason} — เริ่ม journal ใหม่")
+                resume = False
+            else:
+                self.draws, self.failures = draws, failures
+        self.file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        self._write({'type': 'run', 'started': time.time(), 'resume': resume, **run_info})
+
+    def _write(self, rec):
+        line = json.dumps(rec, ensure_ascii=False, separators=(',', ':'))
+        with self.lock:
+            self.file.write(line + '\n')
+            self.file.flush()
+
+    def record_draw(self, item, draw):
+        self.draws[item['id']] = draw
+        self.failures.pop(item['id'], None)
+        self._write({'type': 'draw', 'id': item['id'], 'draw': draw if isinstance(draw, dict) else draw.to_dict()})
+
+    def record_failure(self, item, error):
+        rec = {'type': 'failed', 'id': item['id'], 'date': item.get('date'), 'error': str(error)}
+        self.failures[item['id']] = rec
+        self._write(rec)
+
+    def finish(self, draws, failed):
+        self._write({'type': 'done', 'finished': time.time(), 'draws': draws, 'failed': failed})
+
+    def close(self):
+        self.file.close()
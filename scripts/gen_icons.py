@@ -1,7 +1,26 @@
 #!/usr/bin/env python3
-"""Generate lottery-themed icons for Chrome extension."""
-from PIL import Image, ImageDraw, ImageFont
-import math, os
+"""Generate lottery-themed icons for Chrome extension.
+
+Usage:
+  python3 scripts/gen_icons.py                 # render เฉพาะขนาดที่เปลี่ยน (content-hash cache)
+  python3 scripts/gen_icons.py --force --bench # render ใหม่ทุกขนาด + เวลาต่อไฟล์
+  python3 scripts/gen_icons.py --sizes 16 32 48 128 --out-dir /tmp/icons
+"""
+from PIL import Image, ImageDraw
+import argparse, os, time
+
+import asset_render
+from asset_render import Job, default_font, find_font, load_font
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THONBURI = ('/System/Library/Fonts/Supplemental/Thonburi.ttc', '/System/Library/Fonts/ThonburiUI.ttc')
+ARIAL_BOLD = '/System/Library/Fonts/Supplemental/Arial Bold.ttf'
+
+
+def icon_font(size):
+    """Thonburi → Arial Bold → default font (โหลดครั้งเดียวต่อขนาด)"""
+    return load_font(find_font(*THONBURI), size) or load_font(ARIAL_BOLD, size) or default_font()
+
 
 def create_lottery_icon(size):
     """Create icon styled like a real Thai lottery ticket."""
@@ -52,15 +71,7 @@ def create_lottery_icon(size):
         # เขียน "สลากกินแบ่ง" ในแถบแดง (สำหรับ 128)
         if size >= 128:
             header_font_size = int(size * 0.08)
-            try:
-                for fn in ['/System/Library/Fonts/Supplemental/Thonburi.ttc', '/System/Library/Fonts/ThonburiUI.ttc']:
-                    if os.path.exists(fn):
-                        header_font = ImageFont.truetype(fn, header_font_size)
-                        break
-                else:
-                    header_font = None
-            except Exception:
-                header_font = None
+            header_font = load_font(find_font(*THONBURI), header_font_size)
             if header_font:
                 htxt = "สลากกินแบ่งรัฐบาล"
                 hbbox = draw.textbbox((0, 0), htxt, font=header_font)
@@ -75,15 +86,7 @@ def create_lottery_icon(size):
     if size <= 16:
         # 16px — ใช้ตัว "ห" ตัวเดียว
         font_size = int(size * 0.6)
-        try:
-            for fn in ['/System/Library/Fonts/Supplemental/Thonburi.ttc', '/System/Library/Fonts/ThonburiUI.ttc']:
-                if os.path.exists(fn):
-                    font = ImageFont.truetype(fn, font_size)
-                    break
-            else:
-                font = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial Bold.ttf', font_size)
-        except Exception:
-            font = ImageFont.load_default()
+        font = icon_font(font_size)
         text = "ห"
         bbox = draw.textbbox((0, 0), text, font=font)
         tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
@@ -92,16 +95,7 @@ def create_lottery_icon(size):
         draw.text((tx, ty), text, fill=(255, 223, 100, 255), font=font)
     else:
         font_size = int(size * 0.38) if size >= 128 else int(size * 0.42)
-        font = None
-        try:
-            for fn in ['/System/Library/Fonts/Supplemental/Thonburi.ttc', '/System/Library/Fonts/ThonburiUI.ttc']:
-                if os.path.exists(fn):
-                    font = ImageFont.truetype(fn, font_size)
-                    break
-            if font is None:
-                font = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial Bold.ttf', font_size)
-        except Exception:
-            font = ImageFont.load_default()
+        font = icon_font(font_size)
         
         text = "หวย"
         bbox = draw.textbbox((0, 0), text, font=font)
@@ -131,15 +125,19 @@ def create_lottery_icon(size):
     return img
 
 
-def main():
-    out_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'icons')
-    os.makedirs(out_dir, exist_ok=True)
-    
-    for size in [16, 48, 128]:
-        icon = create_lottery_icon(size)
-        path = os.path.join(out_dir, f'icon{size}.png')
-        icon.save(path, 'PNG')
-        print(f'✅ Created {path} ({size}x{size})')
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Generate extension icons')
+    ap.add_argument('--sizes', nargs='+', type=int, default=[16, 48, 128], help='ขนาด icon (px)')
+    ap.add_argument('--out-dir', default=os.path.join(ROOT_DIR, 'icons'), help='โฟลเดอร์ output')
+    asset_render.add_arguments(ap)
+    args = ap.parse_args(argv)
+
+    jobs = [Job(f'icon{size}.png', os.path.join(args.out_dir, f'icon{size}.png'), create_lottery_icon, (size,))
+            for size in args.sizes]
+    t = time.perf_counter()
+    results = asset_render.render_all(jobs, code=[__file__, asset_render.__file__], fonts=THONBURI + (ARIAL_BOLD,),
+                                      processes=args.processes, force=args.force, cache_path=args.cache)
+    asset_render.report(results, time.perf_counter() - t, args.bench)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,129 @@
+"""
+http_cache.py — cache response ของ lotto API ลง SQLite ข้ามรอบการรัน
+
+- /lotto/{id}  ผลย้อนหลังไม่เปลี่ยนแล้ว → เก็บถาวร ไม่ต้องถามซ้ำ
+               (ยกเว้นผลที่ยังประกาศไม่ครบ — ผู้เรียก put(partial=True) → อายุ PARTIAL_TTL)
+- /list/{page} เปลี่ยนเมื่อมีงวดใหม่ → อายุ 1 ชั่วโมง
+- /latest      เปลี่ยนระหว่างประกาศผล → อายุ 1 นาที
+หมดอายุแล้วจะ revalidate ด้วย ETag / Last-Modified (ได้ 304 = ใช้ของเดิม)
+และลบรายการที่ใช้ล่าสุดนานที่สุดออกเมื่อขนาดรวมเกิน max_bytes
+"""
+
+import os, re, sqlite3, threading, time
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'http_cache.sqlite')
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# (pattern ของ path, TTL วินาที) — None = ไม่หมดอายุ
+TTL_RULES = [
+    (re.compile(r'/lotto/[^/]+$'), None),
+    (re.compile(r'/list/\d+$'), 60 * 60),
+    (re.compile(r'/latest$'), 60),
+]
+DEFAULT_TTL = 0  # endpoint อื่น → revalidate ทุกครั้ง
+PARTIAL_TTL = 60  # response ที่ยังไม่ใช่ผลสุดท้าย (ผลงวดที่กำลังประกาศ)
+COLUMNS = ('url', 'body', 'etag', 'last_modified', 'fetched_at', 'accessed_at', 'size', 'partial')
+
+
+def ttl_for(url, partial=False):
+    path = url.split('?', 1)[0]
+    for pattern, ttl in TTL_RULES:
+        if pattern.search(path):
+            return PARTIAL_TTL if partial and ttl is None else ttl
+    return DEFAULT_TTL
+
+
+class ResponseCache:
+    """Cache แบบ key = URL เก็บ body + validator (ETag / Last-Modified) ใช้ร่วมกันได้หลาย thread"""
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        # cache รูปแบบเก่า (ไม่มี column partial) — ทิ้งได้เลย ไม่รู้ว่า entry ไหนเป็นผลที่ยังไม่ครบ
+        existing = tuple(r[1] for r in self.db.execute('PRAGMA table_info(responses)'))
+        if existing and existing != COLUMNS:
+            self.db.execute('DROP TABLE responses')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS responses (
+            url TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            size INTEGER NOT NULL,
+            partial INTEGER NOT NULL DEFAULT 0
+        )''')
+        self._evict()
+        self.db.commit()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def get(self, url):
+        """คืน dict ของ entry (body, etag, last_modified, fresh) หรือ None ถ้าไม่มี"""
+        with self.lock:
+            row = self.db.execute(
+                'SELECT body, etag, last_modified, fetched_at, partial FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, etag, last_modified, fetched_at, partial = row
+            ttl = ttl_for(url, partial)
+            fresh = ttl is None or time.time() - fetched_at < ttl
+            if fresh:
+                self.hits += 1
+            self.db.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            self.db.commit()
+        return {'body': bytes(body), 'etag': etag, 'last_modified': last_modified, 'fresh': fresh}
+
+    def validators(self, entry):
+        """header สำหรับ conditional request จาก entry เดิม"""
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url, body, etag=None, last_modified=None, partial=False):
+        """partial=True: ยังไม่ใช่ผลสุดท้าย — URL ที่ปกติไม่หมดอายุจะได้อายุ PARTIAL_TTL"""
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, sqlite3.Binary(body), etag, last_modified, now, now, len(body), int(partial))
+            )
+            self.misses += 1
+            self._evict()
+            self.db.commit()
+
+    def touch(self, url):
+        """server ตอบ 304 → ต่ออายุ entry เดิม"""
+        now = time.time()
+        with self.lock:
+            self.db.execute('UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?', (now, now, url))
+            self.db.commit()
+            self.revalidated += 1
+
+    def _evict(self):
+        total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self.db.execute('SELECT url, size FROM responses ORDER BY accessed_at').fetchall():
+            self.db.execute('DELETE FROM responses WHERE url = ?', (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self):
+        with self.lock:
+            count, size = self.db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+        return {'entries': count, 'bytes': size, 'hits': self.hits,
+                'revalidated': self.revalidated, 'misses': self.misses}
+
+    def close(self):
+        with self.lock:
+            self.db.close()
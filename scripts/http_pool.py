@@ -0,0 +1,133 @@
+"""
+http_pool.py — HTTP client แบบ keep-alive สำหรับ script ดึงข้อมูล
+
+เก็บ http.client connection ที่ว่างไว้ต่อ host แล้วใช้ซ้ำตลอดการรัน
+(ไม่ต้อง TCP/TLS handshake ใหม่ทุก request) และขอ response แบบ gzip
+โดยคลาย gzip ทีละ chunk ระหว่างอ่าน
+"""
+
+import http.client, threading, zlib
+from urllib.parse import urlsplit
+
+CHUNK_SIZE = 64 * 1024
+
+# error ที่แปลว่า server ปิด keep-alive connection ไปแล้ว → ลองใหม่ด้วย connection ใหม่ได้
+STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                ConnectionResetError, BrokenPipeError)
+
+
+class HTTPError(Exception):
+    def __init__(self, url, status, reason, retry_after=None):
+        super().__init__(f"HTTP {status} {reason}: {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after  # header Retry-After (string) ถ้า server ส่งมา
+
+
+class Response:
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+
+class HttpClient:
+    """Pool ของ connection ต่อ (scheme, host, port) ใช้ร่วมกันได้หลาย thread"""
+
+    def __init__(self, timeout=15, max_idle_per_host=16, user_agent='Mozilla/5.0'):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.user_agent = user_agent
+        self.idle = {}
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'connections': 0, 'reused': 0,
+                      'bytes_wire': 0, 'bytes_body': 0}
+
+    def _count(self, key, n=1):
+        with self.lock:
+            self.stats[key] += n
+
+    def _acquire(self, key):
+        with self.lock:
+            conns = self.idle.get(key)
+            if conns:
+                self.stats['reused'] += 1
+                return conns.pop(), True
+        return self._connect(key), False
+
+    def _connect(self, key):
+        self._count('connections')
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return cls(host, port, timeout=self.timeout)
+
+    def _release(self, key, conn):
+        with self.lock:
+            conns = self.idle.setdefault(key, [])
+            if len(conns) < self.max_idle_per_host:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def _read_body(self, resp):
+        """อ่าน body ทีละ chunk คลาย gzip ไปพร้อมกัน (ไม่ต้องถือ compressed body ทั้งก้อน)"""
+        encoding = (resp.getheader('Content-Encoding') or '').lower()
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding in ('gzip', 'x-gzip') else None
+        parts = []
+        wire = 0
+        while True:
+            chunk = resp.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            wire += len(chunk)
+            parts.append(decoder.decompress(chunk) if decoder else chunk)
+        if decoder:
+            parts.append(decoder.flush())
+        body = b''.join(parts)
+        self._count('bytes_wire', wire)
+        self._count('bytes_body', len(body))
+        return body
+
+    def get(self, url, headers=None):
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == 'https' else 80))
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        req_headers = {'User-Agent': self.user_agent, 'Accept-Encoding': 'gzip',
+                       'Connection': 'keep-alive'}
+        req_headers.update(headers or {})
+
+        self._count('requests')
+        conn, reused = self._acquire(key)
+        try:
+            try:
+                conn.request('GET', path, headers=req_headers)
+                resp = conn.getresponse()
+            except STALE_ERRORS:
+                if not reused:
+                    raise
+                # connection ที่ idle อยู่ถูก server ปิดไปแล้ว → เปิดใหม่แล้วลองอีกครั้ง
+                conn.close()
+                conn = self._connect(key)
+                conn.request('GET', path, headers=req_headers)
+                resp = conn.getresponse()
+            body = self._read_body(resp)
+        except Exception:
+            conn.close()
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return Response(resp.status, resp.reason, resp.headers, body)
+
+    def close(self):
+        with self.lock:
+            conns = [c for cs in self.idle.values() for c in cs]
+            self.idle.clear()
+        for c in conns:
+            c.close()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+live_poller.py — daemon ดึง /latest ตัวเดียวแทน extension ทุกเครื่อง (ใช้ api_get/parse_draw ของ generator)
+
+ช่วงเวลา poll ปรับตามสถานะ:
+  - วันออกรางวัล (จาก draw_calendar.py) ช่วง 14:30–16:30 (เวลาไทย) หรือผลงวดวันนี้ยังออกไม่ครบ → ทุก --fast วินาที
+  - นอกนั้น exponential backoff: --base วินาที คูณ 2 ทุกครั้งที่ไม่มีอะไรเปลี่ยน จนถึง --max
+    (แต่ไม่นอนเลยเวลาเปิด window ครั้งถัดไป)
+  - request ล้มเหลว → backoff เหมือนไม่มีการเปลี่ยนแปลง
+
+ตรวจการเปลี่ยนแปลงทีละรางวัล: งวดหนึ่งถือว่า "ครบ" เมื่อทุกรางวัลมีจำนวนเลขครบและไม่มี placeholder
+เขียนไฟล์เฉพาะเมื่อมีรางวัลเปลี่ยน:
+  --latest PATH   JSON ของผลล่าสุด + สถานะ (partial/complete) สำหรับให้ client อ่านแทนการยิง API เอง
+  --delta PATH    JSONL ต่อท้ายหนึ่งบรรทัดต่อการเปลี่ยนแปลง (เฉพาะรางวัลที่เปลี่ยน)
+  --output PATH   lotteryStaticData.js — แทรก/แทนงวดนั้นเมื่อผลครบแล้วเท่านั้น
+
+Usage:
+  python3 scripts/live_poller.py --latest /srv/lotto/latest.json --delta /srv/lotto/delta.jsonl
+  python3 scripts/live_poller.py --output lotteryStaticData.js --fast 10
+  python3 scripts/live_poller.py --once --api http://127.0.0.1:8765     # poll ครั้งเดียวแล้วออก
+"""
+
+import argparse, json, os, sys, time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import update_static_data as usd
+from update_static_data import EXPECTED, incomplete_tiers, tier_numbers
+from draw_calendar import DrawCalendar
+from static_stream import StaticDataWriter, iter_draws
+
+try:
+    import draw_validator
+except ImportError:  # ไม่มี numpy → merge โดยไม่ตรวจ
+    draw_validator = None
+
+WINDOW = ('14:30', '16:30')  # เวลาประเทศไทย
+
+try:
+    TZ = ZoneInfo('Asia/Bangkok')
+except ZoneInfoNotFoundError:  # ไม่มี tz database (เช่น Windows ที่ไม่ได้ลง tzdata) — ไทยไม่มี DST
+    TZ = timezone(timedelta(hours=7), 'Asia/Bangkok')
+
+
+def bangkok_now():
+    return datetime.now(TZ)
+
+
+def diff_tiers(old, new):
+    """รางวัลที่ค่าต่างกัน (old = None → ทุกรางวัลที่มีค่า)"""
+    if old is None or old.get('date') != new.get('date'):
+        return [t for t in EXPECTED if tier_numbers(new, t)]
+    return [t for t in EXPECTED if old.get(t) != new.get(t)]
+
+
+def write_json_atomic(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        f.write('\n')
+    os.replace(tmp, path)
+
+
+def is_packed(path):
+    """ไฟล์ที่ generate ด้วย --format packed (LOTTERY_STATIC_PACKED อยู่ต่อจาก header)"""
+    with open(path, encoding='utf-8') as f:
+        return 'LOTTERY_STATIC_PACKED' in f.read(4096)
+
+
+def merge_static_data(path, draw):
+    """แทน/แทรกงวดนี้ใน lotteryStaticData.js แล้ว os.replace — รูปแบบเดิมของไฟล์ (json / packed)
+
+    งวดที่เก่ากว่า cutoff ของ generator (YEARS_BACK ปี) ถูกตัดทิ้งเหมือนตอน generate
+    ตรวจงวดนี้ด้วย draw_validator.validate_merge ก่อน os.replace — มี error = ValueError, ไฟล์เดิมไม่เปลี่ยน
+    """
+    cutoff = usd.cutoff_date()
+    packed = os.path.exists(path) and is_packed(path)
+    dates, results = [], {}
+
+    def merged():
+        if os.path.exists(path):
+            for d in iter_draws(path):
+                dates.append(d['date'])
+                if draw_validator:
+                    results[d['date']] = draw_validator.result_key(d)
+                if d['date'] != draw['date'] and d['date'] >= cutoff:
+                    yield d
+        yield draw
+
+    def check():
+        if draw_validator:
+            report = draw_validator.validate_merge(dates, draw, results)
+            if not report.ok:
+                raise ValueError('; '.join(f"{x.check}: {x.detail}" for x in report.errors))
+
+    if packed:
+        draws = sorted(merged(), key=lambda d: d['date'], reverse=True)
+        check()
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(usd.render_js(draws, packed=True))
+        os.replace(path + '.tmp', path)
+        return
+    with StaticDataWriter(path, usd.render_header) as writer:
+        for d in merged():
+            writer.add(d)
+        check()
+
+
+class LivePoller:
+    def __init__(self, api=usd.API, calendar=None, latest=None, delta=None, output=None,
+                 fast=15, base=60, cap=3600, window=WINDOW, now=bangkok_now):
+        self.api = api.rstrip('/')
+        self.calendar = calendar or DrawCalendar()
+        self.latest, self.delta, self.output = latest, delta, output
+        self.fast, self.base, self.cap = fast, base, cap
+        self.window = tuple(datetime.strptime(t, '%H:%M').time() for t in window)
+        self.now = now
+        self.interval = base
+        self.last = None
+        self.status = None
+        self.seq = 0
+        self.stats = {'polls': 0, 'errors': 0, 'changes': 0}
+        if latest and os.path.exists(latest):
+            with open(latest, encoding='utf-8') as f:
+                state = json.load(f)
+            self.last, self.status, self.seq = state.get('draw'), state.get('status'), state.get('seq', 0)
+
+    def draw_day(self, d):
+        return self.calendar.is_draw_day(d) if self.calendar.observed else d.day in (1, 16)
+
+    def in_window(self, now):
+        return self.draw_day(now.date()) and self.window[0] <= now.time() <= self.window[1]
+
+    def next_window(self, now):
+        """เวลาเปิด window ครั้งถัดไป (วันนี้ถ้ายังไม่ถึง 14:30 ของวันออกรางวัล) — timezone เดียวกับ now"""
+        d = now.date()
+        for _ in range(400):
+            start = datetime.combine(d, self.window[0], tzinfo=now.tzinfo)
+            if start > now and self.draw_day(d):
+                return start
+            d += timedelta(days=1)
+        return now + timedelta(seconds=self.cap)
+
+    def poll(self):
+        """ดึง /latest หนึ่งครั้ง → รางวัลที่เปลี่ยน ([] = ไม่เปลี่ยน, None = ล้มเหลว)"""
+        self.stats['polls'] += 1
+        try:
+            draw = usd.parse_draw(usd.api_get(f"{self.api}/latest"))
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"   ❌ {e}", file=sys.stderr)
+            return None
+        if not draw:
+            self.stats['errors'] += 1
+            return None
+
+        changed = diff_tiers(self.last, draw)
+        missing = incomplete_tiers(draw)
+        status = 'partial' if missing else 'complete'
+        if not changed and status == self.status:
+            return []
+
+        self.seq += 1
+        self.stats['changes'] += 1
+        stamp = self.now().strftime('%Y-%m-%dT%H:%M:%S')
+        if self.delta:
+            os.makedirs(os.path.dirname(os.path.abspath(self.delta)), exist_ok=True)
+            with open(self.delta, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'seq': self.seq, 'time': stamp, 'date': draw['date'], 'status': status,
+                                    'changed': {t: draw[t] for t in changed}}, ensure_ascii=False) + '\n')
+        if self.latest:
+            write_json_atomic(self.latest, {'seq': self.seq, 'updated': stamp, 'status': status,
+                                            'missing': missing, 'draw': draw})
+        if self.output and status == 'complete':
+            try:
+                merge_static_data(self.output, draw)
+            except ValueError as e:
+                self.stats['errors'] += 1
+                print(f"   ❌ ไม่ merge งวด {draw['date']}: {e}", file=sys.stderr)
+        note = f" (ยังไม่ครบ: {', '.join(missing)})" if missing else ''
+        print(f"   🔔 {stamp} งวด {draw['date']} {status}{note} — เปลี่ยน: {', '.join(changed) or 'สถานะ'}")
+        self.last, self.status = draw, status
+        return changed
+
+    def next_delay(self, changed):
+        """วินาทีก่อน poll ครั้งถัดไป"""
+        now = self.now()
+        today = now.date().isoformat()
+        today_pending = self.last is None or self.last['date'] != today or self.status != 'complete'
+        # ผลที่ยังออกไม่ครบของเมื่อวาน/วันนี้ (ประกาศช้ากว่า window) ก็ยัง poll ถี่
+        recent_partial = self.last and self.status == 'partial' and \
+            self.last['date'] >= (now.date() - timedelta(days=1)).isoformat()
+        if (self.in_window(now) and today_pending) or recent_partial:
+            self.interval = self.base
+            return self.fast
+        self.interval = self.base if changed else min(self.cap, self.interval * 2)
+        until_window = (self.next_window(now) - now).total_seconds()
+        return max(1.0, min(self.interval, until_window))
+
+    def run(self, max_polls=None, sleep=time.sleep):
+        while max_polls is None or self.stats['polls'] < max_polls:
+            changed = self.poll()
+            if max_polls is not None and self.stats['polls'] >= max_polls:
+                break
+            sleep(self.next_delay(changed))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Poll /latest ตัวเดียวสำหรับทั้ง fleet (adaptive interval)')
+    ap.add_argument('--api', default=usd.API, help=f'API base URL (default: {usd.API})')
+    ap.add_argument('--latest', help='ไฟล์ JSON ผลล่าสุด + สถานะ')
+    ap.add_argument('--delta', help='ไฟล์ JSONL บันทึกทุกการเปลี่ยนแปลง')
+    ap.add_argument('--output', help='lotteryStaticData.js ที่จะแทรกงวดใหม่เมื่อผลครบ')
+    ap.add_argument('--calendar-from', help='lotteryStaticData.js ที่ใช้เรียนวันออกรางวัล (default: ของ extension)')
+    ap.add_argument('--fast', type=float, default=15, help='วินาทีระหว่าง poll ช่วงประกาศผล (default: 15)')
+    ap.add_argument('--base', type=float, default=60, help='วินาทีเริ่มต้นของ backoff (default: 60)')
+    ap.add_argument('--max', type=float, default=3600, help='backoff สูงสุด (วินาที, default: 3600)')
+    ap.add_argument('--window', default='-'.join(WINDOW), help='ช่วงประกาศผล HH:MM-HH:MM (default: 14:30-16:30)')
+    ap.add_argument('--once', action='store_true', help='poll ครั้งเดียวแล้วออก')
+    args = ap.parse_args(argv)
+
+    calendar = DrawCalendar.from_static_data(args.calendar_from)
+    poller = LivePoller(args.api, calendar, args.latest, args.delta, args.output,
+                        args.fast, args.base, args.max, tuple(args.window.split('-')))
+    nxt = poller.next_window(poller.now())
+    print(f"📡 Live poller: {poller.api}/latest — window {args.window}, ครั้งถัดไป {nxt:%Y-%m-%d %H:%M}")
+    try:
+        poller.run(1 if args.once else None)
+    except KeyboardInterrupt:
+        pass
+    s = poller.stats
+    print(f"\n👋 poll {s['polls']} ครั้ง, เปลี่ยน {s['changes']} ครั้ง, ล้มเหลว {s['errors']} ครั้ง", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
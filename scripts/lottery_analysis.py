@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+lottery_analysis.py — LotteryAnalysis (lotteryAnalysis.js) ฉบับ Python/NumPy
+
+โหลดข้อมูลครั้งเดียวเป็น digit matrix ต่อประเภทรางวัล (งวด × เลข × หลัก)
+แล้วคำนวณทุกการวิเคราะห์ด้วย array operation แทน loop ต่อ string
+ผลลัพธ์มีรูปแบบ/ชื่อ key เดียวกับฝั่ง JS (ตรวจความตรงกันได้ด้วย --parity)
+
+Requires: pip install numpy
+
+Usage:
+  python3 scripts/lottery_analysis.py                       # วิเคราะห์ lotteryStaticData.js (first, 48 งวด)
+  python3 scripts/lottery_analysis.py --kind last2 --count all
+  python3 scripts/lottery_analysis.py --parity              # เทียบผลกับ lotteryAnalysis.js ผ่าน node
+"""
+
+import argparse, json, math, os, shutil, subprocess, sys, time
+from array import array
+
+import numpy as np
+
+from draw_model import Draw
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPT_DIR)
+
+# ประเภทรางวัล → (field, จำนวนหลัก, เป็นค่าเดี่ยวหรือไม่)
+TIERS = {
+    'first': ('first', 6, True),
+    'near1': ('near1', 6, False),
+    'prize2': ('prize2', 6, False),
+    'prize3': ('prize3', 6, False),
+    'prize4': ('prize4', 6, False),
+    'prize5': ('prize5', 6, False),
+    'front3': ('front3', 3, False),
+    'back3': ('back3', 3, False),
+    'last2': ('last2', 2, True),
+}
+
+
+def js_round(x):
+    """Math.round ของ JS (ปัด .5 ขึ้นเสมอ ต่างจาก round() ของ Python)"""
+    return math.floor(x + 0.5)
+
+
+def is_index_key(k):
+    # key ที่ JS ถือเป็น array index — Object.entries จะเรียงพวกนี้ตามค่าตัวเลขก่อนเสมอ
+    return k.isdigit() and (k == '0' or k[0] != '0') and int(k) < 2 ** 32 - 1
+
+
+def js_key_order(keys, first_seen):
+    """ลำดับ key แบบ Object.entries: index key จากน้อยไปมาก แล้วตามด้วย key อื่นตามลำดับที่ใส่"""
+    return sorted(range(len(keys)), key=lambda i: (0, int(keys[i]), 0) if is_index_key(keys[i])
+                  else (1, 0, first_seen[i]))
+
+
+def rank_entries(keys, counts, first_seen):
+    """เลียนแบบ Object.entries(obj).sort((a, b) => b[1] - a[1]) (sort ของ JS เป็น stable)"""
+    order = js_key_order(keys, first_seen)
+    order.sort(key=lambda i: -counts[i])
+    return [[keys[i], counts[i]] for i in order]
+
+
+def count_codes(codes, width):
+    """นับ code (จำนวนเต็ม) ตามลำดับที่พบ → (keys, counts, first_seen)"""
+    codes = np.asarray(codes).ravel()
+    if codes.size == 0:
+        return [], [], []
+    uniq, first, cnt = np.unique(codes, return_index=True, return_counts=True)
+    keys = [str(int(u)).zfill(width) for u in uniq]
+    return keys, [int(c) for c in cnt], [int(f) for f in first]
+
+
+class Series:
+    """ข้อมูลของรางวัลหนึ่งประเภท เรียงงวดเก่า → ใหม่ (เหมือน LotteryData.getAnalysisData)
+
+    digits: int8 (งวด, เลข, หลัก) — -1 = ไม่ใช่ตัวเลข (placeholder '------' ฯลฯ)
+    valid:  bool (งวด, เลข) — เลขนั้นใช้ได้ (ครบทุกหลัก)
+    """
+
+    def __init__(self, dates, digits, valid):
+        self.dates = dates
+        self.digits = digits
+        self.valid = valid
+        self.width = digits.shape[2]
+
+    def __len__(self):
+        return len(self.dates)
+
+    def numbers(self):
+        """(m, หลัก) เฉพาะเลขที่ใช้ได้ เรียงตามลำดับ งวด → เลข"""
+        return self.digits[self.valid]
+
+    def values(self):
+        """ค่าตัวเลขของแต่ละเลข (m,) และ index งวดของมัน (m,)"""
+        weights = 10 ** np.arange(self.width - 1, -1, -1, dtype=np.int64)
+        vals = self.digits.astype(np.int64) @ weights
+        draw_idx = np.broadcast_to(np.arange(len(self))[:, None], self.valid.shape)
+        return vals[self.valid], draw_idx[self.valid]
+
+
+class DrawMatrix:
+    """ข้อมูลทุกงวดในรูป digit matrix — สร้างครั้งเดียวแล้วตัดเป็น Series ได้ทันที"""
+
+    def __init__(self, draws):
+        draws = sorted(draws, key=lambda d: d['date'])
+        self.dates = [d['date'] for d in draws]
+        self.tiers = {}
+        if draws and all(isinstance(d, Draw) and not d.odd for d in draws):
+            for kind, (field, width, _) in TIERS.items():
+                self.tiers[kind] = self._from_ints(draws, field, width)
+            return
+        for kind, (field, width, scalar) in TIERS.items():
+            columns = [[d[field]] if scalar else d[field] for d in draws]
+            k = max((len(c) for c in columns), default=0)
+            # ต่อทุกเลขเป็น buffer เดียว (เติม '-' ให้ช่องที่ขาด/ผิดรูปแบบ) แล้วแปลงเป็น array ทีเดียว
+            blank = '-' * width
+            flat = ''.join(num if len(num) == width else blank
+                           for col in columns for num in col + [blank] * (k - len(col)))
+            raw = np.frombuffer(flat.encode('ascii', 'replace'), dtype=np.uint8).reshape(len(draws), k, width)
+            digits = np.where(raw - 48 < 10, raw.astype(np.int16) - 48, -1).astype(np.int8)
+            self.tiers[kind] = (digits, (digits >= 0).all(axis=2))
+
+    @staticmethod
+    def _from_ints(draws, field, width):
+        """Draw เก็บเลขเป็น int อยู่แล้ว — แยกหลักด้วย // และ % แทนการ parse string
+        (placeholder = 10^หลัก → ทุกหลักเป็น -1 เหมือน '------')"""
+        empty = 10 ** width
+        segments = [d.ints(field) for d in draws]
+        k = max(len(seg) for seg in segments)
+        flat = array('I')
+        for seg in segments:
+            flat.extend(seg)
+            if len(seg) < k:
+                flat.extend([empty] * (k - len(seg)))
+        vals = np.frombuffer(flat, dtype=np.uintc).reshape(len(draws), k).astype(np.int64)
+        valid = vals < empty
+        digits = (vals[:, :, None] // 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)) % 10
+        digits[~valid] = -1
+        return digits.astype(np.int8), valid
+
+    @classmethod
+    def from_file(cls, path=None):
+        from update_static_data import load_static_data, OUTPUT
+        return cls(load_static_data(path or OUTPUT))
+
+    def series(self, kind='first', count=None):
+        """count งวดล่าสุด (None/'all' = ทั้งหมด) เรียงเก่า → ใหม่"""
+        digits, valid = self.tiers[kind]
+        start = 0 if count in (None, 'all') else max(0, len(self.dates) - int(count))
+        return Series(self.dates[start:], digits[start:], valid[start:])
+
+
+# ========== Analyses (ชื่อ/รูปแบบผลลัพธ์ตรงกับ lotteryAnalysis.js) ==========
+
+def frequency_analysis(s, digit_type='single'):
+    """1. Frequency Analysis — ความถี่ของแต่ละตัวเลข"""
+    nums = s.numbers().astype(np.int64)
+    if digit_type == 'pairs':
+        keys, counts, first = count_codes(nums[:, :-1] * 10 + nums[:, 1:], 2)
+    elif digit_type == 'whole':
+        vals, _ = s.values()
+        keys, counts, first = count_codes(vals, s.width)
+    else:
+        keys, counts, first = count_codes(nums, 1)
+    ranked = rank_entries(keys, counts, first)
+    return {
+        'frequency': dict(zip(keys, counts)),
+        'topNumbers': ranked[:10],
+        'bottomNumbers': ranked[-10:][::-1],
+        'total': len(s),
+    }
+
+
+def hot_cold_analysis(s):
+    """2. Hot-Cold Analysis — เลขร้อน (ออกบ่อยช่วงหลัง) / เลขเย็น"""
+    n = len(s)
+    recent_count = min(12, n // 2)
+    # data.slice(-0) ของ JS = ทั้ง array
+    split = n - recent_count if recent_count else 0
+    recent_len, older_len = n - split, split
+
+    nums = s.numbers()
+    _, draw_idx = s.values()
+    recent = np.bincount(nums[draw_idx >= split].ravel(), minlength=10)
+    older = np.bincount(nums[draw_idx < split].ravel(), minlength=10)
+
+    hot = []
+    for d in range(10):
+        r, o = int(recent[d]), int(older[d])
+        ratio = r / (o / (older_len or 1)) * (recent_len or 1) if o > 0 else r
+        hot.append({'digit': str(d), 'recent': r, 'older': o, 'ratio': ratio})
+    hot.sort(key=lambda x: -x['ratio'])
+
+    # งวดล่าสุดที่แต่ละเลขออก — unique จาก array กลับด้าน = ครั้งสุดท้าย
+    vals, idx = s.values()
+    last_appearance = {}
+    if vals.size:
+        uniq, pos = np.unique(vals[::-1], return_index=True)
+        last_idx = idx[::-1][pos]
+        for v, i in zip(uniq.tolist(), last_idx.tolist()):
+            last_appearance[str(v).zfill(s.width)] = {'index': i, 'drawsAgo': n - 1 - i, 'date': s.dates[i]}
+
+    return {
+        'hotDigits': hot[:5],
+        'coldDigits': hot[-5:][::-1],
+        'lastAppearance': last_appearance,
+        'recentPeriod': recent_count,
+    }
+
+
+def gap_analysis(s):
+    """3. Gap Analysis — ช่วงห่าง (จำนวนงวด) ระหว่างการออกของเลขท้าย 2 ตัว"""
+    n = len(s)
+    vals, idx = s.values()
+    last2 = vals % 100
+    keys, _, first = count_codes(last2, 2)
+
+    # เรียงเหตุการณ์ตามเลข (stable) → ช่วงห่าง = ผลต่าง index งวดที่ติดกันในกลุ่มเดียวกัน
+    order = np.argsort(last2, kind='stable')
+    k_sorted, i_sorted = last2[order], idx[order]
+    same = k_sorted[1:] == k_sorted[:-1]
+    gaps = (i_sorted[1:] - i_sorted[:-1])[same]
+    gap_keys = k_sorted[1:][same]
+
+    avg_gaps = {}
+    if gaps.size:
+        uniq, start, cnt = np.unique(gap_keys, return_index=True, return_counts=True)
+        sums = np.add.reduceat(gaps, start)
+        mins = np.minimum.reduceat(gaps, start)
+        maxs = np.maximum.reduceat(gaps, start)
+        # ครั้งสุดท้ายของแต่ละเลข = ตัวท้ายของกลุ่มใน i_sorted
+        group_end = np.r_[np.nonzero(~same)[0], len(k_sorted) - 1]
+        last_seen = dict(zip(k_sorted[group_end].tolist(), i_sorted[group_end].tolist()))
+        stats = {int(u): (int(sm), int(c), int(mn), int(mx))
+                 for u, sm, c, mn, mx in zip(uniq, sums, cnt, mins, maxs)}
+        for key in (keys[i] for i in js_key_order(keys, first)):
+            code = int(key)
+            if code not in stats:
+                continue
+            sm, c, mn, mx = stats[code]
+            seen = last_seen[code]
+            avg_gaps[key] = {
+                'avg': sm / c,
+                'min': mn,
+                'max': mx,
+                'lastSeen': seen,
+                'drawsSinceLastSeen': n - 1 - seen,
+                'count': c,
+            }
+
+    # avg = 0 เมื่อเลขนั้นออกซ้ำในงวดเดียวเท่านั้น — JS ได้ Infinity (ขึ้นก่อน เรียงตามลำดับเดิม)
+    overdue = [[k, v] for k, v in avg_gaps.items() if v['drawsSinceLastSeen'] > v['avg']]
+    overdue.sort(key=lambda kv: -(kv[1]['drawsSinceLastSeen'] / kv[1]['avg'] if kv[1]['avg'] else math.inf))
+
+    return {'gaps': avg_gaps, 'overdue': overdue[:10], 'totalDraws': n}
+
+
+def pair_analysis(s):
+    """4. Pair Analysis — คู่เลขติดกัน และคู่เลขทุกตำแหน่งในเลขเดียวกัน"""
+    nums = s.numbers().astype(np.int64)
+    consecutive = nums[:, :-1] * 10 + nums[:, 1:]
+    i, j = np.triu_indices(s.width, k=1)
+    lo, hi = np.minimum(nums[:, i], nums[:, j]), np.maximum(nums[:, i], nums[:, j])
+    combos = lo * 10 + hi
+
+    ck, cc, cf = count_codes(consecutive, 2)
+    pk, pc, pf = count_codes(combos, 2)
+    return {
+        'consecutivePairs': rank_entries(ck, cc, cf)[:15],
+        'combinations': rank_entries(pk, pc, pf)[:15],
+        'totalDraws': len(s),
+    }
+
+
+def pattern_analysis(s):
+    """5. Pattern Analysis — รูปแบบคู่-คี่, สูง-ต่ำ, ผลรวมหลัก"""
+    nums = s.numbers().astype(np.int64)
+    bits = 2 ** np.arange(s.width - 1, -1, -1, dtype=np.int64)
+    # pattern เป็น bitmask (1 = คี่ / สูง) → แปลงเป็น string เฉพาะค่าที่ไม่ซ้ำ
+    odd_codes = (nums % 2) @ bits
+    high_codes = (nums >= 5).astype(np.int64) @ bits
+    sums = nums.sum(axis=1)
+
+    def patterns(codes, on, off):
+        uniq, first, cnt = np.unique(codes, return_index=True, return_counts=True)
+        keys = [''.join(on if (int(u) >> b) & 1 else off for b in range(s.width - 1, -1, -1)) for u in uniq]
+        return rank_entries(keys, [int(c) for c in cnt], [int(f) for f in first])[:5]
+
+    buckets = (sums // 5) * 5
+    b_uniq, b_cnt = np.unique(buckets, return_counts=True)
+
+    return {
+        'oddEven': patterns(odd_codes, 'O', 'E') if nums.size else [],
+        'highLow': patterns(high_codes, 'H', 'L') if nums.size else [],
+        'sumDistribution': {f"{int(b)}-{int(b) + 4}": int(c) for b, c in zip(b_uniq, b_cnt)},
+        'averageDigitSum': float(sums.mean()) if sums.size else 0,
+        'totalDraws': len(s),
+    }
+
+
+def moving_average_analysis(s, window=5):
+    """6. Moving Average — ค่าเฉลี่ยเคลื่อนที่ของเลขตัวแรกในแต่ละงวด"""
+    weights = 10 ** np.arange(s.width - 1, -1, -1, dtype=np.int64)
+    values = s.digits[:, 0].astype(np.int64) @ weights
+    csum = np.r_[0, np.cumsum(values)]
+    avgs = (csum[window:] - csum[:-window]) / window
+
+    ma = []
+    for k, avg in enumerate(avgs.tolist()):
+        i = k + window - 1
+        ma.append({
+            'date': s.dates[i],
+            'value': int(values[i]),
+            'ma': js_round(avg),
+            'trend': ('up' if ma and avg > ma[-1]['ma'] else 'down') if i > window else 'flat',
+        })
+
+    recent = ma[-5:]
+    trend = (recent[-1]['ma'] - recent[0]['ma']) / len(recent) if len(recent) >= 2 else 0
+    predicted = js_round(recent[-1]['ma'] + trend) if recent else 0
+
+    return {
+        'movingAverages': ma,
+        'trend': 'ขาขึ้น' if trend > 0 else 'ขาลง' if trend < 0 else 'ทรงตัว',
+        'predictedValue': max(0, predicted),
+        'window': window,
+    }
+
+
+def combined_prediction(s):
+    """7. Combined Prediction — รวมคะแนนจากทุกวิธี"""
+    freq = frequency_analysis(s, 'single')
+    hot_cold = hot_cold_analysis(s)
+    gap = gap_analysis(s)
+    pairs = pair_analysis(s)
+    pattern = pattern_analysis(s)
+    ma = moving_average_analysis(s)
+
+    scores = np.zeros(10)
+    for idx, (num, _) in enumerate(freq['topNumbers']):
+        if len(num) == 1:
+            scores[int(num)] += (10 - idx) * 2
+    for idx, item in enumerate(hot_cold['hotDigits']):
+        scores[int(item['digit'])] += (5 - idx) * 3
+    for idx, item in enumerate(hot_cold['coldDigits']):
+        scores[int(item['digit'])] += (5 - idx) * 1.5
+    for idx, (pair, _) in enumerate(pairs['consecutivePairs'][:5]):
+        for d in pair:
+            scores[int(d)] += 5 - idx
+
+    order = np.argsort(-scores, kind='stable')
+    ranked = [[str(d), float(scores[d])] for d in order]
+    top = [d for d, _ in ranked[:6]]
+
+    def combos(count, length):
+        out = [''.join(top[(i + j) % len(top)] for j in range(length)) for i in range(count)]
+        return list(dict.fromkeys(out))
+
+    max_score, min_score = ranked[0][1], ranked[-1][1]
+    spread = max_score - min_score
+    confidence = min(85, max(15, js_round(spread / max_score * 100))) if max_score else 15
+
+    return {
+        'scores': ranked,
+        'predicted6': combos(3, 6),
+        'predicted3': combos(4, 3),
+        'predicted2': combos(5, 2),
+        'confidence': confidence,
+        'topDigits': top,
+        'methods': {
+            'frequency': freq,
+            'hotCold': hot_cold,
+            'gap': gap,
+            'pairs': pairs,
+            'pattern': pattern,
+            'movingAverage': ma,
+        },
+    }
+
+
+ANALYSES = {
+    'frequencyAnalysis': lambda s: frequency_analysis(s, 'single'),
+    'hotColdAnalysis': hot_cold_analysis,
+    'gapAnalysis': gap_analysis,
+    'pairAnalysis': pair_analysis,
+    'patternAnalysis': pattern_analysis,
+    'movingAverageAnalysis': moving_average_analysis,
+    'combinedPrediction': combined_prediction,
+}
+
+
+# ========== Parity check กับ lotteryAnalysis.js ==========
+
+NODE_RUNNER = """
+const fs = require('fs'), vm = require('vm');
+const [analysisJs, cases] = [process.argv[1], JSON.parse(fs.readFileSync(0, 'utf8'))];
+const ctx = { LotteryData: {}, console };
+vm.createContext(ctx);
+vm.runInContext(fs.readFileSync(analysisJs, 'utf8') + '\\nthis.LotteryAnalysis = LotteryAnalysis;', ctx);
+const out = cases.map(c => ctx.LotteryAnalysis[c.fn](c.data));
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+def same(a, b, path=''):
+    """เทียบผล JSON ของสองฝั่ง (ตัวเลขทศนิยมยอมคลาดเคลื่อนระดับ floating point) → list ของจุดที่ต่าง"""
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+        return [] if math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12) else [f"{path}: {a!r} != {b!r}"]
+    if isinstance(a, dict) and isinstance(b, dict):
+        if set(a) != set(b):
+            return [f"{path}: keys {sorted(set(a) ^ set(b))[:5]}"]
+        return [d for k in a for d in same(a[k], b[k], f"{path}.{k}")]
+    if isinstance(a, list) and isinstance(b, list):
+        if len(a) != len(b):
+            return [f"{path}: length {len(a)} != {len(b)}"]
+        return [d for i, (x, y) in enumerate(zip(a, b)) for d in same(x, y, f"{path}[{i}]")]
+    return [] if a == b else [f"{path}: {a!r} != {b!r}"]
+
+
+def repeat_window(matrix, kind):
+    """ช่วงงวด [a, t) ที่มีเลขท้าย 2 ตัวออกซ้ำในงวดเดียวเท่านั้น (gap avg = 0) หรือ None"""
+    digits, valid = matrix.tiers[kind]
+    n = len(matrix.dates)
+    ends = [[int(x[-2]) * 10 + int(x[-1]) for x in row[v]] for row, v in zip(digits, valid)]
+    for i, row in enumerate(ends):
+        for key in {k for k in row if row.count(k) > 1}:
+            a = next((j + 1 for j in range(i - 1, -1, -1) if key in ends[j]), 0)
+            t = next((j for j in range(i + 1, n) if key in ends[j]), n)
+            if t - 1 > i:
+                return a, t
+    return None
+
+
+def parity(matrix, kinds=('first', 'last2', 'front3', 'back3'), counts=(24, 48, 'all')):
+    node = shutil.which('node')
+    if not node:
+        raise RuntimeError("ต้องมี node เพื่อรัน lotteryAnalysis.js")
+    windows = [(kind, count, matrix.series(kind, count)) for kind in kinds for count in counts]
+    for kind in kinds:
+        span = repeat_window(matrix, kind)
+        if span:
+            digits, valid = matrix.tiers[kind]
+            a, t = span
+            windows.append((kind, f"{a}:{t}", Series(matrix.dates[a:t], digits[a:t], valid[a:t])))
+    cases, expected = [], []
+    for kind, label, s in windows:
+        data = [{'date': d, 'numbers': [''.join(map(str, n)) for n in row[v]]}
+                for d, row, v in zip(s.dates, s.digits, s.valid)]
+        for fn, py in ANALYSES.items():
+            cases.append({'fn': fn, 'data': data, 'label': f"{kind}/{label}/{fn}"})
+            expected.append(json.loads(json.dumps(py(s), ensure_ascii=False)))
+    out = subprocess.run([node, '-e', NODE_RUNNER, os.path.join(ROOT_DIR, 'lotteryAnalysis.js')],
+                         input=json.dumps(cases), capture_output=True, text=True, check=True)
+    failures = {}
+    for case, js, py in zip(cases, json.loads(out.stdout), expected):
+        diffs = same(js, py)
+        if diffs:
+            failures[case['label']] = diffs[:5]
+    return len(cases), failures
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='วิเคราะห์สถิติหวยด้วย NumPy (เหมือน lotteryAnalysis.js)')
+    ap.add_argument('--input', help='lotteryStaticData.js (default: ไฟล์ของ extension)')
+    ap.add_argument('--kind', default='first', choices=['first', 'last2', 'front3', 'back3'])
+    ap.add_argument('--count', default='48', help="จำนวนงวดล่าสุด หรือ 'all'")
+    ap.add_argument('--parity', action='store_true', help='เทียบผลกับ lotteryAnalysis.js (ต้องมี node)')
+    args = ap.parse_args(argv)
+
+    t = time.perf_counter()
+    matrix = DrawMatrix.from_file(args.input)
+    print(f"📦 โหลด {len(matrix.dates)} งวด ({(time.perf_counter() - t) * 1000:.1f} ms)")
+
+    if args.parity:
+        total, failures = parity(matrix)
+        for label, diffs in failures.items():
+            print(f"   ❌ {label}")
+            for d in diffs:
+                print(f"      {d}")
+        print(f"{'✅' if not failures else '❌'} Parity: {total - len(failures)}/{total} ตรงกับ lotteryAnalysis.js")
+        sys.exit(1 if failures else 0)
+
+    s = matrix.series(args.kind, args.count)
+    t = time.perf_counter()
+    result = combined_prediction(s)
+    print(f"🎯 วิเคราะห์ {args.kind} {len(s)} งวด ({(time.perf_counter() - t) * 1000:.1f} ms)")
+    print(f"   เลขเด่น: {', '.join(result['topDigits'])}")
+    print(f"   6 ตัว: {', '.join(result['predicted6'])} | 3 ตัว: {', '.join(result['predicted3'])} "
+          f"| 2 ตัว: {', '.join(result['predicted2'])}")
+    print(f"   ความมั่นใจ: {result['confidence']}%")
+
+
+if __name__ == '__main__':
+    main()
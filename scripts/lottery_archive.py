@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+lottery_archive.py — คลังผลรางวัลย้อนหลังทั้งหมด แบ่งไฟล์ละหนึ่งปี (shard) + manifest
+
+โครงสร้าง:
+  archive/manifest.json   รายการ shard: ปี, ไฟล์, รูปแบบ, จำนวนงวด, ช่วงวันที่, ขนาด, sha256
+  archive/2024.json       ผลรางวัลของปีนั้น (packed_format ถ้า pack ได้ ไม่งั้น JSON array)
+
+Archive อ่านแค่ manifest ตอนเปิด แล้วค่อยเปิด shard เฉพาะปีที่ query ต้องใช้
+(ตรวจ sha256 ทุกครั้งที่เปิด) ปีที่ผ่านไปแล้วไม่เปลี่ยน จึงเขียนทับเฉพาะ shard ที่เนื้อหาต่างจากเดิม
+
+สร้าง/อัปเดตด้วย: python3 scripts/update_static_data.py --archive
+
+Usage:
+  python3 scripts/lottery_archive.py                   # สรุป archive/manifest.json
+  python3 scripts/lottery_archive.py --verify          # ตรวจ checksum ทุก shard
+  python3 scripts/lottery_archive.py --from 2010-01-01 --to 2010-12-31
+"""
+
+import argparse, hashlib, json, os, sys
+from datetime import datetime, timezone
+
+import packed_format
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DIR = os.path.join(SCRIPT_DIR, '..', 'archive')
+MANIFEST = 'manifest.json'
+ARCHIVE_VERSION = 1
+
+
+def encode_shard(draws):
+    """draws ของหนึ่งปี → (รูปแบบ, bytes) — ใช้ packed ถ้า round-trip ได้ตรงทุก byte"""
+    try:
+        body = packed_format.verify(draws)
+        fmt = 'packed'
+    except ValueError:
+        body = draws  # งวดเก่าบางงวดมีเลขที่ไม่ใช่รูปแบบมาตรฐาน → เก็บ JSON ตรง ๆ
+        fmt = 'json'
+    return fmt, json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_shard(fmt, data):
+    body = json.loads(data)
+    return packed_format.decode(body) if fmt == 'packed' else body
+
+
+def write_atomic(path, data):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def file_digest(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def write_archive(draws, path=DEFAULT_DIR, **info):
+    """เขียน shard ต่อปี + manifest → (manifest, จำนวน shard ที่เขียนใหม่)
+
+    shard ที่ไฟล์บนดิสก์มี checksum ตรงกับเนื้อหาใหม่อยู่แล้วจะไม่ถูกเขียนซ้ำ manifest เขียนเป็นไฟล์สุดท้าย
+    (ถ้าถูกขัดจังหวะกลางทาง manifest เดิมยังชี้ shard ที่ checksum ถูกต้องหรือตรวจพบได้)
+    """
+    os.makedirs(path, exist_ok=True)
+    old = {s['year']: s for s in read_manifest(path)['shards']} if os.path.exists(
+        os.path.join(path, MANIFEST)) else {}
+    by_year = {}
+    for d in sorted(draws, key=lambda d: d['date'], reverse=True):
+        by_year.setdefault(int(d['date'][:4]), []).append(d)
+
+    shards, written = [], 0
+    for year in sorted(by_year):
+        year_draws = by_year[year]
+        fmt, data = encode_shard(year_draws)
+        digest = hashlib.sha256(data).hexdigest()
+        name = f"{year}.json"
+        if file_digest(os.path.join(path, name)) != digest:
+            write_atomic(os.path.join(path, name), data)
+            written += 1
+        shards.append({
+            'year': year,
+            'file': name,
+            'format': fmt,
+            'draws': len(year_draws),
+            'from': year_draws[-1]['date'],
+            'to': year_draws[0]['date'],
+            'bytes': len(data),
+            'sha256': digest,
+        })
+
+    # ลบเฉพาะ shard ของปีที่ไม่มีงวดเหลือเลย (caller ต้องส่งงวดเดิมทั้งหมดมาด้วย ไม่ใช่แค่งวดใหม่)
+    for year in set(old) - set(by_year):
+        stale = os.path.join(path, old[year]['file'])
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    manifest = {
+        'v': ARCHIVE_VERSION,
+        'generated': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        **info,
+        'draws': sum(s['draws'] for s in shards),
+        'shards': shards,
+    }
+    write_atomic(os.path.join(path, MANIFEST),
+                 json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8'))
+    return manifest, written
+
+
+def read_manifest(path=DEFAULT_DIR):
+    with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('v') != ARCHIVE_VERSION:
+        raise ValueError(f"{path}: ไม่รู้จัก archive version {manifest.get('v')}")
+    return manifest
+
+
+class Archive:
+    """อ่าน archive แบบ lazy — เปิด shard เฉพาะปีที่ใช้ และ cache ไว้หลังเปิดครั้งแรก"""
+
+    def __init__(self, path=DEFAULT_DIR):
+        self.path = path
+        self.manifest = read_manifest(path)
+        self.shards = {s['year']: s for s in self.manifest['shards']}
+        self.loaded = {}
+
+    def years(self):
+        return sorted(self.shards)
+
+    def load_year(self, year):
+        """draws ของปีนั้น (ใหม่ → เก่า) — ValueError ถ้า checksum ไม่ตรงกับ manifest"""
+        year = int(year)
+        if year not in self.loaded:
+            shard = self.shards.get(year)
+            if shard is None:
+                return []
+            with open(os.path.join(self.path, shard['file']), 'rb') as f:
+                data = f.read()
+            if hashlib.sha256(data).hexdigest() != shard['sha256']:
+                raise ValueError(f"{shard['file']}: checksum ไม่ตรงกับ manifest")
+            self.loaded[year] = decode_shard(shard['format'], data)
+        return self.loaded[year]
+
+    def draws(self, start=None, end=None):
+        """draws ในช่วง [start, end] (YYYY-MM-DD, None = ไม่จำกัด) เรียงใหม่ → เก่า
+        เปิดเฉพาะ shard ที่ช่วงวันที่ใน manifest ซ้อนกับช่วงที่ขอ"""
+        result = []
+        for year in sorted(self.shards, reverse=True):
+            s = self.shards[year]
+            if (start and s['to'] < start) or (end and s['from'] > end):
+                continue
+            result.extend(d for d in self.load_year(year)
+                          if (not start or d['date'] >= start) and (not end or d['date'] <= end))
+        return result
+
+    def get(self, date):
+        return next((d for d in self.load_year(date[:4]) if d['date'] == date), None)
+
+    def verify(self):
+        """ตรวจทุก shard (checksum + จำนวนงวด + ช่วงวันที่) → list ของปัญหาที่พบ"""
+        problems = []
+        for year in self.years():
+            shard = self.shards[year]
+            try:
+                draws = self.load_year(year)
+            except (OSError, ValueError) as e:
+                problems.append(f"{year}: {e}")
+                continue
+            if len(draws) != shard['draws'] or (draws and (draws[-1]['date'], draws[0]['date']) !=
+                                                 (shard['from'], shard['to'])):
+                problems.append(f"{year}: จำนวนงวด/ช่วงวันที่ไม่ตรงกับ manifest")
+        return problems
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='สรุป/ตรวจ/อ่านคลังผลรางวัลแบบแบ่งปี')
+    ap.add_argument('--path', default=DEFAULT_DIR, help='โฟลเดอร์ archive')
+    ap.add_argument('--verify', action='store_true', help='ตรวจ checksum ทุก shard')
+    ap.add_argument('--from', dest='start', help='แสดงงวดตั้งแต่ YYYY-MM-DD')
+    ap.add_argument('--to', dest='end', help='แสดงงวดถึง YYYY-MM-DD')
+    args = ap.parse_args(argv)
+
+    try:
+        archive = Archive(args.path)
+    except (OSError, ValueError) as e:
+        print(f"❌ เปิด archive ไม่ได้: {e}")
+        sys.exit(1)
+    m = archive.manifest
+    years = archive.years()
+    print(f"📚 {os.path.abspath(args.path)}: {m['draws']} งวด, {len(years)} ปี "
+          f"({years[0]}–{years[-1]}), {sum(s['bytes'] for s in m['shards']) / 1024:.0f} KB")
+
+    if args.verify:
+        problems = archive.verify()
+        for p in problems:
+            print(f"   ❌ {p}")
+        print("✅ ทุก shard ถูกต้อง" if not problems else f"❌ พบปัญหา {len(problems)} shard")
+        sys.exit(1 if problems else 0)
+
+    if args.start or args.end:
+        draws = archive.draws(args.start, args.end)
+        for d in draws:
+            print(f"   {d['date']}  {d['first']}  หน้า {','.join(d['front3'])}  "
+                  f"ท้าย {','.join(d['back3'])}  {d['last2']}")
+        print(f"   {len(draws)} งวด (เปิด {len(archive.loaded)}/{len(years)} shard)")
+        return
+
+    for s in m['shards']:
+        print(f"   {s['year']}: {s['draws']:3d} งวด  {s['from']} – {s['to']}  "
+              f"{s['bytes'] / 1024:6.1f} KB  {s['format']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+mock_api.py — API จำลองของ lotto.api.rayriffy.com สำหรับทดสอบ/วัดผล script ดึงข้อมูลแบบ offline
+
+สร้าง payload /list/{page}, /lotto/{id}, /latest จาก lotteryStaticData.js (รูปแบบเดียวกับ API จริง
+ที่ parse_draw() อ่าน) แล้วเสิร์ฟผ่าน asyncio server (HTTP/1.1 keep-alive, gzip, ETag → 304)
+จำลองสภาพเครือข่ายได้:
+  --latency / --jitter   หน่วงเวลาต่อ request (ms)
+  --error-rate           สัดส่วน request ที่ตอบ 503
+  --rate-limit           จำกัด request/วินาที (เกินแล้วตอบ 429 + Retry-After)
+
+GET /__stats คืนสถิติของ server (จำนวน request, status, connection)
+
+Usage:
+  python3 scripts/mock_api.py                                  # http://127.0.0.1:8765
+  python3 scripts/mock_api.py --latency 80 --jitter 40 --error-rate 0.05 --rate-limit 20
+  python3 scripts/update_static_data.py --api http://127.0.0.1:8765 --output /tmp/out.js
+"""
+
+import argparse, asyncio, gzip, hashlib, json, os, random, sys, threading, time
+from collections import Counter
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PORT = 8765
+PAGE_SIZE = 10
+
+THAI_MONTH_NAMES = ['', 'มกราคม', 'กุมภาพันธ์', 'มีนาคม', 'เมษายน', 'พฤษภาคม', 'มิถุนายน',
+                    'กรกฎาคม', 'สิงหาคม', 'กันยายน', 'ตุลาคม', 'พฤศจิกายน', 'ธันวาคม']
+
+
+def thai_date(iso):
+    y, m, d = iso.split('-')
+    return f"{int(d)} {THAI_MONTH_NAMES[int(m)]} {int(y) + 543}"
+
+
+def draw_id(iso):
+    y, m, d = iso.split('-')
+    return f"{d}{m}{int(y) + 543}"
+
+
+def draw_payload(d):
+    """draw (รูปแบบ parse_draw) → response ของ /lotto/{id} (กลับด้านของ parse_draw)"""
+    num = lambda id_, numbers: {'id': id_, 'number': numbers}
+    return {'status': 'success', 'response': {
+        'date': thai_date(d['date']),
+        'endpoint': f"https://news.sanook.com/lotto/check/{draw_id(d['date'])}",
+        'prizes': [
+            num('prizeFirst', [d['first']]),
+            num('prizeFirstNear', d['near1']),
+            num('prizeSecond', d['prize2']),
+            num('prizeThird', d['prize3']),
+            num('prizeForth', d['prize4']),
+            num('prizeFifth', d['prize5']),
+        ],
+        'runningNumbers': [
+            num('runningNumberFrontThree', d['front3']),
+            num('runningNumberBackThree', d['back3']),
+            num('runningNumberBackTwo', [d['last2']]),
+        ],
+    }}
+
+
+class Routes:
+    """payload ทั้งหมดเตรียมไว้ล่วงหน้า (body + ETag) — server แค่เลือกแล้วส่ง"""
+
+    def __init__(self, draws, page_size=PAGE_SIZE):
+        draws = sorted(draws, key=lambda d: d['date'], reverse=True)
+        self.bodies = {}
+        items = [{'id': draw_id(d['date']), 'date': thai_date(d['date']), 'url': f"/lotto/{draw_id(d['date'])}"}
+                 for d in draws]
+        pages = max(1, -(-len(items) // page_size))
+        for page in range(1, pages + 2):  # หน้าสุดท้าย +1 = หน้าว่าง (จุดหยุดของ fetch_draw_list)
+            chunk = items[(page - 1) * page_size: page * page_size]
+            self._add(f"/list/{page}", {'status': 'success', 'response': chunk})
+        for d in draws:
+            self._add(f"/lotto/{draw_id(d['date'])}", draw_payload(d))
+        if draws:
+            self._add('/latest', draw_payload(draws[0]))
+
+    def _add(self, path, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.bodies[path] = (body, gzip.compress(body, 6), '"%s"' % hashlib.sha1(body).hexdigest()[:16])
+
+    def get(self, path):
+        return self.bodies.get(path.split('?', 1)[0].rstrip('/') or '/')
+
+
+class MockServer:
+    def __init__(self, routes, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=0.0, seed=None):
+        self.routes = routes
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        self.tokens = rate_limit
+        self.refilled = time.monotonic()
+        self.stats = Counter()
+
+    def _allow(self):
+        """token bucket — burst ได้ไม่เกิน rate_limit request"""
+        if not self.rate_limit:
+            return True
+        now = time.monotonic()
+        self.tokens = min(self.rate_limit, self.tokens + (now - self.refilled) * self.rate_limit)
+        self.refilled = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    async def handle(self, reader, writer):
+        self.stats['connections'] += 1
+        try:
+            while True:
+                request = await reader.readuntil(b'\r\n\r\n')
+                lines = request.decode('latin-1').split('\r\n')
+                method, path, _ = lines[0].split(' ', 2)
+                headers = {k.strip().lower(): v.strip() for k, _, v in
+                           (line.partition(':') for line in lines[1:] if line)}
+                status, extra, body = await self.respond(method, path, headers)
+                close = headers.get('connection', '').lower() == 'close'
+                head = [f"HTTP/1.1 {status}", f"Content-Length: {len(body)}",
+                        f"Connection: {'close' if close else 'keep-alive'}"] + extra
+                writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            pass  # stop() ระหว่างที่ client ยังถือ keep-alive connection — ปิดเงียบ ๆ
+        finally:
+            writer.close()
+
+    async def respond(self, method, path, headers):
+        self.stats['requests'] += 1
+        if path == '/__stats':
+            body = json.dumps(dict(self.stats)).encode()
+            return '200 OK', ['Content-Type: application/json'], body
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if not self._allow():
+            self.stats['status_429'] += 1
+            return '429 Too Many Requests', ['Retry-After: 1'], b'{"status":"error","response":"rate limited"}'
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.stats['status_503'] += 1
+            return '503 Service Unavailable', [], b'{"status":"error","response":"unavailable"}'
+        route = self.routes.get(path) if method == 'GET' else None
+        if route is None:
+            self.stats['status_404'] += 1
+            return '404 Not Found', [], b'{"status":"error","response":"not found"}'
+        body, gz, etag = route
+        if headers.get('if-none-match') == etag:
+            self.stats['status_304'] += 1
+            return '304 Not Modified', [f"ETag: {etag}"], b''
+        self.stats['status_200'] += 1
+        extra = ['Content-Type: application/json; charset=utf-8', f"ETag: {etag}"]
+        if 'gzip' in headers.get('accept-encoding', ''):
+            extra.append('Content-Encoding: gzip')
+            body = gz
+        self.stats['bytes_sent'] += len(body)
+        return '200 OK', extra, body
+
+    async def serve(self, host, port, started=None):
+        server = await asyncio.start_server(self.handle, host, port)
+        self.port = server.sockets[0].getsockname()[1]
+        self.loop, self.server = asyncio.get_running_loop(), server
+        if started:
+            started.set()
+        async with server:
+            try:
+                await server.serve_forever()
+            except asyncio.CancelledError:
+                pass  # stop()
+
+    def stop(self):
+        """หยุด server ที่รันจาก thread อื่น (start_in_thread)"""
+        self.loop.call_soon_threadsafe(self.server.close)
+
+
+def load_routes(path=None, page_size=PAGE_SIZE):
+    from update_static_data import load_static_data, OUTPUT
+    return Routes(load_static_data(path or OUTPUT), page_size)
+
+
+def start_in_thread(routes, host='127.0.0.1', port=0, **conditions):
+    """รัน MockServer ใน background thread (ใช้จาก benchmark/ทดสอบ) → (server, base URL)"""
+    server = MockServer(routes, **conditions)
+    started = threading.Event()
+    thread = threading.Thread(target=lambda: asyncio.run(server.serve(host, port, started)), daemon=True)
+    thread.start()
+    if not started.wait(10):
+        raise RuntimeError("mock server ไม่เริ่มทำงานภายใน 10 วินาที")
+    return server, f"http://{host}:{server.port}"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='API จำลองของ lotto.api.rayriffy.com (จาก lotteryStaticData.js)')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=DEFAULT_PORT)
+    ap.add_argument('--input', help='lotteryStaticData.js (default: ไฟล์ของ extension)')
+    ap.add_argument('--page-size', type=int, default=PAGE_SIZE, help='จำนวนงวดต่อหน้าของ /list/{page}')
+    ap.add_argument('--latency', type=float, default=0, help='หน่วงเวลาต่อ request (ms)')
+    ap.add_argument('--jitter', type=float, default=0, help='หน่วงเพิ่มแบบสุ่ม 0..jitter (ms)')
+    ap.add_argument('--error-rate', type=float, default=0, help='สัดส่วน request ที่ตอบ 503 (0-1)')
+    ap.add_argument('--rate-limit', type=float, default=0, help='request/วินาที ก่อนตอบ 429 (0 = ไม่จำกัด)')
+    ap.add_argument('--seed', type=int, help='seed ของการสุ่ม (jitter/error) ให้ผลซ้ำได้')
+    args = ap.parse_args(argv)
+
+    routes = load_routes(args.input, args.page_size)
+    server = MockServer(routes, args.latency, args.jitter, args.error_rate, args.rate_limit, args.seed)
+    print(f"🧪 Mock API: http://{args.host}:{args.port} ({len(routes.bodies)} paths)")
+    print(f"   latency {args.latency:g}+{args.jitter:g} ms, error {args.error_rate:.0%}, "
+          f"rate limit {args.rate_limit:g}/s" if args.rate_limit else
+          f"   latency {args.latency:g}+{args.jitter:g} ms, error {args.error_rate:.0%}, ไม่จำกัด rate")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\n👋 หยุด ({server.stats['requests']} requests)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+number_index.py — inverted index ของเลขที่ถูกรางวัล สำหรับตรวจสลากทีละมาก ๆ
+
+แทนที่จะไล่ทุกงวด × ทุกรางวัลต่อสลากหนึ่งใบ index จะจัดกลุ่มเลขตาม key ที่ใช้ตรวจ:
+  full    เลข 6 หลักเต็ม    ← first, near1, prize2, prize3, prize4, prize5
+  front3  3 หลักหน้า        ← front3
+  back3   3 หลักท้าย        ← back3
+  last2   2 หลักท้าย        ← last2
+แต่ละ key มี postings = [[index งวด, index รางวัล], ...] เรียงงวดใหม่ → เก่า
+สลากหนึ่งใบจึงใช้ dict lookup แค่ 4 ครั้ง ไม่ว่าจะมีข้อมูลกี่งวด
+
+Usage:
+  python3 scripts/number_index.py 123456 654321               # ตรวจเลขกับทุกงวดใน lotteryStaticData.js
+  python3 scripts/number_index.py --date 2026-03-16 < tickets.txt
+  python3 scripts/number_index.py --index scripts/.cache/number_index.json 123456
+
+ไฟล์ index สร้างโดย update_static_data.py (หรือ NumberIndex.build(draws).save(path))
+"""
+
+import argparse, json, os, sys, time
+
+from draw_model import tier_numbers
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(SCRIPT_DIR, '.cache', 'number_index.json')
+INDEX_VERSION = 1
+
+# รางวัล (field ใน draw) → (key ที่ใช้ตรวจ, ชื่อ, เงินรางวัล)
+TIERS = (
+    ('first', 'full', 'รางวัลที่ 1', 6_000_000),
+    ('near1', 'full', 'ข้างเคียงรางวัลที่ 1', 100_000),
+    ('prize2', 'full', 'รางวัลที่ 2', 200_000),
+    ('prize3', 'full', 'รางวัลที่ 3', 80_000),
+    ('prize4', 'full', 'รางวัลที่ 4', 40_000),
+    ('prize5', 'full', 'รางวัลที่ 5', 20_000),
+    ('front3', 'front3', 'เลขหน้า 3 ตัว', 4_000),
+    ('back3', 'back3', 'เลขท้าย 3 ตัว', 4_000),
+    ('last2', 'last2', 'เลขท้าย 2 ตัว', 2_000),
+)
+KEYS = {
+    'full': (6, lambda t: t),
+    'front3': (3, lambda t: t[:3]),
+    'back3': (3, lambda t: t[-3:]),
+    'last2': (2, lambda t: t[-2:]),
+}
+
+
+class NumberIndex:
+    """index เลข → postings (งวด, รางวัล) พร้อม lookup ทีละใบหรือทีละชุด"""
+
+    def __init__(self, dates, postings):
+        self.dates = dates                 # เรียงใหม่ → เก่า (เหมือน lotteryStaticData.js)
+        self.postings = postings           # {key kind: {เลข: [[index งวด, index รางวัล], ...]}}
+        self.date_pos = {d: i for i, d in enumerate(dates)}
+
+    @classmethod
+    def build(cls, draws):
+        draws = sorted(draws, key=lambda d: d['date'], reverse=True)
+        postings = {kind: {} for kind in KEYS}
+        for di, draw in enumerate(draws):
+            for ti, (field, kind, _, _) in enumerate(TIERS):
+                width = KEYS[kind][0]
+                bucket = postings[kind]
+                for num in tier_numbers(draw, field):
+                    if len(num) == width and num.isdigit():  # ข้าม placeholder '------'
+                        bucket.setdefault(num, []).append([di, ti])
+        return cls([d['date'] for d in draws], postings)
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('v') != INDEX_VERSION or data.get('tiers') != [t[0] for t in TIERS]:
+            raise ValueError(f"{path}: index คนละรูปแบบ (v={data.get('v')}) — สร้างใหม่ด้วย update_static_data.py")
+        return cls(data['dates'], data['postings'])
+
+    @classmethod
+    def from_static_data(cls, path=None):
+        from update_static_data import load_static_data, OUTPUT
+        return cls.build(load_static_data(path or OUTPUT))
+
+    def save(self, path=DEFAULT_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        data = {'v': INDEX_VERSION, 'tiers': [t[0] for t in TIERS],
+                'dates': self.dates, 'postings': self.postings}
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    def stats(self):
+        return {
+            'draws': len(self.dates),
+            'keys': {kind: len(bucket) for kind, bucket in self.postings.items()},
+            'postings': sum(len(p) for bucket in self.postings.values() for p in bucket.values()),
+        }
+
+    def lookup(self, ticket, date=None):
+        """รางวัลทั้งหมดของสลาก 6 หลัก → list ของ {'date', 'tier', 'label', 'prize', 'key'}
+        date = ตรวจเฉพาะงวดนั้น (None = ทุกงวด) เรียงงวดใหม่ → เก่า ตามลำดับรางวัลใน TIERS"""
+        return self.lookup_many([ticket], date).get(ticket, [])
+
+    def lookup_many(self, tickets, date=None):
+        """ตรวจสลากหลายใบพร้อมกัน → {ticket: [hit, ...]} เฉพาะใบที่ถูกรางวัล
+
+        เลขซ้ำในชุดตรวจครั้งเดียว และถ้าระบุ date จะตัด postings ของงวดอื่นทิ้งก่อน
+        (ตรวจสลากหลายพันใบกับงวดเดียว = dict lookup 4 ครั้งต่อใบ + กรองงวดเป็น int compare)
+        """
+        if date is not None:
+            if date not in self.date_pos:
+                raise KeyError(f"ไม่มีงวด {date} ใน index")
+            only = self.date_pos[date]
+        hits = {}
+        for ticket in set(tickets):
+            if len(ticket) != 6 or not ticket.isdigit():
+                continue
+            found = self.match(ticket)
+            if date is not None:
+                found = [(di, ti) for di, ti in found if di == only]
+            if found:
+                hits[ticket] = [self.hit(di, ti) for di, ti in found]
+        return hits
+
+    def match(self, ticket):
+        """[(index งวด, index รางวัล), ...] ของสลาก 6 หลักที่ผ่านการตรวจรูปแบบแล้ว (เรียงงวดใหม่ → เก่า)"""
+        postings = self.postings
+        found = []
+        for kind, (_, key_of) in KEYS.items():
+            p = postings[kind].get(key_of(ticket))
+            if p:
+                found.extend(p)
+        if len(found) > 1:
+            found.sort()
+        return [tuple(x) for x in found]
+
+    def hit(self, di, ti):
+        name, kind, label, prize = TIERS[ti]
+        return {'date': self.dates[di], 'tier': name, 'label': label, 'prize': prize, 'key': kind}
+
+
+def read_tickets(stream):
+    """เลขสลากจากไฟล์ (หนึ่งเลขต่อบรรทัด หรือคอลัมน์แรกของ CSV)"""
+    for line in stream:
+        ticket = line.split(',', 1)[0].strip()
+        if ticket:
+            yield ticket
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='ตรวจเลขสลากด้วย inverted index')
+    ap.add_argument('tickets', nargs='*', help='เลขสลาก 6 หลัก (ไม่ระบุ = อ่านจาก stdin)')
+    ap.add_argument('--index', help=f'ไฟล์ index (default: {DEFAULT_PATH} ถ้ามี ไม่งั้นสร้างจาก static data)')
+    ap.add_argument('--input', help='lotteryStaticData.js (ใช้เมื่อไม่มีไฟล์ index)')
+    ap.add_argument('--date', help='ตรวจเฉพาะงวด YYYY-MM-DD')
+    args = ap.parse_args(argv)
+
+    t = time.perf_counter()
+    index_path = args.index or (DEFAULT_PATH if os.path.exists(DEFAULT_PATH) and not args.input else None)
+    index = NumberIndex.load(index_path) if index_path else NumberIndex.from_static_data(args.input)
+    st = index.stats()
+    print(f"📦 Index: {st['draws']} งวด, {st['postings']:,} postings "
+          f"({(time.perf_counter() - t) * 1000:.1f} ms)", file=sys.stderr)
+
+    tickets = args.tickets or list(read_tickets(sys.stdin))
+    t = time.perf_counter()
+    try:
+        hits = index.lookup_many(tickets, args.date)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - t
+
+    for ticket in dict.fromkeys(tickets):
+        for h in hits.get(ticket, []):
+            print(f"{ticket}\t{h['date']}\t{h['label']}\t{h['prize']:,}")
+    print(f"🎯 ตรวจ {len(tickets):,} ใบ ถูกรางวัล {len(hits):,} เลข "
+          f"({elapsed * 1000:.1f} ms)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+packed_format.py — lotteryStaticData.js แบบ columnar/bit-packed (ขนาดเล็กกว่า JSON หลายเท่า)
+
+แทนที่จะเก็บทุกงวดเป็น JSON object ที่มีชื่อ key ซ้ำ และเลขรางวัลเป็น string
+จะเก็บเป็นคอลัมน์ใน bitstream เดียว (base64):
+  - วันที่     → จำนวนวันนับจาก base date (16 bit)
+  - จำนวนเลข  → ต่องวด (8 bit) เฉพาะประเภทรางวัลที่จำนวนไม่คงที่
+  - เลขรางวัล → จำนวนเต็มขนาดพอดีหลัก (6 หลัก = 20 bit, 3 หลัก = 10 bit, 2 หลัก = 7 bit)
+                ค่า 10^หลัก แทน placeholder '------' / '---' / '--'
+  - รางวัลที่ 4/5 (150 เลขต่องวด) อยู่ใน stream แยก ('lazy')
+
+ไฟล์ JS ที่ได้ยังประกาศ LOTTERY_STATIC_DATA เหมือนเดิม (decode ตอนโหลด)
+extension จึงไม่ต้องแก้อะไร — รางวัลที่ 4/5 จะ decode ตอนถูกอ่านครั้งแรก
+
+ข้อแลกเปลี่ยน: packed แลก "เวลา parse" กับ "ขนาดไฟล์" — ไม่ได้ทำให้ extension เปิดเร็วขึ้น
+  ข้อมูล 121 งวด: ไฟล์เล็กลง ~2.8 เท่า (198 KB → 71 KB) แต่โหลดใน node ช้ากว่า (~5.5 ms vs ~3.8 ms ของ JSON)
+  เพราะ V8 parse JSON literal ได้เร็วกว่า decode bitstream ด้วย JS
+ใช้เมื่อขนาด package / repo สำคัญกว่าเวลาโหลด — update_static_data.py ยังเขียน JSON เป็น default (--format packed = opt-in)
+
+Usage:
+  python3 scripts/packed_format.py lotteryStaticData.js             # verify + รายงานขนาด/เวลา parse
+  python3 scripts/packed_format.py lotteryStaticData.js -o out.js   # แปลงเป็น packed
+"""
+
+import argparse, base64, json, os, shutil, subprocess, sys, tempfile, time
+from datetime import date, timedelta
+
+FORMAT_VERSION = 1
+
+# (ชื่อ field, จำนวนหลัก, เป็นค่าเดี่ยวหรือไม่, lazy) — เรียงตาม key order ของ parse_draw()
+# lazy = เก็บใน stream แยก ('lazy') ที่ JS decoder จะยังไม่แตะจนกว่า field นั้นถูกอ่าน
+TIERS = [
+    ('first', 6, True, False),
+    ('near1', 6, False, False),
+    ('prize2', 6, False, False),
+    ('prize3', 6, False, False),
+    ('prize4', 6, False, True),
+    ('prize5', 6, False, True),
+    ('front3', 3, False, False),
+    ('back3', 3, False, False),
+    ('last2', 2, True, False),
+]
+DATE_BITS = 16
+COUNT_BITS = 8
+
+
+def value_bits(width):
+    # 0 .. 10^width-1 = เลขจริง, 10^width = placeholder
+    return (10 ** width).bit_length()
+
+
+class BitWriter:
+    def __init__(self):
+        self.buf = bytearray()
+        self.acc = 0
+        self.nbits = 0
+
+    def write(self, value, bits):
+        self.acc |= value << self.nbits
+        self.nbits += bits
+        while self.nbits >= 8:
+            self.buf.append(self.acc & 0xFF)
+            self.acc >>= 8
+            self.nbits -= 8
+
+    def getvalue(self):
+        if self.nbits:
+            return bytes(self.buf) + bytes([self.acc & 0xFF])
+        return bytes(self.buf)
+
+
+class BitReader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+        self.acc = 0
+        self.nbits = 0
+
+    def read(self, bits):
+        while self.nbits < bits:
+            self.acc |= self.data[self.pos] << self.nbits
+            self.pos += 1
+            self.nbits += 8
+        value = self.acc & ((1 << bits) - 1)
+        self.acc >>= bits
+        self.nbits -= bits
+        return value
+
+
+def encode_number(s, width):
+    if s == '-' * width:
+        return 10 ** width
+    if len(s) != width or not s.isdigit():
+        raise ValueError(f"เลข {s!r} ไม่ใช่ตัวเลข {width} หลัก — pack แบบ lossless ไม่ได้")
+    return int(s)
+
+
+def decode_number(v, width):
+    return '-' * width if v == 10 ** width else str(v).zfill(width)
+
+
+def encode(draws):
+    """list ของ draw (รูปแบบเดียวกับ parse_draw) → dict ที่ serialize เป็น JSON ได้"""
+    if not draws:
+        raise ValueError("ไม่มีข้อมูลงวด")
+    sources = {d.get('source') for d in draws}
+    if len(sources) != 1:
+        raise ValueError(f"source ต้องเหมือนกันทุกงวด (เจอ {sorted(map(str, sources))})")
+    expected_keys = ['date'] + [t[0] for t in TIERS] + ['source']
+    for d in draws:
+        if list(d.keys()) != expected_keys:
+            raise ValueError(f"งวด {d.get('date')} มี key ไม่ตรงรูปแบบ: {list(d.keys())}")
+
+    dates = [date.fromisoformat(d['date']) for d in draws]
+    base = min(dates)
+    streams = [BitWriter(), BitWriter()]
+    for dt in dates:
+        streams[0].write((dt - base).days, DATE_BITS)
+
+    tiers = []
+    for name, width, scalar, lazy in TIERS:
+        columns = [[d[name]] if scalar else d[name] for d in draws]
+        counts = {len(c) for c in columns}
+        fixed = counts.pop() if len(counts) == 1 else None
+        if fixed is None:
+            # จำนวนเลขอยู่ใน stream หลักเสมอ — คำนวณตำแหน่งของ lazy stream ได้โดยไม่ต้อง decode
+            for c in columns:
+                streams[0].write(len(c), COUNT_BITS)
+        w = streams[1 if lazy else 0]
+        bits = value_bits(width)
+        for c in columns:
+            for s in c:
+                w.write(encode_number(s, width), bits)
+        tiers.append([name, width, fixed if fixed is not None else -1, 1 if scalar else 0, 1 if lazy else 0])
+
+    return {
+        'v': FORMAT_VERSION,
+        'n': len(draws),
+        'base': base.isoformat(),
+        'source': sources.pop(),
+        'tiers': tiers,
+        'data': base64.b64encode(streams[0].getvalue()).decode('ascii'),
+        'lazy': base64.b64encode(streams[1].getvalue()).decode('ascii'),
+    }
+
+
+def decode(packed):
+    """dict จาก encode() → list ของ draw (key order เดียวกับ parse_draw)"""
+    if packed.get('v') != FORMAT_VERSION:
+        raise ValueError(f"ไม่รู้จัก packed format version {packed.get('v')}")
+    n = packed['n']
+    base = date.fromisoformat(packed['base'])
+    readers = [BitReader(base64.b64decode(packed['data'])), BitReader(base64.b64decode(packed['lazy']))]
+    r = readers[0]
+    draws = [{'date': (base + timedelta(days=r.read(DATE_BITS))).isoformat()} for _ in range(n)]
+    for name, width, fixed, scalar, stream in packed['tiers']:
+        counts = [fixed] * n if fixed >= 0 else [r.read(COUNT_BITS) for _ in range(n)]
+        bits = value_bits(width)
+        vr = readers[stream]
+        for d, cnt in zip(draws, counts):
+            values = [decode_number(vr.read(bits), width) for _ in range(cnt)]
+            d[name] = values[0] if scalar else values
+    for d in draws:
+        d['source'] = packed['source']
+    return draws
+
+
+# decoder ฝั่ง browser — ต้องตรงกับ decode() ด้านบน
+JS_DECODER = """function (p) {
+  const toBytes = b64 => {
+    const bin = atob(b64);
+    const bytes = new Uint8Array(bin.length + 4);  // +4 กันอ่านเกินท้ายตอนอ่านทีละ 32 bit
+    for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+    return bytes;
+  };
+  // stream 0 decode ทันที, stream 1 (รางวัลที่ 4/5) แปลงเป็น bytes ตอนถูกอ่านครั้งแรก
+  const streams = [toBytes(p.data), null];
+  const bytesOf = s => streams[s] || (streams[s] = toBytes(p.lazy));
+  // อ่าน bits (≤ 24) ที่ตำแหน่ง bit ใดก็ได้
+  const readAt = (bytes, off, bits) => {
+    const i = off >>> 3;
+    const word = bytes[i] | bytes[i + 1] << 8 | bytes[i + 2] << 16 | bytes[i + 3] << 24;
+    return (word >>> (off & 7)) & ((1 << bits) - 1);
+  };
+  const offs = [0, 0];
+  const read = bits => { const v = readAt(streams[0], offs[0], bits); offs[0] += bits; return v; };
+  // string 3 หลักสำเร็จรูป — เลข 6 หลัก = D3[สูง] + D3[ต่ำ] ไม่ต้อง padStart ทีละตัว
+  const D3 = [];
+  for (let i = 0; i < 1000; i++) D3.push(String(i).padStart(3, '0'));
+  const fmt = {
+    6: v => D3[(v / 1000) | 0] + D3[v % 1000],
+    3: v => D3[v],
+    2: v => D3[v].substring(1)
+  };
+  const base = Date.parse(p.base + 'T00:00:00Z');
+  const draws = [];
+  for (let i = 0; i < p.n; i++) {
+    draws.push({ date: new Date(base + read(16) * 86400000).toISOString().substring(0, 10) });
+  }
+  p.tiers.forEach(([name, width, fixed, scalar, stream]) => {
+    const counts = [];
+    for (let i = 0; i < p.n; i++) counts.push(fixed >= 0 ? fixed : read(8));
+    const empty = 10 ** width;
+    const bits = empty.toString(2).length;
+    const toStr = fmt[width] || (v => String(v).padStart(width, '0'));
+    const dashes = '-'.repeat(width);
+    const decodeAt = (start, cnt) => {
+      const bytes = bytesOf(stream);
+      const values = [];
+      for (let k = 0; k < cnt; k++) {
+        const v = readAt(bytes, start + k * bits, bits);
+        values.push(v === empty ? dashes : toStr(v));
+      }
+      return values;
+    };
+    draws.forEach((d, i) => {
+      const start = offs[stream], cnt = counts[i];
+      offs[stream] += cnt * bits;
+      if (!stream) {
+        const values = decodeAt(start, cnt);
+        d[name] = scalar ? values[0] : values;
+        return;
+      }
+      const settle = value => {
+        Object.defineProperty(d, name, { value, writable: true, enumerable: true, configurable: true });
+        return value;
+      };
+      Object.defineProperty(d, name, {
+        get: () => settle(decodeAt(start, cnt)),
+        set: settle,
+        enumerable: true,
+        configurable: true
+      });
+    });
+  });
+  draws.forEach(d => { d.source = p.source; });
+  return draws;
+}"""
+
+
+def render_js(header, draws):
+    """header (comment block) + LOTTERY_STATIC_PACKED + LOTTERY_STATIC_DATA ที่ decode แล้ว"""
+    packed = encode(draws)
+    js = header + "const LOTTERY_STATIC_PACKED = "
+    js += json.dumps(packed, ensure_ascii=False, separators=(',', ':'))
+    js += ";\n"
+    js += f"const LOTTERY_STATIC_DATA = ({JS_DECODER})(LOTTERY_STATIC_PACKED);\n"
+    return js
+
+
+def load_packed(text):
+    """อ่าน LOTTERY_STATIC_PACKED จากเนื้อหาไฟล์ JS → list ของ draw"""
+    start = text.index('=', text.index('LOTTERY_STATIC_PACKED')) + 1
+    packed, _ = json.JSONDecoder().raw_decode(text[start:].lstrip())
+    return decode(packed)
+
+
+def verify(draws):
+    """round-trip: JSON เดิม == decode(encode(draws)) ทุก byte — คืน packed dict ถ้าผ่าน"""
+    packed = encode(draws)
+    original = json.dumps(draws, ensure_ascii=False, separators=(',', ':'))
+    restored = json.dumps(decode(packed), ensure_ascii=False, separators=(',', ':'))
+    if original != restored:
+        raise ValueError("round-trip ไม่ตรงกับ JSON เดิม")
+    return packed
+
+
+NODE_BENCH = """
+const fs = require('fs');
+const runs = 20;
+for (const file of process.argv.slice(1)) {
+  const src = fs.readFileSync(file, 'utf8') + '\\n;return LOTTERY_STATIC_DATA;';
+  let best = Infinity, out = null;
+  for (let i = 0; i < runs; i++) {
+    const t = process.hrtime.bigint();
+    out = new Function(src + '\\n// ' + i)();  // source ต่างกันทุกรอบ → ไม่ใช้ code cache
+    best = Math.min(best, Number(process.hrtime.bigint() - t) / 1e6);
+  }
+  console.log(JSON.stringify({ file, ms: best, json: JSON.stringify(out) }));
+}
+"""
+
+
+def compare(json_js, packed_js):
+    """รายงานขนาดและเวลาโหลด (node ถ้ามี) ของไฟล์ JSON กับ packed และยืนยันว่า JS decoder ได้ผลเดียวกัน"""
+    report = {'json_bytes': len(json_js.encode('utf-8')), 'packed_bytes': len(packed_js.encode('utf-8'))}
+    node = shutil.which('node')
+    if not node:
+        return report
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, content in (('json.js', json_js), ('packed.js', packed_js)):
+            path = os.path.join(tmp, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            paths.append(path)
+        out = subprocess.run([node, '-e', NODE_BENCH] + paths, capture_output=True, text=True, check=True)
+    results = [json.loads(line) for line in out.stdout.splitlines()]
+    report['json_ms'] = results[0]['ms']
+    report['packed_ms'] = results[1]['ms']
+    report['js_roundtrip'] = results[0]['json'] == results[1]['json']
+    return report
+
+
+def print_report(report):
+    jb, pb = report['json_bytes'], report['packed_bytes']
+    print(f"   ขนาด JSON:   {jb / 1024:.1f} KB")
+    print(f"   ขนาด packed: {pb / 1024:.1f} KB ({jb / pb:.1f}x เล็กกว่า)")
+    if 'json_ms' in report:
+        print(f"   โหลดใน node: JSON {report['json_ms']:.2f} ms / packed {report['packed_ms']:.2f} ms")
+        print(f"   JS decoder:  {'✅ ตรงกับ JSON' if report['js_roundtrip'] else '❌ ไม่ตรงกับ JSON'}")
+
+
+def main(argv=None):
+    from update_static_data import load_static_data, render_js as render_json_js
+
+    ap = argparse.ArgumentParser(description='แปลง/ตรวจ lotteryStaticData.js แบบ packed '
+                                             '(ไฟล์เล็กลง ~2.8 เท่า แต่โหลดช้ากว่า JSON — ไม่ใช่การเร่ง startup)')
+    ap.add_argument('input', help='lotteryStaticData.js (JSON หรือ packed)')
+    ap.add_argument('-o', '--output', help='เขียนไฟล์ packed (แลกเวลา parse กับขนาดไฟล์)')
+    args = ap.parse_args(argv)
+
+    draws = load_static_data(args.input)
+    t = time.perf_counter()
+    verify(draws)
+    print(f"✅ Round-trip ผ่าน ({len(draws)} งวด, {(time.perf_counter() - t) * 1000:.1f} ms)")
+
+    json_js = render_json_js(draws)
+    packed_js = render_json_js(draws, packed=True)
+    report = compare(json_js, packed_js)
+    print_report(report)
+    if report.get('js_roundtrip') is False:
+        sys.exit(1)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(packed_js)
+        print(f"   เขียน {os.path.abspath(args.output)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+run_metrics.py — เก็บ metric ระหว่างรัน update_static_data.py แล้วเขียนรายงานตอนจบ
+
+- span(name)       จับเวลาแต่ละช่วง (รวมทุก thread): จำนวนครั้ง, เวลารวม, นานสุด
+- observe(ms)      histogram ของ latency ต่อ HTTP request (bucket คงที่ + p50/p95/p99)
+                   เก็บค่าดิบแค่ MAX_SAMPLES ค่า (reservoir sample) — ใช้ใน process ที่รันนานได้ (live_poller.py)
+- count(name, n)   counter เช่น retry, cache hit, status 5xx
+- cProfile / tracemalloc (เปิดด้วย flag) — cProfile จับเฉพาะ main thread
+  (งวดที่ดึงใน worker thread จะไม่อยู่ใน profile → ใช้ --workers 1 ถ้าต้องการ profile ส่วน fetch)
+
+รายงานเป็น JSON (และ Prometheus text format ถ้าต้องการ) พร้อม version ของ extension
+เพื่อเทียบระหว่าง release:
+
+Usage:
+  python3 scripts/run_metrics.py scripts/.cache/run_metrics.json               # สรุปรายงาน
+  python3 scripts/run_metrics.py old.json new.json --threshold 0.25             # เทียบ 2 รอบ (exit 1 ถ้าช้าลงเกิน 25%)
+"""
+
+import argparse, bisect, json, os, random, sys, threading, time
+from contextlib import contextmanager
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(SCRIPT_DIR, '.cache', 'run_metrics.json')
+MANIFEST = os.path.join(SCRIPT_DIR, '..', 'manifest.json')
+REPORT_VERSION = 1
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+MAX_SAMPLES = 4096  # ค่า latency ดิบที่เก็บไว้คำนวณ percentile (count/sum/max/bucket นับครบทุก request)
+PROFILE_TOP = 25
+TRACEMALLOC_TOP = 10
+
+
+def extension_version(path=MANIFEST):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f).get('version')
+    except (OSError, ValueError):
+        return None
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class Metrics:
+    """ที่เก็บ metric ของหนึ่งรอบการรัน ใช้ร่วมกันได้หลาย thread"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.profiler = None
+        self.tracing = False
+        self.reset()
+
+    def reset(self):
+        """ล้างทุก span / counter / latency — เริ่มรอบใหม่ใน process เดิม"""
+        with self.lock:
+            self.spans = {}      # name → [count, total_s, max_s]
+            self.counters = {}
+            self.latencies = []  # ms ต่อ request — reservoir sample ไม่เกิน MAX_SAMPLES ค่า
+            self.latency_count, self.latency_sum, self.latency_max = 0, 0.0, None
+            self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            self.started = time.perf_counter()
+
+    @contextmanager
+    def span(self, name):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, time.perf_counter() - t)
+
+    def add_span(self, name, seconds):
+        with self.lock:
+            s = self.spans.setdefault(name, [0, 0.0, 0.0])
+            s[0] += 1
+            s[1] += seconds
+            s[2] = max(s[2], seconds)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, ms):
+        with self.lock:
+            self.latency_count += 1
+            self.latency_sum += ms
+            self.latency_max = ms if self.latency_max is None else max(self.latency_max, ms)
+            self.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+            if len(self.latencies) < MAX_SAMPLES:
+                self.latencies.append(ms)
+            else:
+                i = random.randrange(self.latency_count)
+                if i < MAX_SAMPLES:
+                    self.latencies[i] = ms
+
+    # ---------- Profiling ----------
+
+    def start(self, profile=False, trace=False):
+        """เริ่มรอบใหม่: ล้าง metric ของรอบก่อน (+ เปิด cProfile / tracemalloc ถ้าขอ)"""
+        self.reset()
+        if trace:
+            import tracemalloc
+            tracemalloc.start(25)
+            self.tracing = True
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop_profiling(self, profile_path=None):
+        """หยุด profiler → (top functions, memory) สำหรับใส่ในรายงาน; profile_path = ไฟล์ .pstats"""
+        top, memory = None, None
+        if self.profiler:
+            import pstats
+            self.profiler.disable()
+            if profile_path:
+                os.makedirs(os.path.dirname(os.path.abspath(profile_path)), exist_ok=True)
+                self.profiler.dump_stats(profile_path)
+            stats = pstats.Stats(self.profiler).stats
+            rows = sorted(stats.items(), key=lambda kv: kv[1][3], reverse=True)[:PROFILE_TOP]
+            top = [{'function': f"{os.path.basename(file)}:{line}({name})", 'calls': nc,
+                    'tottime_s': round(tt, 6), 'cumtime_s': round(ct, 6)}
+                   for (file, line, name), (_, nc, tt, ct, _) in rows]
+            self.profiler = None
+        if self.tracing:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            snap = tracemalloc.take_snapshot().statistics('lineno')[:TRACEMALLOC_TOP]
+            tracemalloc.stop()
+            memory = {'current_bytes': current, 'peak_bytes': peak,
+                      'top': [{'where': f"{os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}",
+                               'bytes': s.size, 'blocks': s.count} for s in snap]}
+            self.tracing = False
+        return top, memory
+
+    # ---------- Report ----------
+
+    def latency_summary(self):
+        with self.lock:
+            values = sorted(self.latencies)
+            count, total, top, buckets = self.latency_count, self.latency_sum, self.latency_max, list(self.latency_buckets)
+        r = lambda v: None if v is None else round(v, 3)
+        return {
+            'count': count,
+            'sum_ms': round(total, 3),
+            'p50_ms': r(percentile(values, 0.50)),
+            'p95_ms': r(percentile(values, 0.95)),
+            'p99_ms': r(percentile(values, 0.99)),
+            'max_ms': r(top),
+            'buckets_ms': [[le, n] for le, n in zip(list(LATENCY_BUCKETS_MS) + ['+Inf'], buckets)],
+        }
+
+    def report(self, status='ok', extra=None, profile_path=None):
+        top, memory = self.stop_profiling(profile_path)
+        with self.lock:
+            spans = {name: {'count': c, 'total_s': round(t, 6), 'max_s': round(m, 6)}
+                     for name, (c, t, m) in sorted(self.spans.items())}
+            counters = dict(sorted(self.counters.items()))
+        report = {
+            'v': REPORT_VERSION,
+            'version': extension_version(),
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(time.time() - self.elapsed())),
+            'status': status,
+            'wall_s': round(self.elapsed(), 6),
+            'python': sys.version.split()[0],
+            'spans': spans,
+            'counters': counters,
+            'latency': self.latency_summary(),
+        }
+        report.update(extra or {})
+        if top is not None:
+            report['profile'] = {'path': profile_path, 'top_cumulative': top}
+        if memory is not None:
+            report['memory'] = memory
+        return report
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+def write_json(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+
+def to_prometheus(report, prefix='lottery_generator'):
+    """รายงาน → Prometheus text exposition format (สำหรับ node_exporter textfile collector / pushgateway)"""
+    label = f'{{version="{report.get("version") or ""}"}}'
+    lines = [f'# TYPE {prefix}_wall_seconds gauge', f'{prefix}_wall_seconds{label} {report["wall_s"]}',
+             f'# TYPE {prefix}_success gauge', f'{prefix}_success{label} {int(report["status"] == "ok")}']
+
+    lines.append(f'# TYPE {prefix}_span_seconds summary')
+    for name, s in report['spans'].items():
+        lines.append(f'{prefix}_span_seconds_sum{{span="{name}"}} {s["total_s"]}')
+        lines.append(f'{prefix}_span_seconds_count{{span="{name}"}} {s["count"]}')
+    counters = dict(report['counters'])
+    counters.update((f'http_{k}', v) for k, v in report.get('http', {}).items())
+    for name, value in counters.items():
+        metric = f'{prefix}_{name}_total'
+        lines += [f'# TYPE {metric} counter', f'{metric} {value}']
+
+    lat = report['latency']
+    metric = f'{prefix}_request_duration_seconds'
+    lines.append(f'# TYPE {metric} histogram')
+    cumulative = 0
+    for le, n in lat['buckets_ms']:
+        cumulative += n
+        bound = le if le == '+Inf' else f'{le / 1000:g}'
+        lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+    lines += [f'{metric}_sum {lat["sum_ms"] / 1000:g}', f'{metric}_count {lat["count"]}']
+
+    if 'memory' in report:
+        lines += [f'# TYPE {prefix}_memory_peak_bytes gauge', f'{prefix}_memory_peak_bytes {report["memory"]["peak_bytes"]}']
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(to_prometheus(report))
+    os.replace(path + '.tmp', path)
+
+
+def summary_line(report, spans=('phase.calendar', 'phase.list', 'phase.fetch', 'phase.validate',
+                                'phase.write', 'phase.dataset', 'phase.snapshot', 'phase.index')):
+    parts = [f"{name.split('.', 1)[1]} {report['spans'][name]['total_s']:.2f}s"
+             for name in spans if name in report['spans']]
+    lat = report['latency']
+    if lat['count']:
+        parts.append(f"latency p50 {lat['p50_ms']:.0f} ms / p95 {lat['p95_ms']:.0f} ms")
+    retries = report['counters'].get('retries', 0)
+    if retries:
+        parts.append(f"retry {retries}")
+    return ', '.join(parts)
+
+
+# ========== CLI ==========
+
+def load(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def print_report(report):
+    print(f"📈 รอบวันที่ {report['started']} (extension {report.get('version') or '?'}, "
+          f"{report['status']}) — wall {report['wall_s']:.2f}s")
+    print(f"\n{'span':<22} {'count':>6} {'total s':>9} {'max s':>8}")
+    for name, s in report['spans'].items():
+        print(f"{name:<22} {s['count']:>6} {s['total_s']:>9.3f} {s['max_s']:>8.3f}")
+    lat = report['latency']
+    if lat['count']:
+        print(f"\n🌐 {lat['count']} requests: p50 {lat['p50_ms']:.1f} ms, p95 {lat['p95_ms']:.1f} ms, "
+              f"p99 {lat['p99_ms']:.1f} ms, max {lat['max_ms']:.1f} ms")
+    if report['counters']:
+        print('   ' + ', '.join(f"{k} {v:,}" for k, v in report['counters'].items()))
+    for row in report.get('profile', {}).get('top_cumulative', [])[:10]:
+        print(f"   🔬 {row['cumtime_s']:>8.3f}s  {row['calls']:>7}  {row['function']}")
+    if 'memory' in report:
+        print(f"   🧠 peak {report['memory']['peak_bytes'] / 1024:.0f} KB")
+
+
+def compare(old, new, threshold):
+    """เวลาของแต่ละ span ที่เปลี่ยน → รายการ span ที่ช้าลงเกิน threshold (สัดส่วน)"""
+    print(f"{'span':<22} {'เดิม s':>9} {'ใหม่ s':>9} {'เปลี่ยน':>9}")
+    regressed = []
+    rows = [('wall', old['wall_s'], new['wall_s'])]
+    rows += [(name, old['spans'].get(name, {}).get('total_s'), s['total_s']) for name, s in new['spans'].items()]
+    for key in ('p50_ms', 'p95_ms'):
+        rows.append((f"latency.{key}", old['latency'].get(key), new['latency'].get(key)))
+    for name, a, b in rows:
+        if a is None or b is None:
+            print(f"{name:<22} {'-' if a is None else f'{a:.3f}':>9} {'-' if b is None else f'{b:.3f}':>9}")
+            continue
+        change = (b - a) / a if a else 0.0
+        flag = ''
+        if change > threshold and b - a > 0.001:
+            regressed.append(name)
+            flag = ' ⚠️'
+        print(f"{name:<22} {a:>9.3f} {b:>9.3f} {change:>+8.0%}{flag}")
+    return regressed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='สรุป/เทียบรายงาน metric ของ update_static_data.py')
+    ap.add_argument('reports', nargs='*', default=[DEFAULT_PATH], help='รายงาน 1 ไฟล์ = สรุป, 2 ไฟล์ = เทียบ (เดิม ใหม่)')
+    ap.add_argument('--threshold', type=float, default=0.25,
+                    help='สัดส่วนที่ยอมให้ช้าลงก่อนนับว่า regression (default: 0.25)')
+    args = ap.parse_args(argv)
+
+    if len(args.reports) == 1:
+        print_report(load(args.reports[0]))
+    elif len(args.reports) == 2:
+        old, new = (load(p) for p in args.reports)
+        print(f"📊 {old.get('version') or '?'} ({old['started']}) → {new.get('version') or '?'} ({new['started']})\n")
+        regressed = compare(old, new, args.threshold)
+        if regressed:
+            print(f"\n❌ ช้าลงเกิน {args.threshold:.0%}: {', '.join(regressed)}")
+            sys.exit(1)
+        print(f"\n✅ ไม่มี span ที่ช้าลงเกิน {args.threshold:.0%}")
+    else:
+        ap.error('ระบุรายงาน 1 หรือ 2 ไฟล์')
+
+
+if __name__ == '__main__':
+    main()
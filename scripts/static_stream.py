@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+static_stream.py — เขียน/อ่าน lotteryStaticData.js แบบ streaming (หน่วยความจำคงที่)
+
+StaticDataWriter รับ draw ทีละงวดตามลำดับที่ดึงเสร็จ (ไม่เรียง) แล้วเขียนออกเรียงใหม่ → เก่า:
+  - เก็บ draw ใน buffer ขนาดจำกัด เต็มแล้วเรียงและเขียนเป็น run (JSONL ชั่วคราว)
+  - ตอน close() merge ทุก run ด้วย heapq.merge แล้วเขียน array ทีละงวดลงไฟล์ .tmp
+  - header (ช่วงวันที่ + จำนวนงวด) รู้ตอนท้าย จึงเขียน body แยกไว้ก่อนแล้วต่อท้าย header
+  - os.replace เป็นขั้นสุดท้าย — ไฟล์เดิมไม่เสียถ้าถูกขัดจังหวะกลางทาง
+  - run ชั่วคราวอยู่ใน scripts/.cache/ (gitignore) — ถูก kill กลางทางก็ไม่ทิ้งไฟล์ไว้ใน repo จน release.sh ไม่ผ่าน
+ผลลัพธ์ตรงกับ render_js() ใน update_static_data.py ทุก byte
+
+iter_draws อ่าน LOTTERY_STATIC_DATA = [...] ทีละ chunk แล้ว yield ทีละงวด
+(ไฟล์ packed เป็น columnar จึงต้อง decode ทั้งก้อน — ดู packed_format.py)
+
+Usage:
+  python3 scripts/static_stream.py lotteryStaticData.js                  # ตรวจว่าอ่านแบบ stream ได้ผลเดียวกัน
+  python3 scripts/static_stream.py lotteryStaticData.js --scale 40       # จำลองไฟล์ใหญ่ 40 เท่า วัด peak memory
+  python3 scripts/static_stream.py lotteryStaticData.js -o /tmp/out.js   # เขียนใหม่ด้วย StaticDataWriter
+"""
+
+import argparse, heapq, json, os, shutil, sys, tempfile, time, tracemalloc
+
+DEFAULT_BUFFER = 512   # งวดต่อ run ที่เรียงในหน่วยความจำ
+TMP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+READ_CHUNK = 64 * 1024
+
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+
+def _date(entry):
+    return entry[0]
+
+
+class StaticDataWriter:
+    """เขียน const LOTTERY_STATIC_DATA = [...] แบบ streaming + atomic rename
+
+    header(newest, oldest, total) → comment block ด้านบนไฟล์ (เรียกตอน close)
+    ใช้เป็น context manager: ออกจาก with ปกติ = close(), เกิด exception = abort()
+    """
+
+    def __init__(self, path, header, buffer_size=DEFAULT_BUFFER, tmp_dir=TMP_DIR):
+        self.path = path
+        self.header = header
+        self.buffer_size = max(1, buffer_size)
+        self.buffer = []
+        self.runs = []
+        self.count = 0
+        self.tmp = path + '.tmp'  # ข้าง output เพื่อให้ os.replace เป็น rename ใน filesystem เดียวกัน
+        os.makedirs(tmp_dir, exist_ok=True)
+        self.tmpdir = tempfile.mkdtemp(prefix='static_stream_', dir=tmp_dir)
+
+    def add(self, draw):
+        self.buffer.append((draw['date'], _dumps(draw if isinstance(draw, dict) else draw.to_dict())))
+        self.count += 1
+        if len(self.buffer) >= self.buffer_size:
+            self._spill()
+
+    def _spill(self):
+        """เรียง buffer ใหม่ → เก่า แล้วเขียนเป็น run หนึ่งไฟล์"""
+        self.buffer.sort(key=_date, reverse=True)
+        path = os.path.join(self.tmpdir, f"run{len(self.runs)}.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            for date, line in self.buffer:
+                f.write(f"{date}\t{line}\n")
+        self.runs.append(path)
+        self.buffer = []
+
+    def _merged(self):
+        """ทุก run + buffer ที่เหลือ เรียงใหม่ → เก่า (อ่านทีละบรรทัดจากแต่ละ run)"""
+        self.buffer.sort(key=_date, reverse=True)
+        files = [open(p, encoding='utf-8') for p in self.runs]
+        try:
+            streams = [(line.rstrip('\n').split('\t', 1) for line in f) for f in files] + [iter(self.buffer)]
+            yield from heapq.merge(*streams, key=_date, reverse=True)
+        finally:
+            for f in files:
+                f.close()
+
+    def close(self):
+        """merge แล้วเขียนไฟล์จริง → จำนวนงวด (ValueError ถ้าไม่มีงวดเลย)"""
+        try:
+            if not self.count:
+                raise ValueError("ไม่มีข้อมูลงวดใดเลย")
+            body = os.path.join(self.tmpdir, 'body')
+            newest = oldest = None
+            with open(body, 'w', encoding='utf-8') as f:
+                f.write("const LOTTERY_STATIC_DATA = [")
+                for i, (date, line) in enumerate(self._merged()):
+                    if i:
+                        f.write(',')
+                    else:
+                        newest = date
+                    f.write(line)
+                    oldest = date
+                f.write("];\n")
+
+            with open(self.tmp, 'w', encoding='utf-8') as out, open(body, encoding='utf-8') as f:
+                out.write(self.header(newest, oldest, self.count))
+                shutil.copyfileobj(f, out)
+            os.replace(self.tmp, self.path)
+            return self.count
+        finally:
+            self.abort()
+
+    def abort(self):
+        """ทิ้งไฟล์ชั่วคราวทั้งหมด (ไฟล์ output เดิมไม่ถูกแตะ)"""
+        self.buffer = []
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        if os.path.exists(self.tmp):
+            os.remove(self.tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def iter_draws(path, chunk_size=READ_CHUNK):
+    """yield draw ทีละงวดจาก lotteryStaticData.js (ลำดับเดียวกับในไฟล์)
+
+    อ่านทีละ chunk แล้ว raw_decode ทีละ object — หน่วยความจำใช้แค่ chunk + draw ปัจจุบัน
+    """
+    with open(path, encoding='utf-8') as f:
+        buf = ''
+        while True:
+            if 'LOTTERY_STATIC_PACKED' in buf:
+                break
+            at = buf.find('LOTTERY_STATIC_DATA')
+            if at >= 0 and '[' in buf[at:]:
+                break
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError(f"ไม่พบ LOTTERY_STATIC_DATA ใน {path}")
+            buf += chunk
+
+        if 'LOTTERY_STATIC_PACKED' in buf:
+            import packed_format
+            yield from packed_format.load_packed(buf + f.read())
+            return
+
+        start = buf.find('LOTTERY_STATIC_DATA')
+        start = buf.index('=', start) + 1
+        buf = buf[start:].lstrip()
+        if not buf.startswith('['):
+            raise ValueError(f"{path}: LOTTERY_STATIC_DATA ไม่ใช่ array")
+        buf = buf[1:]
+
+        decode = json.JSONDecoder().raw_decode
+        pos, eof = 0, False
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buf) and buf[pos] == ']':
+                return
+            try:
+                draw, end = decode(buf, pos)
+            except json.JSONDecodeError:
+                end = None
+            # object ที่จบพอดีขอบ chunk อาจถูก decode ได้ทั้งที่ยังไม่ครบ (เช่นตัวเลข) — อ่านต่อให้มีตัวถัดไปก่อน
+            if end is None or (end >= len(buf) and not eof):
+                if eof:
+                    raise ValueError(f"{path}: LOTTERY_STATIC_DATA ไม่สมบูรณ์ (ไฟล์ถูกตัด?)")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield draw
+            pos = end
+
+
+def _scaled(draws, scale):
+    """จำลองข้อมูลหลายสิบปี: สำเนา draws เลื่อนปีถอยหลังทีละช่วงปีของข้อมูล"""
+    span = int(draws[0]['date'][:4]) - int(draws[-1]['date'][:4]) + 1
+    for k in range(scale):
+        for d in draws:
+            yield {**d, 'date': f"{int(d['date'][:4]) - k * span:04d}{d['date'][4:]}"}
+
+
+def _peak(fn):
+    tracemalloc.start()
+    t = time.perf_counter()
+    try:
+        result = fn()
+        return result, tracemalloc.get_traced_memory()[1], time.perf_counter() - t
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='เขียน/อ่าน lotteryStaticData.js แบบ streaming')
+    ap.add_argument('input', help='lotteryStaticData.js')
+    ap.add_argument('-o', '--output', help='เขียนใหม่ด้วย StaticDataWriter')
+    ap.add_argument('--scale', type=int, default=1, help='จำลองไฟล์ใหญ่ขึ้น N เท่า (เลื่อนปีถอยหลัง) เพื่อวัด peak memory')
+    ap.add_argument('--buffer', type=int, default=DEFAULT_BUFFER, help=f'งวดต่อ run (default: {DEFAULT_BUFFER})')
+    args = ap.parse_args(argv)
+
+    from update_static_data import load_static_data, render_js, render_header
+
+    source = args.input
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.scale > 1:
+            draws = list(iter_draws(source))
+            source = os.path.join(tmp, 'scaled.js')
+            with StaticDataWriter(source, render_header, args.buffer) as w:
+                for d in _scaled(draws, args.scale):
+                    w.add(d)
+            del draws
+        size = os.path.getsize(source)
+        print(f"📄 {source}: {size / 1024:.0f} KB")
+
+        full, full_peak, full_s = _peak(lambda: load_static_data(source))
+        n = len(full)
+        digest = _dumps(full)
+        del full
+        count, stream_peak, stream_s = _peak(lambda: sum(1 for _ in iter_draws(source)))
+        same = _dumps(list(iter_draws(source))) == digest
+        print(f"   อ่านทั้งก้อน : {n:,} งวด, peak {full_peak / 1024 / 1024:6.1f} MB, {full_s * 1000:7.1f} ms")
+        print(f"   อ่านแบบ stream: {count:,} งวด, peak {stream_peak / 1024 / 1024:6.1f} MB, {stream_s * 1000:7.1f} ms")
+
+        def write_stream():
+            with StaticDataWriter(os.path.join(tmp, 'stream.js'), render_header, args.buffer) as w:
+                for d in iter_draws(source):
+                    w.add(d)
+        _, write_peak, write_s = _peak(write_stream)
+        _, render_peak, render_s = _peak(lambda: render_js(load_static_data(source)))
+        print(f"   เขียนทั้งก้อน : peak {render_peak / 1024 / 1024:6.1f} MB, {render_s * 1000:7.1f} ms")
+        print(f"   เขียนแบบ stream: peak {write_peak / 1024 / 1024:6.1f} MB, {write_s * 1000:7.1f} ms")
+        with open(os.path.join(tmp, 'stream.js'), encoding='utf-8') as f:
+            same = same and f.read() == render_js(load_static_data(source))
+
+    if args.output:
+        with StaticDataWriter(args.output, render_header, args.buffer) as w:
+            for d in iter_draws(args.input):
+                w.add(d)
+        print(f"💾 {os.path.abspath(args.output)}")
+    print("✅ stream ตรงกับการอ่าน/เขียนทั้งก้อน" if same else "❌ ผลไม่ตรงกัน")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""
+store_layout.py — render ภาพโปรโมท Chrome Web Store จาก spec แบบ declarative (store_spec.json)
+
+spec มี 3 ส่วนที่ประกอบกันเป็น matrix: locale × theme × scale ต่อทุก layout
+  themes   ชื่อสี (card, accent, text, ...) → '#rrggbb'; background เป็นสีเดียวหรือ [บน, ล่าง] = gradient
+  locales  ข้อความทุกชิ้น (string หรือ list สำหรับ pills/grid/list)
+  layouts  ขนาดฐาน + รายการ element ตามลำดับการวาด:
+             card / rect / line   กล่องมุมมน / สี่เหลี่ยม / เส้น      box: [x0, y0, x1, y1]
+             icon                 วาง icon128.png ย่อเป็น size       x: 'center' หรือตัวเลข
+             text                 ข้อความ key ของ locale            x: 'center' หรือตัวเลข
+             pills / grid / list  กล่องเรียงแถว / ตาราง / รายการ ของ list ใน locale
+           พิกัดติดลบ = นับจากขอบขวา/ล่าง, 'c-100' = 100 px ซ้ายของกึ่งกลาง; ทุกค่าคูณ scale
+
+ชั้นที่ไม่ขึ้นกับภาษา (พื้นหลัง/gradient, การ์ด, แถบ, icon, กล่องของ pills/grid/list) render ครั้งเดียว
+ต่อ (layout, theme, scale) ใน process แล้ว copy ไปวาดข้อความของแต่ละ locale ทับ
+(ทุก layout วาดข้อความหลังกล่องที่รองรับอยู่แล้ว ผลจึงเหมือนวาดทีละ element ตามลำดับ)
+
+Requires: pip install Pillow
+"""
+
+import json, os
+from functools import lru_cache
+
+from PIL import Image, ImageColor, ImageDraw
+
+from asset_render import default_font, find_font, load_font
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SPEC_PATH = os.path.join(SCRIPT_DIR, 'store_spec.json')
+
+THAI_FONTS = (
+    '/System/Library/Fonts/Thonburi.ttc',
+    '/System/Library/Fonts/Supplemental/Thonburi.ttc',
+    '/Library/Fonts/Thonburi.ttc',
+    '/System/Library/Fonts/Supplemental/Arial Unicode.ttf',
+)
+
+SHAPES = ('card', 'rect', 'line', 'icon')
+ITEMS = ('pills', 'grid', 'list')
+
+_BASES = {}  # ชั้นพื้นหลังที่ render แล้วใน process นี้
+
+
+def get_font(size, bold=False):
+    """Try to get a Thai-capable font (หา path ครั้งเดียว, โหลดครั้งเดียวต่อขนาด)."""
+    return load_font(find_font(*THAI_FONTS), size) or default_font()
+
+
+def load_spec(path=SPEC_PATH):
+    with open(path, encoding='utf-8') as f:
+        spec = json.load(f)
+    for name, layout in spec['layouts'].items():
+        for el in layout['elements']:
+            if el['type'] not in SHAPES + ITEMS + ('text',):
+                raise ValueError(f"{name}: ไม่รู้จัก element '{el['type']}'")
+    return spec
+
+
+def used_strings(layout):
+    """key ของ locale ที่ layout ใช้ (ใส่เฉพาะส่วนนี้ใน job → แก้ข้อความ layout อื่นไม่ต้อง render ใหม่)"""
+    return [el['text'] if el['type'] == 'text' else el['items']
+            for el in layout['elements'] if el['type'] == 'text' or el['type'] in ITEMS]
+
+
+def output_size(layout, scale):
+    w, h = layout['size']
+    return round(w * scale), round(h * scale)
+
+
+# ========== Geometry ==========
+
+def _coord(v, extent, s):
+    """ค่าใน spec → pixel (ติดลบ = จากขอบขวา/ล่าง, 'c±n' = จากกึ่งกลาง)"""
+    if isinstance(v, str):
+        return extent // 2 + round(int(v[1:] or 0) * s)
+    v = round(v * s)
+    return extent + v if v < 0 else v
+
+
+def _box(box, W, H, s):
+    x0, y0, x1, y1 = box
+    return (_coord(x0, W, s), _coord(y0, H, s), _coord(x1, W, s), _coord(y1, H, s))
+
+
+def _item_boxes(el, n, W, H, s):
+    """กล่องของ item ทั้ง n ชิ้นของ pills/grid/list"""
+    sc = lambda v: round(v * s)
+    if el['type'] == 'pills':
+        w, gap, y = sc(el['w']), sc(el['gap']), _coord(el['y'], H, s)
+        x = W // 2 - (n * w + (n - 1) * gap) // 2
+        return [(x + i * (w + gap), y, x + i * (w + gap) + w, y + sc(el['h'])) for i in range(n)]
+    if el['type'] == 'grid':
+        cols, w, h, gap = el['cols'], sc(el['w']), sc(el['h']), sc(el['gap'])
+        x, y = W // 2 - (cols * w + (cols - 1) * gap) // 2, _coord(el['y'], H, s)
+        return [(x + (i % cols) * (w + gap), y + (i // cols) * (h + gap),
+                 x + (i % cols) * (w + gap) + w, y + (i // cols) * (h + gap) + h) for i in range(n)]
+    x, x1, y = _coord(el['x'], W, s), _coord(el['x1'], W, s), _coord(el['y'], H, s)
+    return [(x, y + i * sc(el['step']), x1, y + i * sc(el['step']) + sc(el['h'])) for i in range(n)]
+
+
+def _color(name, theme):
+    return None if name is None else name if name.startswith('#') else theme[name]
+
+
+def _text_width(draw, text, font):
+    bbox = draw.textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0]
+
+
+@lru_cache(maxsize=None)
+def _icon(path, size):
+    return Image.open(path).resize((size, size), Image.LANCZOS)
+
+
+# ========== Layers ==========
+
+def _background(theme, W, H):
+    bg = theme['background']
+    if isinstance(bg, str):
+        return Image.new('RGB', (W, H), bg)
+    top, bottom = (Image.new('RGB', (W, H), ImageColor.getrgb(c)) for c in bg)
+    return Image.composite(bottom, top, Image.linear_gradient('L').resize((W, H)))
+
+
+def render_base(layout, theme, scale, counts, icon_path):
+    """ชั้นที่ไม่มีข้อความ: พื้นหลัง, shape, icon และกล่องของ pills/grid/list (counts = จำนวน item)"""
+    W, H = output_size(layout, scale)
+    img = _background(theme, W, H)
+    draw = ImageDraw.Draw(img)
+    items = iter(counts)
+    for el in layout['elements']:
+        t = el['type']
+        if t == 'card':
+            draw.rounded_rectangle(_box(el['box'], W, H, scale), radius=round(el['radius'] * scale),
+                                   fill=_color(el['fill'], theme))
+        elif t == 'rect':
+            draw.rectangle(_box(el['box'], W, H, scale), fill=_color(el['fill'], theme))
+        elif t == 'line':
+            draw.line(_box(el['box'], W, H, scale), fill=_color(el['fill'], theme),
+                      width=max(1, round(el['width'] * scale)))
+        elif t == 'icon':
+            if os.path.exists(icon_path):
+                n = round(el['size'] * scale)
+                icon = _icon(icon_path, n)
+                x = W // 2 - n // 2 if el['x'] == 'center' else _coord(el['x'], W, scale)
+                img.paste(icon, (x, _coord(el['y'], H, scale)), icon if icon.mode == 'RGBA' else None)
+        elif t in ITEMS:
+            for box in _item_boxes(el, next(items), W, H, scale):
+                draw.rounded_rectangle(box, radius=round(el['radius'] * scale), fill=_color(el['fill'], theme))
+    return img
+
+
+def cached_base(layout, theme, scale, counts, icon_path):
+    """render_base ครั้งเดียวต่อ (layout, theme, scale, จำนวน item) ใน process นี้ — คืนสำเนา"""
+    key = json.dumps([layout, theme, scale, counts, icon_path], sort_keys=True)
+    if key not in _BASES:
+        _BASES[key] = render_base(layout, theme, scale, counts, icon_path)
+    return _BASES[key].copy()
+
+
+def render_variant(layout, strings, theme, scale, icon_path):
+    """ภาพหนึ่ง variant: ชั้นพื้น (ใช้ซ้ำ) + ข้อความของ locale → PIL Image"""
+    counts = [len(strings[el['items']]) for el in layout['elements'] if el['type'] in ITEMS]
+    img = cached_base(layout, theme, scale, counts, icon_path)
+    W, H = img.size
+    draw = ImageDraw.Draw(img)
+    sc = lambda v: round(v * scale)
+    for el in layout['elements']:
+        t = el['type']
+        if t == 'text':
+            text, font = strings[el['text']], get_font(sc(el['size']))
+            x = W // 2 - _text_width(draw, text, font) // 2 if el['x'] == 'center' else _coord(el['x'], W, scale)
+            draw.text((x, _coord(el['y'], H, scale)), text, fill=_color(el['color'], theme), font=font)
+        elif t == 'pills':
+            font = get_font(sc(el['size']))
+            items = strings[el['items']]
+            for (x0, y0, x1, _), text in zip(_item_boxes(el, len(items), W, H, scale), items):
+                tw = _text_width(draw, text, font)
+                draw.text((x0 + (x1 - x0) // 2 - tw // 2, y0 + sc(el['dy'])), text,
+                          fill=_color(el['color'], theme), font=font)
+        elif t == 'grid':
+            items = strings[el['items']]
+            for (x0, y0, x1, _), texts in zip(_item_boxes(el, len(items), W, H, scale), items):
+                for line, text in zip(el['lines'], texts):
+                    font = get_font(sc(line['size']))
+                    tw = _text_width(draw, text, font)
+                    draw.text((x0 + (x1 - x0) // 2 - tw // 2, y0 + sc(line['dy'])), text,
+                              fill=_color(line['color'], theme), font=font)
+        elif t == 'list':
+            font = get_font(sc(el['size']))
+            items = strings[el['items']]
+            for (x0, y0, _, _), text in zip(_item_boxes(el, len(items), W, H, scale), items):
+                draw.text((x0 + sc(el['dx']), y0 + sc(el['dy'])), text, fill=_color(el['color'], theme), font=font)
+    return img
+
+
+def variants(spec, locales=None, themes=None, scales=None):
+    """ทุก variant ใน matrix → [(layout, locale, theme, scale)] เรียงให้ variant ที่ใช้ชั้นพื้นเดียวกันอยู่ติดกัน"""
+    locales = locales or list(spec['locales'])
+    themes = themes or list(spec['themes'])
+    scales = scales or spec.get('scales', [1])
+    for name, values in (('locale', locales), ('theme', themes)):
+        missing = [v for v in values if v not in spec[name + 's']]
+        if missing:
+            raise ValueError(f"ไม่มี {name} ใน spec: {', '.join(missing)}")
+    return [(layout, locale, theme, scale)
+            for layout in spec['layouts'] for theme in themes for scale in scales for locale in locales]
+
+
+def variant_args(spec, layout, locale, theme, scale, icon_path):
+    """argument ของ render_variant — เฉพาะส่วนของ spec ที่ variant นี้ใช้ (เป็น key ของ content-hash cache)"""
+    lay = spec['layouts'][layout]
+    strings = {k: spec['locales'][locale][k] for k in used_strings(lay)}
+    return (lay, strings, spec['themes'][theme], scale, icon_path)
+
+
+def file_name(spec, layout, scale):
+    w, h = output_size(spec['layouts'][layout], scale)
+    return f"{layout}_{w}x{h}.png"
@@ -0,0 +1,8 @@
+"""pytest: ให้ test import สคริปต์ใน scripts/ ได้เหมือนรันจาก scripts/ โดยตรง"""
+
+import os, sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
@@ -0,0 +1,21 @@
+"""lottery_analysis ตรงกับ lotteryAnalysis.js + ข้อมูลที่ ship ผ่าน draw_validator"""
+
+import shutil
+
+import pytest
+
+from draw_validator import validate
+from lottery_analysis import DrawMatrix, parity
+from update_static_data import load_static_data, OUTPUT
+
+
+def test_shipped_data_passes_validator():
+    report = validate(load_static_data(OUTPUT))
+    assert report.ok, [x for x in report.issues if x.severity == 'error'][:5]
+
+
+@pytest.mark.skipif(not shutil.which('node'), reason='ต้องมี node เพื่อรัน lotteryAnalysis.js')
+def test_numpy_analysis_matches_js():
+    total, failures = parity(DrawMatrix.from_file())
+    assert total
+    assert not failures
@@ -0,0 +1,73 @@
+"""update_static_data: ดึงพร้อมกันได้ผลเดียวกับ serial ทุก byte + การอ่าน Retry-After"""
+
+import contextlib, io, os
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+import mock_api
+import update_static_data as usd
+from http_pool import HTTPError, HttpClient
+
+CUTOFF = '2021-02-18'
+
+
+@pytest.fixture(scope='module')
+def server():
+    server, url = mock_api.start_in_thread(mock_api.load_routes())
+    yield url
+    server.stop()
+
+
+@pytest.fixture
+def generate(server, tmp_path, monkeypatch):
+    """รัน main() กับ mock server → เนื้อหาไฟล์ output (ตัดบรรทัด Generated: ที่เป็นเวลาที่รัน)"""
+    monkeypatch.setattr(usd, 'cutoff_date', lambda: CUTOFF)
+    monkeypatch.setattr(usd, 'HTTP_CACHE', None)
+
+    def run(workers):
+        client = HttpClient(timeout=15)
+        monkeypatch.setattr(usd, 'HTTP_CLIENT', client)
+        out = tmp_path / f"workers{workers}"
+        out.mkdir()
+        argv = ['--api', server, '--output', str(out / 'static.js'), '--workers', str(workers), '--rate', '0',
+                '--discovery', 'list', '--no-cache', '--no-snapshot', '--no-index', '--no-metrics',
+                '--journal', str(out / 'journal.jsonl'), '--failure-report', str(out / 'failures.json')]
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                usd.main(argv)
+        finally:
+            client.close()
+        with open(out / 'static.js', encoding='utf-8') as f:
+            return ''.join(line for line in f if not line.startswith(' * Generated:'))
+    return run
+
+
+def test_concurrent_output_matches_serial(generate):
+    serial = generate(1)
+    assert ' * Total: 120 draws' in serial  # ทุกงวดของ mock ตั้งแต่ CUTOFF
+    assert generate(8) == serial
+
+
+def retry_error(value):
+    return HTTPError('http://api/lotto/1', 429, 'Too Many Requests', retry_after=value)
+
+
+def test_retry_after_seconds():
+    assert usd.retry_after_delay(retry_error('3')) == 3.0
+    assert usd.retry_after_delay(retry_error('120')) == 120.0  # ไม่ถูก clamp ที่ RETRY_CAP
+
+
+def test_retry_after_http_date():
+    now = datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+    at = format_datetime(now + timedelta(seconds=30), usegmt=True)
+    assert usd.retry_after_delay(retry_error(at), now=now) == pytest.approx(30.0)
+    past = format_datetime(now - timedelta(minutes=5), usegmt=True)
+    assert usd.retry_after_delay(retry_error(past), now=now) == 0.0
+
+
+def test_retry_after_missing_or_invalid():
+    assert usd.retry_after_delay(retry_error(None)) is None
+    assert usd.retry_after_delay(retry_error('soon')) is None
+    assert usd.retry_after_delay(ValueError('boom')) is None
@@ -0,0 +1,53 @@
+"""fetch_journal: --resume ใช้ journal เดิมเฉพาะรอบที่ยังไม่จบและรันด้วย argument เดียวกัน"""
+
+from fetch_journal import FetchJournal, load_journal
+
+RUN = {'api': 'http://api', 'cutoff': '2021-02-18', 'output': '/tmp/static.js'}
+ITEM = {'id': '160269', 'date': '2026-02-16'}
+DRAW = {'date': '2026-02-16', 'first': '123456'}
+
+
+def interrupted(path, **run):
+    journal = FetchJournal(path, **(run or RUN))
+    journal.record_draw(ITEM, DRAW)
+    journal.record_failure({'id': '010369', 'date': '2026-02-01'}, 'HTTP 500')
+    journal.close()
+
+
+def test_resume_same_run(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    interrupted(path)
+    journal = FetchJournal(path, resume=True, **RUN)
+    journal.close()
+    assert journal.draws == {ITEM['id']: DRAW}
+    assert list(journal.failures) == ['010369']
+
+
+def test_resume_different_run_starts_fresh(tmp_path, capsys):
+    path = str(tmp_path / 'journal.jsonl')
+    for changed in ({'api': 'http://other'}, {'cutoff': '2020-01-01'}, {'output': '/tmp/other.js'}):
+        interrupted(path)
+        journal = FetchJournal(path, resume=True, **{**RUN, **changed})
+        journal.close()
+        assert journal.draws == {} and journal.failures == {}
+        assert load_journal(path)[1] == {}  # ไฟล์ถูกเริ่มใหม่ด้วย ไม่ใช่แค่ไม่อ่าน
+    assert 'run record ไม่ตรง' in capsys.readouterr().out
+
+
+def test_resume_after_finished_run_starts_fresh(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = FetchJournal(path, **RUN)
+    journal.record_draw(ITEM, DRAW)
+    journal.finish(1, 0)
+    journal.close()
+    assert load_journal(path)[3]
+
+    journal = FetchJournal(path, resume=True, **RUN)
+    journal.close()
+    assert journal.draws == {}
+
+
+def test_resume_without_journal(tmp_path):
+    journal = FetchJournal(str(tmp_path / 'missing.jsonl'), resume=True, **RUN)
+    journal.close()
+    assert journal.draws == {}
@@ -5,17 +5,60 @@ update_static_data.py — ดึงข้อมูลหวย 5 ปีย้อ
 
 Usage:
   python3 scripts/update_static_data.py
+  python3 scripts/update_static_data.py --workers 1            # ดึงทีละงวด (serial)
+  python3 scripts/update_static_data.py --workers 16 --rate 30 # ดึงพร้อมกัน 16 งวด ไม่เกิน 30 req/s
+  python3 scripts/update_static_data.py --api http://127.0.0.1:8080 --output /tmp/out.js
+  python3 scripts/update_static_data.py --incremental          # ดึงเฉพาะงวดที่ยังไม่มีในไฟล์เดิม
+  python3 scripts/update_static_data.py --discovery list       # ไล่ /list ทุกหน้าแทนการใช้ปฏิทินวันออกรางวัล
+  python3 scripts/update_static_data.py --no-cache             # ไม่ใช้ HTTP cache (scripts/.cache/)
+  python3 scripts/update_static_data.py --resume               # ทำต่อจากรอบที่ถูกขัดจังหวะ (fetch journal)
+  python3 scripts/update_static_data.py --format packed        # ไฟล์เล็กลงแต่โหลดช้ากว่า JSON (opt-in, ดู packed_format.py)
+  python3 scripts/update_static_data.py --no-snapshot          # ไม่สร้าง lotteryAnalysisSnapshot.js
+  python3 scripts/update_static_data.py --no-index             # ไม่สร้าง inverted index ของเลขที่ถูกรางวัล
+  python3 scripts/update_static_data.py --strict               # ข้อมูลไม่ผ่าน draw_validator.py = ไม่เขียนไฟล์
+  python3 scripts/update_static_data.py --archive              # ดึงทุกงวดที่มี เขียนเป็น archive/{ปี}.json + manifest
+  python3 scripts/update_static_data.py --dataset              # เพิ่ม version ใน dataset/ + delta จาก version ก่อน ๆ
+  python3 scripts/update_static_data.py --profile /tmp/gen.pstats --tracemalloc --prometheus /tmp/gen.prom
 
 Output:
   lotteryStaticData.js (ในโฟลเดอร์เดียวกับ script)
+  lotteryAnalysisSnapshot.js — สถิติที่คำนวณไว้ล่วงหน้า (ดู analysis_snapshot.py, ต้องมี numpy)
+  scripts/.cache/number_index.json — inverted index สำหรับตรวจสลาก (ดู number_index.py)
+  dataset/ (--dataset) — version แบบ content-addressed + delta สำหรับ client/mirror (ดู dataset_versions.py)
+  scripts/.cache/run_metrics.json — เวลาแต่ละช่วง, latency ต่อ request, retry/byte counter (ดู run_metrics.py)
+
+ตั้ง SOURCE_DATE_EPOCH เพื่อให้ header "Generated" คงที่ (reproducible build)
 """
 
-import json, urllib.request, sys, time, os
+import argparse, json, random, sys, time, os, threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from http_cache import ResponseCache, ttl_for, DEFAULT_PATH as CACHE_PATH, DEFAULT_MAX_BYTES as CACHE_MAX_BYTES
+from http_pool import HttpClient, HTTPError
+from fetch_journal import FetchJournal, DEFAULT_PATH as JOURNAL_PATH
+from number_index import NumberIndex, DEFAULT_PATH as INDEX_PATH
+from lottery_archive import Archive, write_archive, DEFAULT_DIR as ARCHIVE_DIR
+import dataset_versions
+import packed_format
+from static_stream import StaticDataWriter, iter_draws
+from draw_model import Draw, EXPECTED, tier_numbers, to_draw, to_dicts
+from draw_calendar import DrawCalendar, draw_id, nearest_slot
+from run_metrics import Metrics, DEFAULT_PATH as METRICS_PATH, summary_line, write_json, write_prometheus
 
 API = "https://lotto.api.rayriffy.com"
 YEARS_BACK = 5
+DEFAULT_WORKERS = 8
+DEFAULT_RATE = 20.0  # requests ต่อวินาที (รวมทุก worker)
+RETRY_BASE = 0.5     # วินาที — backoff ครั้งแรก แล้วคูณ 2 ทุกครั้ง
+RETRY_CAP = 8.0      # วินาที — backoff สูงสุด
+RETRY_AFTER_MAX = 60.0  # วินาที — Retry-After ที่ยอมรอ (server ขอนานกว่านี้ = เลิกลองงวดนั้นทันที)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT = os.path.join(SCRIPT_DIR, '..', 'lotteryStaticData.js')
+FAILURE_REPORT = os.path.join(SCRIPT_DIR, '.cache', 'fetch_failures.json')
+
+HTTP_CACHE = None  # ResponseCache — ตั้งค่าใน main() (None = ไม่ใช้ cache)
+HTTP_CLIENT = HttpClient(timeout=15)  # keep-alive + gzip ใช้ connection ร่วมกันทั้งรอบการรัน
+METRICS = Metrics()  # span / latency / counter ของรอบนี้ (run_metrics.py) — เขียนรายงานตอนจบ main()
 
 THAI_MONTHS = {
     'มกราคม': '01', 'กุมภาพันธ์': '02', 'มีนาคม': '03', 'เมษายน': '04',
@@ -34,14 +77,101 @@ def thai_to_iso(s):
     return s
 
 
-def api_get(url, retries=3):
+class RateLimiter:
+    """Token bucket — จำกัด request/วินาที รวมทุก thread (แทน time.sleep(0.1) แบบเดิม)"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate or self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def backoff_delay(attempt):
+    """Exponential backoff + full jitter — worker หลายตัวที่ล้มพร้อมกันจะไม่ยิงซ้ำพร้อมกัน"""
+    return random.uniform(0, min(RETRY_CAP, RETRY_BASE * 2 ** attempt))
+
+
+def retry_after_delay(e, now=None):
+    """วินาทีที่ server ขอให้รอ (Retry-After: วินาที หรือ HTTP-date) — None = ไม่ได้ระบุ"""
+    from datetime import datetime, timezone
+    from email.utils import parsedate_to_datetime
+
+    value = getattr(e, 'retry_after', None)
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        delay = float(value)
+    else:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        delay = (when - (now or datetime.now(timezone.utc))).total_seconds()
+    return max(0.0, delay)
+
+
+def is_retryable(e):
+    # 4xx (ยกเว้น 429) ยิงซ้ำก็ได้ผลเหมือนเดิม
+    return not isinstance(e, HTTPError) or e.status == 429 or e.status >= 500
+
+
+def api_get(url, retries=4):
+    cache = HTTP_CACHE
+    entry = cache.get(url) if cache else None
+    if entry and entry['fresh']:
+        METRICS.count('cache_fresh')
+        return json.loads(entry['body'].decode('utf-8'))
+
     for attempt in range(retries):
         try:
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            return json.loads(urllib.request.urlopen(req, timeout=15).read().decode('utf-8'))
+            t = time.perf_counter()
+            try:
+                resp = HTTP_CLIENT.get(url, cache.validators(entry) if entry else None)
+            finally:
+                METRICS.observe((time.perf_counter() - t) * 1000)
+            if resp.status == 304 and entry:
+                METRICS.count('cache_revalidated')
+                cache.touch(url)
+                return json.loads(entry['body'].decode('utf-8'))
+            if resp.status >= 400:
+                raise HTTPError(url, resp.status, resp.reason, resp.headers.get('Retry-After'))
+            body = resp.body
+            data = json.loads(body.decode('utf-8'))
+            # เก็บเฉพาะ response ที่สมบูรณ์ — error payload ไม่ควรถูก cache แบบถาวร
+            # ผลงวดที่ยังประกาศไม่ครบ (ดึงระหว่างวันออกรางวัล) ได้อายุสั้นแทนการเก็บถาวร
+            if cache and isinstance(data, dict) and 'response' in data:
+                partial = ttl_for(url) is None and not is_final(data)
+                cache.put(url, body, resp.headers.get('ETag'), resp.headers.get('Last-Modified'), partial=partial)
+            return data
         except Exception as e:
-            if attempt < retries - 1:
-                time.sleep(1)
+            METRICS.count('request_errors')
+            if attempt < retries - 1 and is_retryable(e):
+                # 429/503 ที่บอก Retry-After มา → รอตามนั้น ไม่งั้น exponential backoff
+                delay = retry_after_delay(e)
+                if delay is not None and delay > RETRY_AFTER_MAX:
+                    raise e
+                METRICS.count('retries')
+                with METRICS.span('fetch.backoff'):
+                    time.sleep(backoff_delay(attempt) if delay is None else delay)
             else:
                 raise e
 
@@ -67,90 +197,563 @@ def parse_draw(data):
     }
 
 
-def main():
-    from datetime import datetime, timedelta
+# จำนวนเลขของงวดที่ประกาศครบ (เรียงตาม key ของ parse_draw)
+def incomplete_tiers(draw):
+    """รางวัลที่ยังออกไม่ครบ (จำนวนเลขไม่ครบ หรือยังเป็น placeholder '---')"""
+    return [t for t, n in EXPECTED.items()
+            if len(tier_numbers(draw, t)) < n or any(not x.isdigit() for x in tier_numbers(draw, t))]
 
-    today = datetime.now()
-    cutoff = (today - timedelta(days=YEARS_BACK * 365)).strftime('%Y-%m-%d')
 
-    print(f"🎰 Thai Lottery Static Data Generator")
-    print(f"   ย้อนหลัง {YEARS_BACK} ปี (ตั้งแต่ {cutoff})")
-    print(f"   Output: {os.path.abspath(OUTPUT)}")
-    print()
+def is_final(data):
+    """response ของ /lotto/{id} ที่ผลครบทุกรางวัลแล้ว (ไม่เปลี่ยนอีก) — งวดที่กำลังประกาศ = False"""
+    try:
+        draw = parse_draw(data)
+    except (KeyError, TypeError, ValueError):
+        return False
+    return draw is not None and not incomplete_tiers(draw)
 
-    # Step 1: Get all draw IDs
-    print("📋 ดึงรายชื่องวด...")
+
+def fetch_draw_list(api=API, stop_when=None, strict=False):
+    """ไล่ /list/{page} จนเจอหน้าว่าง → [{'id', 'date'}]
+
+    stop_when(page_items) — ถ้า return True จะหยุดหลังหน้านั้น (เช่น known_page ใน incremental/calendar mode)
+    strict=True: หน้าที่ดึงไม่สำเร็จ raise ต่อ แทนการหยุดแล้วคืนรายชื่อเท่าที่ได้
+    """
     all_ids = []
     page = 1
     while True:
         try:
-            data = api_get(f"{API}/list/{page}")
+            with METRICS.span('list.page'):
+                data = api_get(f"{api}/list/{page}")
             items = data.get('response', [])
             if not items:
                 break
-            for it in items:
-                iso = thai_to_iso(it['date'])
-                all_ids.append({'id': it['id'], 'date': iso})
+            page_ids = [{'id': it['id'], 'date': thai_to_iso(it['date'])} for it in items]
+            all_ids.extend(page_ids)
             print(f"   หน้า {page}: {len(items)} งวด")
+            if stop_when and stop_when(page_ids):
+                break
             page += 1
         except Exception as e:
             print(f"   หน้า {page} ล้มเหลว: {e}")
+            if strict:
+                raise
             break
+    return all_ids
 
-    print(f"   รวม: {len(all_ids)} งวด")
 
-    # Step 2: Filter by cutoff
-    recent = sorted([x for x in all_ids if x['date'] >= cutoff], key=lambda x: x['date'], reverse=True)
-    print(f"\n📅 งวดใน {YEARS_BACK} ปี: {len(recent)} งวด")
-    if recent:
-        print(f"   ตั้งแต่ {recent[-1]['date']} ถึง {recent[0]['date']}")
+def fetch_draws(items, api=API, workers=DEFAULT_WORKERS, rate=DEFAULT_RATE, journal=None, sink=None, exact=False):
+    """ดึงผลรางวัลของทุกงวดใน items ผ่าน thread pool (workers=1 = ทีละงวด)
 
-    # Step 3: Fetch each draw
-    print(f"\n📥 ดึงผลรางวัล...")
+    ผลลัพธ์เป็น Draw (draw_model.py) เรียงตามวันที่ใหม่ → เก่า ไม่ขึ้นกับลำดับที่แต่ละ request เสร็จ
+    จึงได้ไฟล์เหมือนกันทุก byte ไม่ว่าจะใช้กี่ worker
+    คืน (draws, failures) — failures = [{'id', 'date', 'error'}] เรียงตามลำดับใน items
+    ถ้าให้ journal มา ทุกงวดที่สำเร็จ/ล้มเหลวจะถูกบันทึกทันที
+    sink(draw) ถูกเรียกทันทีที่แต่ละงวดดึงเสร็จ (ลำดับตามที่เสร็จ — เช่น StaticDataWriter.add)
+    exact=True: งวดที่ได้ต้องเป็นวันเดียวกับ item['date'] ไม่งั้นถือว่าไม่พบ (ใช้กับ id ที่เดาจากปฏิทิน)
+    """
+    limiter = RateLimiter(rate)
+    total = len(items)
     draws = []
     failed = []
-    for i, item in enumerate(recent):
-        try:
-            data = api_get(f"{API}/lotto/{item['id']}")
+    done = 0
+
+    def fetch_one(item):
+        with METRICS.span('fetch.rate_wait'):
+            limiter.acquire()
+        with METRICS.span('fetch.draw'):
+            data = api_get(f"{api}/lotto/{item['id']}")
+        with METRICS.span('parse'):
             draw = parse_draw(data)
+            return draw and Draw.from_dict(draw)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(fetch_one, item): (i, item) for i, item in enumerate(items)}
+        for fut in as_completed(futures):
+            i, item = futures[fut]
+            done += 1
+            try:
+                draw, reason = fut.result(), 'parse failed'
+            except Exception as e:
+                draw, reason = None, f'error: {e}'
+            if draw and exact and draw.date != item['date']:
+                draw, reason = None, f'ได้งวด {draw.date} แทน {item["date"]}'
             if draw:
+                METRICS.count('draws_fetched')
                 draws.append(draw)
-                print(f"   [{i+1}/{len(recent)}] ✅ {draw['date']} รางวัลที่ 1: {draw['first']}")
+                if journal:
+                    journal.record_draw(item, draw)
+                if sink:
+                    with METRICS.span('serialize.add'):
+                        sink(draw)
+                print(f"   [{done}/{total}] ✅ {draw['date']} รางวัลที่ 1: {draw['first']}")
             else:
-                failed.append(item['id'])
-                print(f"   [{i+1}/{len(recent)}] ❌ {item['id']} parse failed")
-            time.sleep(0.1)  # rate limit
-        except Exception as e:
-            failed.append(item['id'])
-            print(f"   [{i+1}/{len(recent)}] ❌ {item['id']} error: {e}")
+                METRICS.count('calendar_misses' if exact else 'draws_failed')
+                failed.append((i, {'id': item['id'], 'date': item.get('date'), 'error': reason}))
+                if journal:
+                    journal.record_failure(item, reason)
+                print(f"   [{done}/{total}] ❌ {item['id']} {reason}")
+
+    draws.sort(key=lambda x: x.date, reverse=True)
+    return draws, [f for _, f in sorted(failed, key=lambda x: x[0])]
+
+
+def load_static_data(path):
+    """อ่าน LOTTERY_STATIC_DATA จากไฟล์ JS ที่ generate ไว้ → list ของ draw (ไม่มีไฟล์ = [])"""
+    if not os.path.exists(path):
+        return []
+    return list(iter_draws(path))
+
+
+def plan_incremental(existing, cutoff):
+    """แยกงวดเดิมเป็น (เก็บไว้, หมดอายุ)"""
+    kept = [d for d in existing if d['date'] >= cutoff]
+    expired = [d for d in existing if d['date'] < cutoff]
+    return kept, expired
+
 
-    draws.sort(key=lambda x: x['date'], reverse=True)
+def known_page(known, cutoff):
+    """stop_when สำหรับ fetch_draw_list: หยุดที่หน้าแรกที่ทุกงวดในช่วง cutoff อยู่ใน known แล้ว
+
+    /list เรียงใหม่ → เก่า (งวดที่หายไปตรงกลางจะถูกเจอเพราะหน้านั้นยังมีงวดที่ไม่รู้จัก)
+    known อ่านตอนเรียก — งวดที่เพิ่มเข้า set ภายหลัง (เช่นจากปฏิทิน) ก็นับด้วย
+    """
+    def stop_when(page_ids):
+        return all(it['date'] in known or it['date'] < cutoff for it in page_ids)
+    return stop_when
+
+
+def fetch_by_calendar(calendar, known, cutoff, api=API, journal=None, today=None, **opts):
+    """ขอ /lotto/{id} ของทุก slot ที่ยังไม่มี ตามวันที่ผู้สมัครจาก DrawCalendar
+    → (draws, จำนวน slot, จำนวน request, [วันของ slot ที่หาไม่เจอ])
+
+    รอบละหนึ่งวันที่ผู้สมัครต่อ slot — slot ที่ไม่เจอจะลองวันถัดไปในรอบต่อไป
+    slot ที่ลองครบทุกวันแล้วไม่เจอ = หาไม่เจอ (ผู้เรียกต้องไล่ /list) ยกเว้นวันที่ผู้สมัครคือวันนี้
+    (ผลอาจยังไม่ประกาศ — ไม่ใช่ข้อผิดพลาด)
+    """
+    from datetime import date
+
+    today = today or date.today()
+    known_slots = {nearest_slot(date.fromisoformat(d)) for d in known}
+    todo = {slot: cands for slot, cands in calendar.expected(date.fromisoformat(cutoff), today)
+            if slot not in known_slots}
+    slots, draws, probes, unresolved = len(todo), [], 0, []
+    while todo:
+        items = [{'id': draw_id(cands[0]), 'date': cands[0].isoformat(), 'slot': slot}
+                 for slot, cands in sorted(todo.items(), reverse=True)]
+        journaled = [to_draw(journal.draws[it['id']]) for it in items if journal and it['id'] in journal.draws]
+        pending = [it for it in items if not (journal and it['id'] in journal.draws)]
+        if journaled and opts.get('sink'):
+            for d in journaled:
+                opts['sink'](d)
+        got, _ = fetch_draws(pending, api, journal=journal, exact=True, **opts)
+        probes += len(pending)
+        draws += journaled + got
+        found = {d.date for d in journaled + got}
+
+        retry = {}
+        for it in items:
+            slot, cands = it['slot'], todo[it['slot']]
+            if it['date'] in found:
+                continue
+            if len(cands) > 1:
+                retry[slot] = cands[1:]
+            elif cands[0] < today:
+                unresolved.append(slot.isoformat())
+        todo = retry
+    return draws, slots, probes, sorted(unresolved)
+
+
+def write_failure_report(path, api, requested, fetched, failures):
+    """สรุปงวดที่ล้มเหลวเป็น JSON ให้ CI/script อื่นอ่านต่อได้"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    report = {
+        'generated': generated_time(),
+        'api': api,
+        'requested': requested,
+        'fetched': fetched,
+        'failed': failures,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def cutoff_date():
+    """วันแรกของช่วง YEARS_BACK ปีที่เก็บใน static data (YYYY-MM-DD)"""
+    from datetime import datetime, timedelta
 
-    # Step 4: Write JS
-    now = datetime.now().strftime('%Y-%m-%d %H:%M')
-    header = f"/** Static lottery data — {YEARS_BACK} years ({draws[-1]['date']} to {draws[0]['date']})\n"
-    header += f" * Generated: {now}\n"
-    header += f" * Total: {len(draws)} draws\n"
+    return (datetime.now() - timedelta(days=YEARS_BACK * 365)).strftime('%Y-%m-%d')
+
+
+def generated_time():
+    from datetime import datetime, timezone
+
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc).strftime('%Y-%m-%d %H:%M')
+    return datetime.now().strftime('%Y-%m-%d %H:%M')
+
+
+def render_header(newest, oldest, total):
+    header = f"/** Static lottery data — {YEARS_BACK} years ({oldest} to {newest})\n"
+    header += f" * Generated: {generated_time()}\n"
+    header += f" * Total: {total} draws\n"
     header += f" * Script: scripts/update_static_data.py\n */\n\n"
+    return header
+
+
+def render_js(draws, packed=False):
+    header = render_header(draws[0]['date'], draws[-1]['date'], len(draws))
+    if packed:
+        return packed_format.render_js(header, to_dicts(draws))
 
     js = header + "const LOTTERY_STATIC_DATA = "
-    js += json.dumps(draws, ensure_ascii=False, separators=(',', ':'))
+    js += json.dumps(to_dicts(draws), ensure_ascii=False, separators=(',', ':'))
     js += ";\n"
+    return js
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description='Generate lotteryStaticData.js จาก lotto API')
+    ap.add_argument('--api', default=API, help=f'API base URL (default: {API})')
+    ap.add_argument('--output', default=OUTPUT, help='ไฟล์ output')
+    ap.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                    help=f'จำนวนงวดที่ดึงพร้อมกัน (default: {DEFAULT_WORKERS}, 1 = serial)')
+    ap.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                    help=f'จำกัด request/วินาที รวมทุก worker (default: {DEFAULT_RATE:g}, 0 = ไม่จำกัด)')
+    ap.add_argument('--no-cache', action='store_true', help='ไม่อ่าน/เขียน HTTP response cache')
+    ap.add_argument('--cache-path', default=CACHE_PATH, help='ไฟล์ SQLite ของ HTTP cache')
+    ap.add_argument('--cache-max-mb', type=float, default=CACHE_MAX_BYTES / 1024 / 1024,
+                    help='ขนาดสูงสุดของ cache (MB) เกินแล้วลบรายการที่ไม่ได้ใช้นานที่สุด')
+    ap.add_argument('--resume', action='store_true',
+                    help='อ่าน fetch journal ของรอบก่อน แล้วดึงเฉพาะงวดที่ยังไม่สำเร็จ')
+    ap.add_argument('--journal', default=JOURNAL_PATH, help='ไฟล์ checkpoint (JSONL)')
+    ap.add_argument('--failure-report', default=FAILURE_REPORT, help='ไฟล์ JSON สรุปงวดที่ล้มเหลว')
+    ap.add_argument('--format', choices=['json', 'packed'], default='json',
+                    help='json = array ของ object (default, โหลดเร็วสุด), '
+                         'packed = columnar/bit-packed + JS decoder (ไฟล์เล็กลง ~2.8 เท่า แต่ parse ช้ากว่า ~5.5 vs ~3.8 ms)')
+    ap.add_argument('--incremental', action='store_true',
+                    help='อ่านไฟล์ output เดิม แล้วดึงเฉพาะงวดที่ขาด/ตัดงวดที่เกิน YEARS_BACK')
+    ap.add_argument('--discovery', choices=['calendar', 'list'], default='calendar',
+                    help='calendar = ขอ /lotto/{id} ตามวันที่คาดจากประวัติก่อน แล้วไล่ /list ถึง cutoff '
+                         'เพื่อเก็บงวดนอกปฏิทิน, list = ไล่ /list ทุกหน้า')
+    ap.add_argument('--archive', nargs='?', const=ARCHIVE_DIR, metavar='DIR',
+                    help=f'archive mode: ดึงทุกงวดที่ API มี แล้วเขียน shard รายปี (default: {ARCHIVE_DIR})')
+    ap.add_argument('--dataset', nargs='?', const=dataset_versions.DEFAULT_DIR, metavar='DIR',
+                    help=f'เพิ่มผลลัพธ์เป็น version ใหม่ + delta (default: {dataset_versions.DEFAULT_DIR})')
+    ap.add_argument('--snapshot', help='ไฟล์ analysis snapshot (default: lotteryAnalysisSnapshot.js ข้างไฟล์ output)')
+    ap.add_argument('--no-snapshot', action='store_true', help='ไม่สร้าง analysis snapshot')
+    ap.add_argument('--index', default=INDEX_PATH, help='ไฟล์ inverted index ของเลขที่ถูกรางวัล (JSON)')
+    ap.add_argument('--no-index', action='store_true', help='ไม่สร้าง inverted index')
+    ap.add_argument('--no-validate', action='store_true', help='ไม่ตรวจความถูกต้องของข้อมูล (draw_validator.py)')
+    ap.add_argument('--strict', action='store_true', help='ข้อมูลไม่ผ่านการตรวจ (มี error) = ไม่เขียนไฟล์, exit 1')
+    ap.add_argument('--metrics', default=METRICS_PATH, help='ไฟล์ JSON รายงานเวลา/latency/counter ของรอบนี้')
+    ap.add_argument('--no-metrics', action='store_true', help='ไม่เขียนรายงาน metric')
+    ap.add_argument('--prometheus', metavar='PATH', help='เขียนรายงาน metric เป็น Prometheus text format ด้วย')
+    ap.add_argument('--profile', metavar='PATH', help='เปิด cProfile (main thread) แล้วบันทึก .pstats')
+    ap.add_argument('--tracemalloc', action='store_true', help='วัด memory ด้วย tracemalloc (ช้าลง)')
+    return ap.parse_args(argv)
+
+
+def run_archive(args, api):
+    """--archive: ประวัติทั้งหมดแบ่งไฟล์ตามปี (lottery_archive.py) — ดึงเฉพาะงวดที่ยังไม่มีใน archive เดิม"""
+    path = args.archive
+    print(f"🎰 Thai Lottery Archive")
+    print(f"   Output: {os.path.abspath(path)}/")
+    print()
 
-    with open(OUTPUT, 'w', encoding='utf-8') as f:
-        f.write(js)
+    known = {}
+    if os.path.exists(os.path.join(path, 'manifest.json')):
+        archive = Archive(path)
+        for year in archive.years():
+            try:
+                known.update((d['date'], d) for d in archive.load_year(year))
+            except ValueError as e:
+                print(f"   ⚠️ {e} — ดึงปี {year} ใหม่")
+        print(f"♻️  Archive เดิม: {len(known)} งวด ({len(archive.years())} ปี)")
+        print()
 
-    size_kb = os.path.getsize(OUTPUT) / 1024
+    # รายชื่อต้องครบทุกหน้า — ถ้าขาดหน้าไป งวดที่ไม่อยู่ในรายชื่อไม่ได้แปลว่าถูกลบจาก API
+    print("📋 ดึงรายชื่องวด...")
+    try:
+        with METRICS.span('phase.list'):
+            all_ids = fetch_draw_list(api, strict=True)
+    except Exception:
+        print("\n❌ ดึงรายชื่องวดไม่ครบ — ไม่เขียน archive (รันใหม่ภายหลัง)")
+        sys.exit(1)
+    print(f"   รวม: {len(all_ids)} งวด")
+    kept = list(known.values())  # งวดที่มีใน archive แล้วเก็บไว้เสมอ
+    pending = sorted([x for x in all_ids if x['date'] not in known], key=lambda x: x['date'], reverse=True)
+
+    journal = FetchJournal(args.journal, resume=args.resume, api=api, archive=os.path.abspath(path))
+    journaled = [journal.draws[x['id']] for x in pending if x['id'] in journal.draws]
+    pending = [x for x in pending if x['id'] not in journal.draws]
+    print(f"\n📥 ดึงผลรางวัล {len(pending)} งวด ({args.workers} workers, ≤{args.rate:g} req/s)"
+          f"{f' — มีใน journal แล้ว {len(journaled)} งวด' if journaled else ''}")
+    with METRICS.span('phase.fetch'):
+        draws, failures = fetch_draws(pending, api, workers=args.workers, rate=args.rate, journal=journal)
+    write_failure_report(args.failure_report, api, len(pending), len(pending) - len(failures), failures)
 
+    draws = kept + journaled + draws
+    if not draws:
+        print("\n❌ ไม่มีข้อมูลงวดใดเลย — ไม่เขียน archive")
+        sys.exit(1)
+    with METRICS.span('phase.write'):
+        manifest, written = write_archive(to_dicts(draws), path, api=api)
+    journal.finish(len(draws), len(failures))
+    journal.close()
+
+    shards = manifest['shards']
     print(f"\n{'='*50}")
     print(f"✅ สำเร็จ!")
-    print(f"   ไฟล์: {os.path.abspath(OUTPUT)}")
+    print(f"   Archive: {os.path.abspath(path)}/ ({len(shards)} ปี, {shards[0]['year']}–{shards[-1]['year']})")
+    print(f"   จำนวน: {manifest['draws']} งวด, {sum(s['bytes'] for s in shards) / 1024:.0f} KB")
+    print(f"   เขียนใหม่: {written} shard (ที่เหลือไม่เปลี่ยน)")
+    if failures:
+        print(f"   ⚠️ ล้มเหลว: {len(failures)} งวด — รันใหม่ด้วย --archive --resume")
+
+
+def run_generate(args, api):
+    """โหมดปกติ: static data ย้อนหลัง YEARS_BACK ปี + dataset / snapshot / index"""
+    output = args.output
+    cutoff = cutoff_date()
+
+    print(f"🎰 Thai Lottery Static Data Generator")
+    print(f"   ย้อนหลัง {YEARS_BACK} ปี (ตั้งแต่ {cutoff})")
+    print(f"   Output: {os.path.abspath(output)}")
+    print()
+
+    kept, expired = [], []
+    if args.incremental:
+        kept, expired = plan_incremental(load_static_data(output), cutoff)
+        print(f"♻️  Incremental: มีอยู่แล้ว {len(kept)} งวด, หมดอายุ {len(expired)} งวด")
+        print()
+
+    # Step 1: ขอผลตามปฏิทิน (draw_calendar.py) — งวดที่รู้วันแล้วได้ id ตรง ๆ ไม่ต้องไล่ /list
+    calendar = None
+    if args.discovery == 'calendar':
+        history = kept if args.incremental else load_static_data(output if os.path.exists(output) else OUTPUT)
+        calendar = DrawCalendar(d['date'] for d in history)
+        if not calendar.observed:
+            calendar = None  # ไม่มีประวัติให้เรียน → ไล่ /list
+
+    journal = FetchJournal(args.journal, resume=args.resume, api=api, cutoff=cutoff, output=os.path.abspath(output))
+    known = {d['date'] for d in kept}
+    draws, failures, requested = [], [], 0
+    started = time.monotonic()
+    # json: เขียนแต่ละงวดลงไฟล์ทันทีที่ได้ (StaticDataWriter เรียงให้เอง) — packed ต้อง encode ทั้งชุดทีเดียว
+    writer = None if args.format == 'packed' else StaticDataWriter(output, render_header)
+    fetch_opts = {'workers': args.workers, 'rate': args.rate, 'sink': writer.add if writer else None}
+    try:
+        if writer:
+            for d in kept:
+                writer.add(d)
+        if calendar:
+            print(f"📅 ขอผลตามปฏิทิน... ({args.workers} workers, ≤{args.rate:g} req/s)")
+            with METRICS.span('phase.calendar'):
+                got, slots, probes, unresolved = fetch_by_calendar(calendar, known, cutoff, api, journal, **fetch_opts)
+            draws += got
+            known |= {d['date'] for d in got}
+            requested += slots
+            print(f"   ได้ {len(got)}/{slots} งวดจาก {probes} request"
+                  f"{f' — หาไม่เจอ {len(unresolved)} งวด ({unresolved[0]} ...)' if unresolved else ''}")
+
+        # Step 2: ไล่ /list จนเจอหน้าที่ทุกงวดรู้จักแล้ว (รวมที่ปฏิทินเพิ่งได้มา) — ปกติแค่หน้าแรก
+        # แต่ยังเจองวดพิเศษ/นอกรอบ/สองงวดใน slot เดียวที่ปฏิทินไม่รู้จัก; โหมด list แบบเต็มไล่ทุกหน้า
+        list_stop = known_page(known, cutoff) if args.incremental or calendar else None
+        print("\n📋 ดึงรายชื่องวด...")
+        with METRICS.span('phase.list'):
+            all_ids = fetch_draw_list(api, stop_when=list_stop)
+        print(f"   รวม: {len(all_ids)} งวด")
+        recent = sorted([x for x in all_ids if x['date'] >= cutoff and x['date'] not in known],
+                        key=lambda x: x['date'], reverse=True)
+        if calendar and recent:
+            METRICS.count('calendar_unlisted', len(recent))
+            print(f"   ⚠️ งวดที่ปฏิทินไม่ได้คาดไว้: {', '.join(x['date'] for x in recent[:5])}"
+                  f"{' ...' if len(recent) > 5 else ''}")
+        print(f"\n📅 งวดใน {YEARS_BACK} ปีที่ต้องดึง: {len(recent)} งวด")
+        if recent:
+            print(f"   ตั้งแต่ {recent[-1]['date']} ถึง {recent[0]['date']}")
+
+        # ข้ามงวดที่ journal ของรอบก่อนมีแล้วถ้า --resume
+        journaled = [to_draw(journal.draws[x['id']]) for x in recent if x['id'] in journal.draws]
+        pending = [x for x in recent if x['id'] not in journal.draws]
+        if args.resume:
+            print(f"\n⏯️  Resume: มีใน journal แล้ว {len(journaled)} งวด, เหลือ {len(pending)} งวด")
+        if writer:
+            for d in journaled:
+                writer.add(d)
+        print(f"\n📥 ดึงผลรางวัล... ({args.workers} workers, ≤{args.rate:g} req/s)")
+        with METRICS.span('phase.fetch'):
+            got, failures = fetch_draws(pending, api, journal=journal, **fetch_opts)
+        draws += journaled + got
+        requested += len(recent)
+    except BaseException:
+        if writer:
+            writer.abort()
+        raise
+    print(f"   ใช้เวลา {time.monotonic() - started:.1f} วินาที")
+
+    if args.incremental and not draws and not expired and not failures:
+        if writer:
+            writer.abort()
+        journal.close()
+        print("\n✅ ข้อมูลล่าสุดแล้ว — ไม่ต้องเขียนไฟล์ใหม่")
+        return
+
+    failed = [f['id'] for f in failures]
+    draws = sorted([to_draw(d) for d in kept] + draws, key=lambda x: x.date, reverse=True)
+
+    write_failure_report(args.failure_report, api, requested, requested - len(failures), failures)
+
+    if not draws:
+        if writer:
+            writer.abort()
+        print("\n❌ ไม่มีข้อมูลงวดใดเลย — ไม่เขียนไฟล์")
+        sys.exit(1)
+
+    # Step 3: ตรวจข้อมูลทั้งชุด (draw_validator.py) — วันที่ซ้ำเหลือชุดเดียว, --strict: มี error = ไม่เขียนไฟล์
+    validation = None
+    if not args.no_validate:
+        try:
+            import draw_validator
+        except ImportError as e:
+            print(f"\n⚠️ ข้ามการตรวจข้อมูล ({e}) — pip install numpy")
+        else:
+            with METRICS.span('phase.validate'):
+                draws, dropped = draw_validator.dedupe(draws)
+                validation = draw_validator.validate(draws)
+            print("\n🔎 ตรวจข้อมูล...")
+            draw_validator.print_report(validation, limit=10)
+            if dropped:
+                print(f"   ตัดงวดวันที่ซ้ำ {len(dropped)} ชุด ({', '.join(d.date for d in dropped)})")
+                if writer:
+                    # writer ได้รับทุกชุดไปแล้ว → เริ่มใหม่จากชุดที่เหลือ
+                    writer.abort()
+                    writer = StaticDataWriter(output, render_header)
+                    for d in draws:
+                        writer.add(d)
+            if args.strict and not validation.ok:
+                if writer:
+                    writer.abort()
+                journal.close()
+                print("\n❌ ข้อมูลไม่ผ่านการตรวจ (--strict) — ไม่เขียนไฟล์")
+                sys.exit(1)
+
+    # Step 4: Write JS (แทนไฟล์เดิมด้วย os.replace เมื่อเขียนครบแล้วเท่านั้น)
+    with METRICS.span('phase.write'):
+        if writer:
+            writer.close()
+        else:
+            js = render_js(draws, packed=True)
+            with open(output + '.tmp', 'w', encoding='utf-8') as f:
+                f.write(js)
+            os.replace(output + '.tmp', output)
+    journal.finish(len(draws), len(failed))
+    journal.close()
+
+    # Step 4.5: Versioned dataset + delta จาก version ก่อนหน้า (dataset_versions.py)
+    dataset = None
+    if args.dataset:
+        with METRICS.span('phase.dataset'):
+            dataset, created = dataset_versions.publish(draws, args.dataset)
+
+    # Step 5: Analysis snapshot (ต้องตรงกับ static data ชุดนี้เสมอ)
+    snapshot_path = None
+    if not args.no_snapshot:
+        try:
+            import analysis_snapshot
+        except ImportError as e:
+            print(f"\n⚠️ ข้าม analysis snapshot ({e}) — pip install numpy แล้วรัน scripts/analysis_snapshot.py")
+        else:
+            snapshot_path = args.snapshot or os.path.join(os.path.dirname(os.path.abspath(output)),
+                                                          'lotteryAnalysisSnapshot.js')
+            with METRICS.span('phase.snapshot'):
+                analysis_snapshot.write_snapshot(draws, snapshot_path)
+
+    # Step 6: Inverted index สำหรับตรวจสลาก (number_index.py)
+    index_stats = None
+    if not args.no_index:
+        with METRICS.span('phase.index'):
+            index = NumberIndex.build(draws)
+            index.save(args.index)
+            index_stats = index.stats()
+
+    size_kb = os.path.getsize(output) / 1024
+
+    print(f"\n{'='*50}")
+    print(f"✅ สำเร็จ!")
+    print(f"   ไฟล์: {os.path.abspath(output)}")
     print(f"   ขนาด: {size_kb:.1f} KB")
     print(f"   จำนวน: {len(draws)} งวด")
+    if snapshot_path:
+        print(f"   Snapshot: {os.path.abspath(snapshot_path)} ({os.path.getsize(snapshot_path) / 1024:.1f} KB)")
+    if dataset:
+        sizes = ', '.join(f"{d['bytes']:,} B" for d in dataset['deltas'][-3:]) or '-'
+        print(f"   Dataset: version {dataset['latest']}{'' if created else ' (ไม่เปลี่ยน)'}, "
+              f"delta {len(dataset['deltas'])} ไฟล์ ({sizes})")
+    if validation and validation.issues:
+        print(f"   ตรวจข้อมูล: error {len(validation.errors)}, warning {len(validation.warnings)}")
+    if index_stats:
+        print(f"   Index: {os.path.abspath(args.index)} ({index_stats['postings']:,} postings, "
+              f"{os.path.getsize(args.index) / 1024:.0f} KB)")
+    if args.format == 'packed':
+        packed_format.verify(to_dicts(draws))
+        packed_format.print_report(packed_format.compare(render_js(draws), js))
     if failed:
         print(f"   ⚠️ ล้มเหลว: {len(failed)} งวด ({', '.join(failed)})")
+        print(f"      รายละเอียด: {os.path.abspath(args.failure_report)} — รันใหม่ด้วย --resume เพื่อดึงเฉพาะงวดที่ขาด")
+    net = HTTP_CLIENT.stats
+    print(f"   HTTP: {net['requests']} requests, {net['connections']} connections, "
+          f"รับ {net['bytes_wire'] / 1024:.0f} KB (คลายแล้ว {net['bytes_body'] / 1024:.0f} KB)")
+    if HTTP_CACHE:
+        st = HTTP_CACHE.stats()
+        print(f"   Cache: hit {st['hits']}, 304 {st['revalidated']}, ดึงใหม่ {st['misses']} "
+              f"({st['entries']} รายการ, {st['bytes'] / 1024:.0f} KB)")
     print(f"\n💡 อย่าลืม bump version ใน manifest.json และ popup.html ด้วย!")
 
 
+def write_metrics(args, status):
+    """รายงาน metric ของรอบนี้ (เขียนแม้รอบนั้นล้มเหลว — status บอกผล)"""
+    extra = {'args': {k: v for k, v in vars(args).items() if k in ('api', 'workers', 'rate', 'format', 'discovery',
+                                                                    'incremental', 'resume', 'archive')},
+             'http': dict(HTTP_CLIENT.stats)}
+    if HTTP_CACHE:
+        extra['cache'] = HTTP_CACHE.stats()
+    report = METRICS.report(status, extra, profile_path=args.profile)
+    if not args.no_metrics:
+        write_json(report, args.metrics)
+    if args.prometheus:
+        write_prometheus(report, args.prometheus)
+    if status == 'ok':
+        print(f"\n⏱️  {summary_line(report)}")
+        if not args.no_metrics:
+            print(f"   Metrics: {os.path.abspath(args.metrics)} (ดูด้วย scripts/run_metrics.py)")
+        if args.profile:
+            print(f"   Profile: {os.path.abspath(args.profile)} (python3 -m pstats)")
+        if 'memory' in report:
+            print(f"   Memory: peak {report['memory']['peak_bytes'] / 1024 / 1024:.1f} MB")
+
+
+def main(argv=None):
+    global HTTP_CACHE
+
+    args = parse_args(argv)
+    api = args.api.rstrip('/')
+    if not args.no_cache:
+        HTTP_CACHE = ResponseCache(args.cache_path, int(args.cache_max_mb * 1024 * 1024))
+    METRICS.start(profile=bool(args.profile), trace=args.tracemalloc)
+    status = 'failed'
+    try:
+        if args.archive:
+            run_archive(args, api)
+        else:
+            run_generate(args, api)
+        status = 'ok'
+    finally:
+        write_metrics(args, status)
+
+
 if __name__ == '__main__':
     main()